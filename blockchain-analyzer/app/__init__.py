@@ -1,5 +1,6 @@
 from flask import Flask
 from flask_cors import CORS
+import os
 
 def create_app():
     app = Flask(__name__)
@@ -15,6 +16,18 @@ def create_app():
     # Register the blueprint
     app.register_blueprint(bp, url_prefix="/api")
     
+    # Anomali modellerini başlangıçta arka planda belleğe al
+    if os.getenv("PRELOAD_MODELS", "true").lower() == "true":
+        from app.routes import model_registry
+        model_registry.preload()
+    
+    # Elliptic veri setini başlangıçta arka planda belleğe al (isteğe bağlı)
+    if os.getenv("PRELOAD_ELLIPTIC", "false").lower() == "true":
+        from app.routes import ELLIPTIC_DATA_DIR
+        from app.services.dataset_service import get_elliptic_service
+        if os.path.isdir(ELLIPTIC_DATA_DIR):
+            get_elliptic_service(ELLIPTIC_DATA_DIR).preload()
+    
     @app.route('/')
     def index():
         return "Blockchain Analyzer API"
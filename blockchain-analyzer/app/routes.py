@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify, send_from_directory
 from app.utils.etherscan_api import get_transactions
+from app.utils.etherscan_client import get_etherscan_client
+from app.utils.tx_io import find_raw_transactions
 from app.services.analyzer import analyze_transactions
 from app.services.graph_analysis import (
     load_graph_from_json,
@@ -10,13 +12,23 @@ from app.services.graph_analysis import (
     find_critical_paths,
     create_graph_from_transactions,
     create_graph_from_elliptic,
-    detect_communities
+    csr_graph_stats,
+    detect_communities,
+    extract_neighborhood,
+    NEIGHBORHOOD_HOPS,
+    NEIGHBORHOOD_MAX_NODES
 )
+from app.services.csr_graph import build_elliptic_graph, class_distribution
 from app.services.token_analyzer import TokenAnalyzer
-from app.services.ml_anomaly import MLAnomalyDetector
-from app.services.dataset_loader import EllipticDatasetLoader
+from app.services.ml_anomaly import get_ml_detector, extract_address_features
+from app.services.dataset_service import get_elliptic_dataset
+from app.services.feature_store import FeatureStore
+from app.services.graph_store import default_graph_store, json_ready
+from app.services.temporal import DEFAULT_RESOLUTION, TemporalIndex, bin_width, cached_index
+from app.services.model_registry import ModelRegistry
+from app.services.propagation import DEFAULT_PROPAGATION_METHOD, PROPAGATION_METHODS, illicit_ranking, ranking_page
 import os
-import joblib
+from functools import partial
 import numpy as np
 import pandas as pd
 import json
@@ -73,7 +85,7 @@ bp.json_encoder = NumpyJSONEncoder
 token_analyzer = TokenAnalyzer()
 
 # Model dizini
-MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'models')
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
 
 # Elliptic dataset path
 ELLIPTIC_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'blockchain-analyzer', 'elliptic_bitcoin_dataset')
@@ -85,18 +97,113 @@ ANOMALY_MODELS = {
     'lof': 'localoutlierfactor_anomaly.joblib'
 }
 
+# Modeller bir kez yüklenir, bellekten sunulur; dosya değişince otomatik yenilenir
+model_registry = ModelRegistry(MODEL_DIR, ANOMALY_MODELS)
+
 def load_model(algo_name):
-    models_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
-    model_paths = {
-        'isoforest': os.path.join(models_dir, 'isolationforest_anomaly.joblib'),
-        'ocsvm': os.path.join(models_dir, 'oneclasssvm_anomaly.joblib'),
-        'lof': os.path.join(models_dir, 'localoutlierfactor_anomaly.joblib')
-    }
-    
-    if algo_name not in model_paths:
-        raise ValueError(f"Bilinmeyen algoritma: {algo_name}")
-    
-    return joblib.load(model_paths[algo_name])
+    return model_registry.get(algo_name)
+
+# Sayfalı anomali listelerinde sayfa başına en fazla kayıt
+MAX_PAGE_SIZE = 100
+
+# Komşuluk isteklerinde izin verilen üst sınırlar
+MAX_NEIGHBORHOOD_HOPS = 10
+MAX_NEIGHBORHOOD_NODES = 5000
+
+# Graf istatistikleri yalnızca bu parametrelerle kalıcı olarak saklanır; pivot
+# sayısı, saniye cinsinden çözünürlük ve blok aralığı her istekte saklanmadan
+# hesaplanır (istek parametrelerinden türeyen anahtarlar önbelleği büyütmesin)
+PERSISTED_BETWEENNESS_K = ('auto', None)
+PERSISTED_RESOLUTIONS = ('hour', 'day', 'week')
+
+def complete_betweenness(stats):
+    """Betweenness tam hesaplandıysa True; örneklemeli ya da kesik sonuçlar diske yazılmaz"""
+    return stats["betweenness_pivots"] is None
+
+def complete_paths(result):
+    """Kritik yol araması süre sınırında kesilmediyse True"""
+    return not result[1]
+
+def neighborhood_args(args):
+    """hops, direction ve max_nodes sorgu parametrelerini doğrula (geçersizse ValueError)"""
+    hops = args.get("hops", str(NEIGHBORHOOD_HOPS))
+    max_nodes = args.get("max_nodes", str(NEIGHBORHOOD_MAX_NODES))
+    direction = args.get("direction", "both").lower()
+    if not hops.isdigit() or int(hops) > MAX_NEIGHBORHOOD_HOPS:
+        raise ValueError(f"Geçersiz hops: {hops} (0-{MAX_NEIGHBORHOOD_HOPS})")
+    if not max_nodes.isdigit() or not 1 <= int(max_nodes) <= MAX_NEIGHBORHOOD_NODES:
+        raise ValueError(f"Geçersiz max_nodes: {max_nodes} (1-{MAX_NEIGHBORHOOD_NODES})")
+    if direction not in ("in", "out", "both"):
+        raise ValueError(f"Geçersiz yön: {direction} (in, out, both)")
+    return {"hops": int(hops), "direction": direction, "max_nodes": int(max_nodes)}
+
+def raw_graph_snapshot(filepath, fingerprint):
+    """Ham işlem dosyasının graf anlık görüntüsü (parmak izi başına bir kez oluşturulur)"""
+    return default_graph_store.get("raw_data", fingerprint, lambda: load_graph_from_json(filepath))
+
+def raw_graph_stat(filepath, fingerprint, name, compute, persist=True):
+    """Ham veri grafı üzerinden compute(G) ile hesaplanan ve parmak izi başına saklanan istatistik"""
+    return default_graph_store.stat(
+        "raw_data", fingerprint, name,
+        lambda: compute(raw_graph_snapshot(filepath, fingerprint).graph()), persist=persist)
+
+def raw_temporal_patterns(filepath, fingerprint, resolution=DEFAULT_RESOLUTION, block_range=None):
+    """İşlem düzeyinde zamansal analiz; indeks parmak izi başına bir kez oluşturulur"""
+    index = cached_index(fingerprint, lambda: TemporalIndex.from_file(filepath))
+    return analyze_temporal_patterns(index, resolution=resolution, block_range=block_range)
+
+def dataset_csr_graph(dataset_type):
+    """Veri setinin tamamı için paylaşılan CSRGraph (elliptic: txId, raw_data: adres düğümleri)"""
+    if dataset_type == "elliptic":
+        return get_elliptic_dataset(ELLIPTIC_DATA_DIR).derived('csr_graph', build_elliptic_graph)
+    filepath = find_raw_transactions("data")
+    if not os.path.exists(filepath):
+        raise FileNotFoundError("Veri dosyası bulunamadı")
+    fingerprint = FeatureStore.fingerprint(filepath)
+    return raw_graph_snapshot(filepath, fingerprint).to_csr()
+
+def node_neighborhood(dataset_type, node_id, options):
+    """Düğüm komşuluğu; ham verideki adresler küçük harfe çevrilir"""
+    if dataset_type == "raw_data":
+        node_id = node_id.lower()
+    try:
+        return extract_neighborhood(dataset_csr_graph(dataset_type), node_id, **options)
+    except KeyError:
+        raise LookupError(f"Düğüm bulunamadı: {node_id}")
+
+def propagation_anomalies(dataset, method, page, page_size):
+    """
+    Elliptic'te illicit akış yayılımına göre sıralanan bilinmeyen işlemlerin
+    bir sayfası; sıralama veri seti sürümü ve yöntem başına bir kez hesaplanır.
+
+    Returns:
+        (anomalies, pagination, propagation)
+    """
+    graph = dataset.derived('csr_graph', build_elliptic_graph)
+    ranking = dataset.derived(f'illicit_ranking_{method}', lambda ds: illicit_ranking(graph, method))
+    nodes, scores, relative_scores = ranking_page(ranking, page, page_size)
+    rows = dataset.features.iloc[nodes]
+
+    anomalies = []
+    for rank, (node, score, relative, (_, row)) in enumerate(
+            zip(nodes.tolist(), scores.tolist(), relative_scores.tolist(), rows.iterrows()),
+            start=(page - 1) * page_size + 1):
+        # Bağlantılı işlemler (CSR komşuluğundan; önce çıkan, sonra giren kenarlar)
+        neighbors = np.concatenate((graph.successors(node), graph.predecessors(node)))[:5]
+        anomalies.append({
+            "from": str(graph.node_ids[node]),  # Ensure txId is a string
+            "anomaly_score": float(relative),  # En yüksek skora göre 0-100
+            "propagation_score": float(score),
+            "rank": rank,
+            # Sıralamanın en üstteki ANOMALY_FRACTION'lık kısmı (skoru pozitif olanlar)
+            "is_anomaly": rank <= ranking["anomaly_count"],
+            "connected_transactions": [str(txid) for txid in graph.node_ids[neighbors].tolist()],
+            "features": convert_numpy_types({str(col): value for col, value in row[dataset.feature_columns].items()})
+        })
+
+    pagination = {"page": page, "page_size": page_size, "total": len(ranking["order"])}
+    propagation = {key: ranking[key] for key in ("method", "iterations", "seed_count", "anomaly_count")}
+    return anomalies, pagination, propagation
 
 # 🧪 Cüzdan bazlı canlı analiz
 @bp.route("/analyze", methods=["POST"])
@@ -112,13 +219,10 @@ def analyze():
         
         # ML analizini dahil et
         if include_ml:
-            detector = MLAnomalyDetector()
-            
             try:
-                # Model tahmini yapmak için gerekli özellikleri oluştur
-                df = pd.DataFrame(transactions)
-                if not df.empty:
-                    features = detector.extract_features_for_address(address, df)
+                # Model tahmini yapmak için gerekli özellikleri oluştur (yalnızca bu adresin işlemleri)
+                if transactions:
+                    features = extract_address_features(address, transactions)
                     
                     # Modeli yükle ve anomali skoru hesapla
                     model = load_model(ml_algorithm)
@@ -191,6 +295,14 @@ def token_analysis():
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 400
 
+# ⏱️ Etherscan çağrı sayaçları (gecikme, yeniden deneme, hız sınırı)
+@bp.route("/etherscan-stats", methods=["GET"])
+def etherscan_stats():
+    return jsonify({
+        "status": "success",
+        "stats": get_etherscan_client().stats()
+    })
+
 # 📊 Kayıtlı verilerle işlem ağı analizi
 @bp.route("/graph-analysis", methods=["GET"])
 def graph_analysis():
@@ -215,34 +327,41 @@ def graph_analysis():
         }
         return jsonify({"status": "success", "data": available_datasets})
     
+    # node verilirse (txId veya adres) yanıta k-adımlı komşuluğu eklenir
+    node_id = request.args.get("node")
+    try:
+        neighborhood_options = neighborhood_args(request.args)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     # If dataset_type is specified and load_data is true, proceed with loading the data
     if dataset_type == "elliptic":
         # Elliptic dataset kullan
         try:
-            # Elliptic dataset'i loadera yükle
-            loader = EllipticDatasetLoader(data_dir=ELLIPTIC_DATA_DIR)
+            # Paylaşılan (önbellekteki) Elliptic veri setini al
+            dataset = get_elliptic_dataset(ELLIPTIC_DATA_DIR)
             
             # İşlem ağını oluştur
             try:
-                # Veri setini yükle
-                features, edges, classes = loader.load_data()
-                print(f"Veri seti başarıyla yüklendi. {len(features)} adet işlem, {len(edges)} adet kenar var.")
+                # Tüm veri seti için CSR graf (veri seti sürümü başına bir kez oluşturulur)
+                graph = dataset.derived('csr_graph', build_elliptic_graph)
+                print(f"Graf hazır. {graph.n_nodes} adet işlem, {graph.n_edges} adet kenar var.")
                 
-                # Graf oluştur
-                G = create_graph_from_elliptic(loader, max_nodes=200)
-                
-                # Temel istatistikleri hesapla
-                response = basic_graph_stats(G)
+                # Temel istatistikleri hesapla (sürüm başına önbelleklenir)
+                response = dict(dataset.derived('csr_graph_stats', lambda ds: default_graph_store.stat(
+                    "elliptic", ds.version, "csr_graph_stats", lambda: csr_graph_stats(graph),
+                    persist=complete_betweenness)))
                 response["dataset_type"] = "elliptic"
                 
                 # Sınıf dağılımını ekle
-                response["class_distribution"] = {
-                    "illicit": sum(1 for _, attrs in G.nodes(data=True) if attrs.get('is_illicit', False)),
-                    "licit": sum(1 for _, attrs in G.nodes(data=True) if attrs.get('is_licit', False)),
-                    "unknown": sum(1 for _, attrs in G.nodes(data=True) if attrs.get('is_unknown', False))
-                }
+                response["class_distribution"] = class_distribution(graph)
+
+                if node_id:
+                    response["neighborhood"] = node_neighborhood("elliptic", node_id, neighborhood_options)
                 
                 return jsonify({"status": "success", "graph": response})
+            except LookupError as e:
+                return jsonify({"status": "error", "message": str(e)}), 404
             except Exception as graph_error:
                 print(f"Graf oluşturulurken hata: {graph_error}")
                 return jsonify({"status": "error", "message": f"Graf oluşturulurken hata: {str(graph_error)}"}), 500
@@ -251,24 +370,94 @@ def graph_analysis():
             return jsonify({"status": "error", "message": f"Elliptic veri seti işlenirken hata: {str(e)}"}), 500
     elif dataset_type == "raw_data":
         # Raw transaction data kullan (orijinal implementasyon)
-        filepath = "data/raw_transactions.json"
+        filepath = find_raw_transactions("data")
         if not os.path.exists(filepath):
             return jsonify({"status": "error", "message": "Veri dosyası bulunamadı"}), 404
 
+        # Betweenness kalite/süre ayarı: auto (varsayılan), exact veya pivot sayısı
+        betweenness_k = request.args.get("betweenness_k", "auto").lower()
+        if betweenness_k == "exact":
+            betweenness_k = None
+        elif betweenness_k != "auto":
+            if not betweenness_k.isdigit() or int(betweenness_k) == 0:
+                return jsonify({"status": "error", "message": "Geçersiz betweenness_k: " + betweenness_k}), 400
+            betweenness_k = int(betweenness_k)
+
+        # Zaman dilimleri: hour, day (varsayılan), week ya da saniye; block_range ile blok aralıkları
+        temporal_resolution = request.args.get("temporal_resolution", DEFAULT_RESOLUTION).lower()
+        block_range = request.args.get("block_range")
+        try:
+            bin_width(temporal_resolution)
+            block_range = int(block_range) if block_range else None
+            if block_range is not None and block_range <= 0:
+                raise ValueError(f"Geçersiz blok aralığı: {block_range}")
+        except ValueError as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
+
         try:
-            G = load_graph_from_json(filepath)
-            response = basic_graph_stats(G)
+            # Graf ve istatistikleri dosyanın parmak izi başına bir kez oluşturulup saklanır
+            fingerprint = FeatureStore.fingerprint(filepath)
+            if betweenness_k in PERSISTED_BETWEENNESS_K:
+                stats_name = "graph_stats_" + ("auto" if betweenness_k == "auto" else "exact")
+                response = dict(raw_graph_stat(
+                    filepath, fingerprint, stats_name,
+                    partial(basic_graph_stats, betweenness_k=betweenness_k, version=fingerprint),
+                    persist=complete_betweenness))
+            else:
+                response = json_ready(basic_graph_stats(
+                    raw_graph_snapshot(filepath, fingerprint).graph(), betweenness_k=betweenness_k, version=fingerprint))
             response["dataset_type"] = "raw_data"
-            response["isolated_nodes"] = detect_isolated_nodes(G)[:5]
-            response["heavy_senders"] = detect_heavy_senders(G, threshold=500)
-            response["temporal_patterns"] = analyze_temporal_patterns(G)
-            response["critical_paths"] = find_critical_paths(G)
+            response["isolated_nodes"] = raw_graph_stat(filepath, fingerprint, "isolated_nodes", detect_isolated_nodes)[:5]
+            response["heavy_senders"] = raw_graph_stat(
+                filepath, fingerprint, "heavy_senders_500", partial(detect_heavy_senders, threshold=500))
+            # Zamansal analiz graf kenarları yerine işlem düzeyinde, tek bir kümülatif indeksten yapılır
+            try:
+                if temporal_resolution in PERSISTED_RESOLUTIONS and block_range is None:
+                    response["temporal_patterns"] = default_graph_store.stat(
+                        "raw_data", fingerprint, f"temporal_patterns_{temporal_resolution}",
+                        partial(raw_temporal_patterns, filepath, fingerprint, temporal_resolution))
+                else:
+                    response["temporal_patterns"] = json_ready(
+                        raw_temporal_patterns(filepath, fingerprint, temporal_resolution, block_range))
+            except ValueError as e:
+                # Çözünürlük veriye göre çok fazla dilim üretiyor ya da blok aralığı kullanılamıyor
+                return jsonify({"status": "error", "message": str(e)}), 400
+            response["critical_paths"], response["critical_paths_truncated"] = raw_graph_stat(
+                filepath, fingerprint, "critical_paths", find_critical_paths, persist=complete_paths)
+            if node_id:
+                response["neighborhood"] = node_neighborhood("raw_data", node_id, neighborhood_options)
             return jsonify({"status": "success", "graph": response})
+        except LookupError as e:
+            return jsonify({"status": "error", "message": str(e)}), 404
         except Exception as e:
             return jsonify({"status": "error", "message": str(e)}), 500
     else:
         return jsonify({"status": "error", "message": "Geçersiz veri seti tipi: " + dataset_type}), 400
 
+# 🕸️ Bir işlem (txId) veya adres etrafındaki k-adımlı komşuluk
+@bp.route("/neighborhood", methods=["GET"])
+def neighborhood():
+    dataset_type = request.args.get("dataset_type", "")
+    node_id = request.args.get("node")
+    if dataset_type not in ("elliptic", "raw_data"):
+        return jsonify({"status": "error", "message": "Geçersiz veri seti tipi: " + dataset_type}), 400
+    if not node_id:
+        return jsonify({"status": "error", "message": "node parametresi gerekli (txId veya adres)"}), 400
+    try:
+        options = neighborhood_args(request.args)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    try:
+        return jsonify({
+            "status": "success",
+            "visualization": node_neighborhood(dataset_type, node_id, options)
+        })
+    except (LookupError, FileNotFoundError) as e:
+        return jsonify({"status": "error", "message": str(e)}), 404
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
 # 🔍 Anomali tespiti
 @bp.route("/anomalies", methods=["GET"])
 def get_anomalies():
@@ -297,11 +486,12 @@ def get_anomalies():
     if dataset_type == "elliptic":
         # Elliptic dataset kullan
         try:
-            # Elliptic dataset'i loadera yükle
-            loader = EllipticDatasetLoader(data_dir=ELLIPTIC_DATA_DIR)
+            # Paylaşılan (önbellekteki) Elliptic veri setini al
+            dataset = get_elliptic_dataset(ELLIPTIC_DATA_DIR)
             
             # İşlem ağını oluştur
-            G = create_graph_from_elliptic(loader, max_nodes=200)
+            graph = dataset.derived('csr_graph', build_elliptic_graph)
+            G = create_graph_from_elliptic(dataset, max_nodes=200, graph=graph)
             
             # İlk 10 illegal işlemi belirle (yüksek değerli işlemler olarak göster)
             high_value_nodes = []
@@ -350,24 +540,30 @@ def get_anomalies():
             return jsonify({"status": "error", "message": str(e)}), 500
     elif dataset_type == "raw_data":
         # Raw transaction data kullan (orijinal implementasyon)
-        filepath = "data/raw_transactions.json"
+        filepath = find_raw_transactions("data")
         if not os.path.exists(filepath):
             return jsonify({"status": "error", "message": "Veri dosyası bulunamadı"}), 404
 
         try:
-            G = load_graph_from_json(filepath)
+            # /graph-analysis ile aynı anlık görüntü ve istatistik deposu kullanılır
+            fingerprint = FeatureStore.fingerprint(filepath)
+            snapshot = raw_graph_snapshot(filepath, fingerprint)
+
             anomalies = {
-                "high_value_transactions": detect_heavy_senders(G, threshold=1000),
-                "isolated_nodes": detect_isolated_nodes(G),
-                "temporal_analysis": analyze_temporal_patterns(G)
+                "high_value_transactions": raw_graph_stat(
+                    filepath, fingerprint, "heavy_senders_1000", partial(detect_heavy_senders, threshold=1000)),
+                "isolated_nodes": raw_graph_stat(filepath, fingerprint, "isolated_nodes", detect_isolated_nodes),
+                "temporal_analysis": default_graph_store.stat(
+                    "raw_data", fingerprint, f"temporal_patterns_{DEFAULT_RESOLUTION}",
+                    partial(raw_temporal_patterns, filepath, fingerprint))
             }
             return jsonify({
                 "status": "success", 
                 "anomalies": anomalies,
                 "dataset_info": {
                     "type": "raw_data",
-                    "node_count": G.number_of_nodes(),
-                    "edge_count": G.number_of_edges()
+                    "node_count": snapshot.n_nodes,
+                    "edge_count": snapshot.n_edges
                 }
             })
         except Exception as e:
@@ -408,8 +604,9 @@ def network_visualization():
             # Etherscan API'den işlemleri al
             transactions = get_transactions(address)
             
-            # İşlem ağını oluştur
-            G = create_graph_from_transactions(transactions, max_nodes=50)
+            # İşlem ağını oluştur; aggregate=true ile çift toplamlarına göre karşı taraflar seçilir
+            aggregate = request.args.get("aggregate", "false").lower() == "true"
+            G = create_graph_from_transactions(transactions, max_nodes=50, aggregate=aggregate)
             
             # Force-directed graph için düğüm ve kenar verilerini hazırla
             nodes = []
@@ -432,7 +629,8 @@ def network_visualization():
                     "source": u,
                     "target": v,
                     "value": min(10, d["weight"]),  # Ağırlığı sınırla (görsel amaçlı)
-                    "realValue": d["weight"]  # Gerçek değer
+                    "realValue": d["weight"],  # Gerçek değer
+                    "count": d.get("count", 1)  # Kenardaki işlem sayısı
                 })
             
             return jsonify({
@@ -463,12 +661,16 @@ def ml_anomalies():
                 {
                     "id": "raw_data",
                     "name": "Ham İşlem Verileri",
-                    "description": "Ethereum üzerinde gerçek işlem verileri"
+                    "description": "Ethereum üzerinde gerçek işlem verileri",
+                    "parameter": "algo",
+                    "algorithms": ["isoforest", "ocsvm", "lof"]
                 },
                 {
                     "id": "elliptic",
                     "name": "Elliptic Bitcoin Veri Seti",
-                    "description": "Etiketlenmiş Bitcoin işlem ağı (illicit/licit)"
+                    "description": "Etiketlenmiş Bitcoin işlem ağı (illicit/licit)",
+                    "parameter": "method",
+                    "algorithms": list(PROPAGATION_METHODS)
                 }
             ],
             "available_algorithms": [
@@ -487,93 +689,62 @@ def ml_anomalies():
                     "name": "Local Outlier Factor",
                     "description": "Yerel komşuluk yoğunluğu temelli anomali tespiti"
                 }
+            ],
+            # Elliptic veri setinde ML modelleri yerine etiket yayılımı sıralaması kullanılır
+            "propagation_methods": [
+                {
+                    "id": "pagerank",
+                    "name": "Kişiselleştirilmiş PageRank",
+                    "description": "Bilinen illicit işlemlerden başlayan rastgele yürüyüşle şüphe skorunu yayar"
+                },
+                {
+                    "id": "label_spreading",
+                    "name": "Etiket Yayılımı",
+                    "description": "Bilinen licit/illicit etiketlerini normalize komşuluk matrisi üzerinden yayar"
+                }
             ]
         }
         return jsonify({"status": "success", "data": available_datasets})
     
     try:
-        detector = MLAnomalyDetector()
-        
         # Elliptic Dataset için
         if dataset_type == "elliptic":
-            # Model yükleme
-            model = None
-            try:
-                model = load_model(algo)
-            except FileNotFoundError:
-                return jsonify({"status": "error", "message": f"Model bulunamadı: {algo}"}), 404
-            
-            # Elliptic dataset'i loadera yükle
-            loader = EllipticDatasetLoader(data_dir=ELLIPTIC_DATA_DIR)
-            
-            # Veriyi hazırla
-            features, edges, classes = loader.load_data()
-            
-            # İllegal sınıfa sahip işlemleri anomali olarak kabul edelim
-            illegal_transactions = features[features['class'] == 1]
-            
-            # Anomalileri hazırla
-            anomalies = []
-            for _, row in illegal_transactions.head(10).iterrows():
-                txid = row['txId']
-                anomaly_score = 100  # İllegal işlemler için yüksek anomali skoru
-                
-                # Bağlantılı işlemleri bul
-                connected_txs = []
-                for _, edge_row in edges[edges['txId1'] == txid].iterrows():
-                    connected_txs.append(str(edge_row['txId2']))  # Ensure txId2 is a string
-                
-                # Convert NumPy types to Python types
-                feature_dict = {}
-                for col_name, value in row.drop(['txId', 'class']).items():
-                    if isinstance(value, (np.integer, np.int64, np.int32, np.int16, np.int8)):
-                        feature_dict[str(col_name)] = int(value)
-                    elif isinstance(value, (np.floating, np.float64, np.float32, np.float16)):
-                        feature_dict[str(col_name)] = float(value)
-                    elif isinstance(value, np.bool_):
-                        feature_dict[str(col_name)] = bool(value)
-                    else:
-                        feature_dict[str(col_name)] = str(value)
-                
-                anomalies.append({
-                    "from": str(txid),  # Ensure txId is a string
-                    "anomaly_score": float(anomaly_score),  # Ensure score is a float
-                    "is_anomaly": True,
-                    "connected_transactions": connected_txs[:5] if connected_txs else [],
-                    "features": feature_dict
-                })
-            
-            # Tüm algoritmalar için
+            # Sayfalama ve yayılım yöntemi (pagerank veya label_spreading); ML modelleri kullanılmaz
+            # algo yalnızca bir yayılım yöntemi adı olarak kabul edilir; ML algoritmaları burada uygulanmaz
+            explicit_algo = request.args.get("algo")
+            if explicit_algo is not None and explicit_algo.lower() not in PROPAGATION_METHODS:
+                return jsonify({"status": "error", "message": f"Elliptic veri setinde '{explicit_algo}' algoritması "
+                                f"kullanılamaz; method ile {', '.join(PROPAGATION_METHODS)} seçilebilir"}), 400
+            method = request.args.get("method", explicit_algo or DEFAULT_PROPAGATION_METHOD).lower()
+            page = request.args.get("page", "1")
+            page_size = request.args.get("page_size", "10")
+            if method not in PROPAGATION_METHODS:
+                return jsonify({"status": "error", "message": f"Geçersiz yayılım yöntemi: {method}"}), 400
+            if not page.isdigit() or int(page) < 1:
+                return jsonify({"status": "error", "message": f"Geçersiz sayfa: {page}"}), 400
+            if not page_size.isdigit() or not 1 <= int(page_size) <= MAX_PAGE_SIZE:
+                return jsonify({"status": "error", "message": f"Geçersiz page_size: {page_size} (1-{MAX_PAGE_SIZE})"}), 400
+            page, page_size = int(page), int(page_size)
+
+            # Paylaşılan (önbellekteki) Elliptic veri seti
+            dataset = get_elliptic_dataset(ELLIPTIC_DATA_DIR)
+
+            # Karşılaştırma: her yayılım yönteminin kendi sıralaması
             if all_algos:
-                results = {}
-                for method in ["isoforest", "ocsvm", "lof"]:
-                    # Her algoritma için farklı miktarda anomali göster
-                    multiplier = 1.0
-                    if method == "ocsvm":
-                        multiplier = 0.9
-                    elif method == "lof":
-                        multiplier = 0.8
-                    
-                    # Her algoritma için anomali sayısını ayarla
-                    method_anomalies = []
-                    for anomaly in anomalies:
-                        # Create a deep copy and ensure all values are Python native types
-                        converted_anomaly = convert_numpy_types(anomaly.copy())
-                        converted_anomaly["anomaly_score"] = float(anomaly["anomaly_score"] * multiplier)
-                        method_anomalies.append(converted_anomaly)
-                    
-                    results[method] = method_anomalies
-                
-                # Ensure all values are serializable
-                results = convert_numpy_types(results)
-                return jsonify({"status": "success", "all_anomalies": results, "dataset_type": dataset_type})
-            else:
-                # Ensure all values are serializable
-                converted_anomalies = convert_numpy_types(anomalies)
-                return jsonify({"status": "success", "anomalies": converted_anomalies, "algorithm": algo, "dataset_type": dataset_type})
+                results, propagation = {}, {}
+                for propagation_method in PROPAGATION_METHODS:
+                    results[propagation_method], pagination, propagation[propagation_method] = propagation_anomalies(
+                        dataset, propagation_method, page, page_size)
+                return jsonify({"status": "success", "all_anomalies": results, "pagination": pagination,
+                                "propagation": propagation, "dataset_type": dataset_type})
+
+            anomalies, pagination, propagation = propagation_anomalies(dataset, method, page, page_size)
+            return jsonify({"status": "success", "anomalies": anomalies, "pagination": pagination,
+                            "propagation": propagation, "algorithm": method, "dataset_type": dataset_type})
         
         # Orijinal (Raw Data) İçin
         elif dataset_type == "raw_data":
+            detector = get_ml_detector()
             if all_algos:
                 results = {}
                 for method in ["isoforest", "lof", "ocsvm"]:
@@ -635,15 +806,13 @@ def ml_feature_distribution():
     
     try:
         if dataset_type == "elliptic":
-            # Elliptic dataset'i loadera yükle
-            loader = EllipticDatasetLoader(data_dir=ELLIPTIC_DATA_DIR)
-            
-            # Veriyi hazırla
-            features, _, _ = loader.load_data()
+            # Paylaşılan (önbellekteki) Elliptic veri setini al
+            dataset = get_elliptic_dataset(ELLIPTIC_DATA_DIR)
+            features = dataset.features
             
             # Sınıf bilgisine göre öznitelikleri ayır
-            illegal = features[features['class'] == 1].drop(['txId', 'class'], axis=1)
-            legal = features[features['class'] == 2].drop(['txId', 'class'], axis=1)
+            illegal = features[features['class'] == 1][dataset.feature_columns]
+            legal = features[features['class'] == 2][dataset.feature_columns]
             
             # Öznitelik dağılımını hesapla
             distribution = {}
@@ -655,8 +824,7 @@ def ml_feature_distribution():
             
             return jsonify({'status': 'success', 'features': distribution, 'dataset_type': dataset_type})
         elif dataset_type == "raw_data":
-            detector = MLAnomalyDetector()
-            distributions = detector.get_feature_distributions(algo=algo)
+            distributions = get_ml_detector().get_feature_distributions(algo=algo)
             # Ensure all values are serializable
             distributions = convert_numpy_types(distributions)
             return jsonify({'status': 'success', 'features': distributions, 'dataset_type': dataset_type})
@@ -705,6 +873,9 @@ def list_models():
                     }.get(algo_key, 0)
                 }
                 
+                # Bellekteki model: yükleme süresi ve boyutu
+                model_info['runtime'] = model_registry.info(algo_key)
+                
                 models.append(model_info)
         
         return jsonify({
@@ -818,18 +989,14 @@ def analyze_address_with_model():
         # İşlemleri analiz et
         basic_analysis = analyze_transactions(transactions)
         
-        # ML Anomali Detektörü oluştur
-        detector = MLAnomalyDetector()
-        
-        # Model tahmini yapmak için gerekli özellikleri oluştur
-        df = pd.DataFrame(transactions)
-        if df.empty:
+        if not transactions:
             return jsonify({
                 "status": "error", 
                 "message": "Bu adres için işlem bulunamadı"
             }), 404
-            
-        features = detector.extract_features_for_address(address, df)
+        
+        # Model tahmini yapmak için gerekli özellikleri oluştur (yalnızca bu adresin işlemleri)
+        features = extract_address_features(address, transactions)
         
         # Modeli yükle
         try:
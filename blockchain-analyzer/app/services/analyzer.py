@@ -1,36 +1,55 @@
 import numpy as np
-from collections import defaultdict
 from datetime import datetime
+from .burst_detection import (
+    BURST_MIN_COUNT,
+    BURST_WINDOW_SECONDS,
+    RAPID_WINDOW_SECONDS,
+    rapid_pairs,
+    sliding_window_bursts
+)
+from .fixed_point import WEI_PER_ETH
+from .tx_frame import TxFrame
+
+# Yüksek değerli işlem eşiği (100 ETH), wei cinsinden tam sayı
+HIGH_VALUE_WEI = 100 * WEI_PER_ETH
 
 def analyze_transactions(transactions):
+    # Etherscan kayıtları tek adımda tipli sütunlara çevrilir
+    frame = transactions if isinstance(transactions, TxFrame) else TxFrame.from_transactions(transactions)
+
     # Temel metrikler
-    total_eth = sum([int(tx["value"]) / 1e18 for tx in transactions if tx["isError"] == "0"])
-    tx_count = len(transactions)
-    
+    values = frame.value_eth[frame.ok]
+    # Toplam wei üzerinden tam hesaplanır; tek bölme doğru yuvarlanmış float verir
+    total_eth = frame.value[frame.ok].sum() / WEI_PER_ETH
+    tx_count = len(frame)
+
     # Zaman bazlı analiz
-    timestamps = [int(tx["timeStamp"]) for tx in transactions]
-    if timestamps:
-        first_tx = datetime.fromtimestamp(min(timestamps))
-        last_tx = datetime.fromtimestamp(max(timestamps))
+    if tx_count:
+        first_tx = datetime.fromtimestamp(int(frame.timestamp.min()))
+        last_tx = datetime.fromtimestamp(int(frame.timestamp.max()))
         time_span = (last_tx - first_tx).days
     else:
         time_span = 0
-    
+
     # İşlem değeri analizi
-    values = [int(tx["value"]) / 1e18 for tx in transactions if tx["isError"] == "0"]
-    if values:
+    if len(values):
         avg_value = np.mean(values)
-        max_value = max(values)
+        max_value = float(values.max())
         value_std = np.std(values)
     else:
         avg_value = max_value = value_std = 0
-    
+
     # Anomali tespiti
-    anomalies = detect_anomalies(transactions)
-    
-    # Smart contract etkileşimleri
-    contract_interactions = sum(1 for tx in transactions if tx.get("to", "").startswith("0x") and len(tx["to"]) == 42)
-    
+    anomalies = detect_anomalies(frame)
+
+    # Smart contract etkileşimleri: adres tablosu üzerinde bir kez kontrol edilir
+    is_contract_like = np.array(
+        [isinstance(a, str) and a.startswith("0x") and len(a) == 42 for a in frame.addresses],
+        dtype=bool
+    )
+    has_to = frame.to_id >= 0
+    contract_interactions = int(is_contract_like[frame.to_id[has_to]].sum())
+
     return {
         "total_eth_sent": round(total_eth, 4),
         "tx_count": tx_count,
@@ -42,46 +61,66 @@ def analyze_transactions(transactions):
         "anomalies": anomalies
     }
 
-def detect_anomalies(transactions):
+def detect_anomalies(transactions, burst_window=BURST_WINDOW_SECONDS, burst_min_count=BURST_MIN_COUNT):
+    frame = transactions if isinstance(transactions, TxFrame) else TxFrame.from_transactions(transactions)
     anomalies = {
         "high_value_txs": [],
         "rapid_transactions": [],
+        "rapid_bursts": [],
         "suspicious_patterns": []
     }
-    
+
     # Yüksek değerli işlemler (100 ETH üzeri)
-    for tx in transactions:
-        value_eth = int(tx["value"]) / 1e18
-        if value_eth > 100:
-            anomalies["high_value_txs"].append({
-                "hash": tx["hash"],
-                "value": value_eth,
-                "from": tx["from"],
-                "to": tx["to"]
-            })
-    
-    # Hızlı art arda gelen işlemler
-    if len(transactions) > 1:
-        for i in range(1, len(transactions)):
-            time_diff = int(transactions[i]["timeStamp"]) - int(transactions[i-1]["timeStamp"])
-            if time_diff < 60 and transactions[i]["from"] == transactions[i-1]["from"]:
-                anomalies["rapid_transactions"].append({
-                    "tx1": transactions[i-1]["hash"],
-                    "tx2": transactions[i]["hash"],
-                    "time_diff": time_diff
-                })
-    
+    high_value = np.flatnonzero(frame.value.greater_than(HIGH_VALUE_WEI))
+    for tx_hash, value_eth, sender, receiver in zip(
+        frame.hash[high_value].tolist(),
+        frame.value_eth[high_value].tolist(),
+        frame.address(frame.from_id[high_value]).tolist(),
+        frame.address(frame.to_id[high_value]).tolist()
+    ):
+        anomalies["high_value_txs"].append({
+            "hash": tx_hash,
+            "value": value_eth,
+            "from": sender,
+            "to": receiver
+        })
+
+    # Hızlı art arda gelen işlemler: aynı göndericinin zaman sırasındaki ardışık işlemleri
+    first, second, time_diff = rapid_pairs(frame.from_id, frame.timestamp, RAPID_WINDOW_SECONDS)
+    for tx1, tx2, diff in zip(frame.hash[first].tolist(), frame.hash[second].tolist(), time_diff.tolist()):
+        anomalies["rapid_transactions"].append({
+            "tx1": tx1,
+            "tx2": tx2,
+            "time_diff": diff
+        })
+
+    # Yoğunlaşmalar: burst_window saniye içinde en az burst_min_count işlem
+    for burst in sliding_window_bursts(frame.from_id, frame.timestamp, burst_window, burst_min_count):
+        start_time = int(frame.timestamp[burst[0]])
+        end_time = int(frame.timestamp[burst[-1]])
+        anomalies["rapid_bursts"].append({
+            "from": frame.addresses[frame.from_id[burst[0]]] if frame.from_id[burst[0]] >= 0 else None,
+            "tx_count": len(burst),
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration": end_time - start_time,
+            "first_tx": frame.hash[burst[0]],
+            "last_tx": frame.hash[burst[-1]]
+        })
+
     # Şüpheli desenler (aynı adrese çok sayıda küçük işlem)
-    address_counts = defaultdict(int)
-    for tx in transactions:
-        if tx["to"]:
-            address_counts[tx["to"]] += 1
-    
-    for address, count in address_counts.items():
-        if count > 10:  # Aynı adrese 10'dan fazla işlem
-            anomalies["suspicious_patterns"].append({
-                "address": address,
-                "tx_count": count
-            })
-    
+    to_ids = frame.to_id[frame.to_id >= 0]
+    if len(to_ids):
+        counts = np.bincount(to_ids, minlength=len(frame.addresses))
+        # Adresler ilk alıcı olarak görüldükleri sırayla raporlanır
+        receiver_ids, first_seen = np.unique(to_ids, return_index=True)
+        ordered = receiver_ids[np.argsort(first_seen)]
+        ordered = ordered[counts[ordered] > 10]
+        for address, count in zip(frame.addresses[ordered].tolist(), counts[ordered].tolist()):
+            if address and count > 10:  # Aynı adrese 10'dan fazla işlem
+                anomalies["suspicious_patterns"].append({
+                    "address": address,
+                    "tx_count": count
+                })
+
     return anomalies
@@ -0,0 +1,80 @@
+import numpy as np
+
+# Aynı göndericiden bu süreden kısa arayla gelen iki işlem "hızlı" sayılır
+RAPID_WINDOW_SECONDS = 60
+
+# Varsayılan yoğunlaşma kuralı: BURST_WINDOW_SECONDS içinde en az BURST_MIN_COUNT işlem
+BURST_WINDOW_SECONDS = 300
+BURST_MIN_COUNT = 5
+
+def sender_time_order(sender_ids, timestamps):
+    """
+    İşlemleri (gönderici, zaman) sırasına koyan kararlı sıralama indeksleri.
+
+    Aynı gönderici ve aynı zaman damgasına sahip işlemler orijinal
+    sıralarını korur. O(n log n).
+    """
+    return np.lexsort((np.asarray(timestamps), np.asarray(sender_ids)))
+
+def rapid_pairs(sender_ids, timestamps, window=RAPID_WINDOW_SECONDS):
+    """
+    Aynı göndericinin zaman sırasında ardışık iki işlemi arasındaki fark
+    window saniyeden kısaysa çift olarak raporla.
+
+    Liste sıralı olmak zorunda değildir; farklı göndericilerle araya
+    girmiş işlemler de yakalanır.
+
+    Returns:
+    --------
+    (first, second, time_diff) : tuple of numpy.ndarray
+        Orijinal listedeki indeksler ve saniye cinsinden fark
+        (gönderici, zaman) sırasında
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    sender_ids = np.asarray(sender_ids)
+    if len(timestamps) < 2:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+
+    order = sender_time_order(sender_ids, timestamps)
+    senders = sender_ids[order]
+    times = timestamps[order]
+    time_diff = np.diff(times)
+    pairs = np.flatnonzero((senders[1:] == senders[:-1]) & (time_diff < window))
+    return order[pairs], order[pairs + 1], time_diff[pairs]
+
+def sliding_window_bursts(sender_ids, timestamps, window=BURST_WINDOW_SECONDS, min_count=BURST_MIN_COUNT):
+    """
+    Aynı göndericiden window saniye içinde en az min_count işlem olan
+    yoğunlaşmaları bul; çakışan pencereler tek bir yoğunlaşmada birleştirilir.
+
+    Her işlem için penceresinin sonu tek bir searchsorted ile bulunur:
+    anahtar = gönderici << 32 | göreli zaman olduğundan pencere hiçbir
+    zaman bir sonraki göndericiye taşmaz.
+
+    Returns:
+    --------
+    list of numpy.ndarray
+        Her yoğunlaşma için orijinal listedeki işlem indeksleri (zaman sırasında)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    sender_ids = np.asarray(sender_ids, dtype=np.int64)
+    n = len(timestamps)
+    if n < max(min_count, 1):
+        return []
+
+    order = sender_time_order(sender_ids, timestamps)
+    relative_time = timestamps[order] - timestamps.min()
+    key = (sender_ids[order] << 32) + relative_time
+    # Pencere [t_i, t_i + window): ilk t_j - t_i >= window olan konum
+    window_end = np.searchsorted(key, key + window, side='left')
+    starts = np.flatnonzero(window_end - np.arange(n) >= min_count)
+    if len(starts) == 0:
+        return []
+
+    # window_end azalmayan olduğundan, önceki pencerenin bittiği yerden sonra başlayan yeni yoğunlaşmadır
+    ends = window_end[starts]
+    new_burst = np.r_[True, starts[1:] >= ends[:-1]]
+    burst_starts = starts[new_burst]
+    burst_ends = ends[np.r_[new_burst[1:], True]]
+    return [order[start:end] for start, end in zip(burst_starts, burst_ends)]
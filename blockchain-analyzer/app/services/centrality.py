@@ -0,0 +1,195 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+import networkx as nx
+import numpy as np
+from .csr_graph import scipy_adjacency
+
+# k='auto' için iş bütçesi: kaynak sayısı x (düğüm + kenar); her kaynak grafı bir kez gezer
+BETWEENNESS_WORK_BUDGET = 20_000_000
+# k='auto' ile büyük graflarda bile en az bu kadar kaynak örneklenir
+AUTO_MIN_PIVOTS = 64
+# k='auto' için süre üst sınırı (saniye); yalnızca beklenmedik yavaşlıkta devreye girer
+BETWEENNESS_TIME_BUDGET = 2.0
+# Kaynaklar bu büyüklükte gruplar halinde işlenir; süre bütçesi her gruptan sonra kontrol edilir
+PIVOT_BATCH = 16
+BETWEENNESS_SEED = 42
+_CACHE_SIZE = 16
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def graph_fingerprint(G):
+    """Düğüm ve kenar kümesinden grafın sürüm anahtarı (sıralamadan bağımsız)"""
+    digest = hashlib.md5()
+    digest.update(f"{type(G).__name__}:{G.number_of_nodes()}:{G.number_of_edges()}".encode('utf-8'))
+    for edge in sorted(map(repr, G.edges())):
+        digest.update(edge.encode('utf-8'))
+    for node in sorted(map(repr, nx.isolates(G))):
+        digest.update(node.encode('utf-8'))
+    return digest.hexdigest()
+
+def contributing_sources(matrix):
+    """
+    Yönlü grafta betweenness'e katkısı sıfır olmayabilecek kaynakların indeksleri.
+
+    Bir kaynağın katkısı, en kısa yollarının en az bir ara düğümden geçmesini
+    gerektirir; bu ancak çıkış derecesi sıfır olmayan bir ardılı varsa
+    mümkündür. İşlem graflarında adreslerin çoğu yalnızca alıcı olduğundan
+    tam hesap da bu küçük kaynak kümesiyle sınırlanabilir.
+    """
+    has_successors = (np.diff(matrix.indptr) > 0).astype(np.float64)
+    return np.flatnonzero(matrix @ has_successors > 0)
+
+def _brandes_batch(matrix, matrix_t, sources):
+    """
+    Bir grup kaynak için Brandes bağımlılıklarını birlikte hesapla.
+
+    Her kaynak bir sütundur: ileri adımda BFS seviye seviye ilerler ve en
+    kısa yol sayıları (sigma) seyrek matris çarpımıyla yayılır; geri adımda
+    bağımlılıklar (delta) seviyeler tersine gezilerek öncüllere aktarılır.
+    Her seviyede yalnızca o seviyedeki satırlar ve komşuları işlenir.
+
+    Returns:
+    --------
+    numpy.ndarray
+        Düğüm başına bağımlılıkların grup toplamı (normalize edilmemiş)
+    """
+    n_nodes = matrix.shape[0]
+    columns = np.arange(len(sources))
+    level = np.full((n_nodes, len(sources)), -1, dtype=np.int32)
+    sigma = np.zeros((n_nodes, len(sources)))
+    delta = np.zeros((n_nodes, len(sources)))
+    level[sources, columns] = 0
+    sigma[sources, columns] = 1.0
+
+    # İleri adım: seviye d'deki satırlardan d+1'e yeni ulaşılan düğümler
+    rows = np.unique(sources)
+    level_rows = [rows]
+    depth = 0
+    while len(rows):
+        frontier = np.where(level[rows] == depth, sigma[rows], 0.0)
+        edges = matrix[rows]
+        reached = np.unique(edges.indices)
+        paths = edges.T.tocsr()[reached] @ frontier
+        reached_level = level[reached]
+        new = (paths > 0) & (reached_level < 0)
+        level[reached] = np.where(new, depth + 1, reached_level)
+        sigma[reached] += np.where(new, paths, 0.0)
+        rows = reached[new.any(axis=1)]
+        depth += 1
+        level_rows.append(rows)
+
+    # Geri adım: delta[v] += sigma[v] / sigma[w] * (1 + delta[w]), v seviye d-1, w seviye d
+    for depth in range(len(level_rows) - 1, 0, -1):
+        rows = level_rows[depth]
+        if not len(rows):
+            continue
+        at_depth = level[rows] == depth
+        coeff = np.where(at_depth, (1.0 + delta[rows]) / np.where(at_depth, sigma[rows], 1.0), 0.0)
+        edges = matrix_t[rows]
+        parents = np.unique(edges.indices)
+        back = edges.T.tocsr()[parents] @ coeff
+        delta[parents] += np.where(level[parents] == depth - 1, sigma[parents] * back, 0.0)
+
+    # Kaynağın kendisi yol üzerinde ara düğüm sayılmaz
+    delta[sources, columns] = 0.0
+    return delta.sum(axis=1)
+
+def auto_pivots(n_nodes, n_edges, n_sources, work_budget=BETWEENNESS_WORK_BUDGET):
+    """
+    k='auto' için kaynak sayısı: iş bütçesinin grafın bir kez gezilmesine
+    (düğüm + kenar) oranı, PIVOT_BATCH katına yuvarlanır. Yalnızca graf
+    boyutuna bağlıdır; aynı graf için her zaman aynı örneklem seçilir.
+    """
+    pivots = max(AUTO_MIN_PIVOTS, work_budget // max(n_nodes + n_edges, 1))
+    pivots = -(-pivots // PIVOT_BATCH) * PIVOT_BATCH
+    return int(min(pivots, n_sources))
+
+def approximate_betweenness(G, k='auto', seed=BETWEENNESS_SEED, time_budget=BETWEENNESS_TIME_BUDGET):
+    """
+    Normalize betweenness merkeziliği (nx.betweenness_centrality ile aynı ölçek).
+
+    Brandes birikimi yalnızca contributing_sources kaynakları üzerinden,
+    sabit seed ile karıştırılmış sırada PIVOT_BATCH'lik gruplar halinde
+    yapılır ve örneklenen kaynak sayısıyla ölçeklenir (yansız tahmin):
+        k=None   : tüm katkı verebilen kaynaklar (tam sonuç)
+        k=int    : k kaynak (deterministik örneklem)
+        k='auto' : graf boyutundan auto_pivots ile seçilen kaynak sayısı; küçük
+                   graflarda tam sonuç. time_budget yalnızca üst sınırdır: bir
+                   sonraki grup bütçeyi aşacaksa örneklem erken kesilir
+
+    Returns:
+    --------
+    (centrality, pivots) : tuple
+        {düğüm: değer} ve kullanılan kaynak sayısı (tam hesapta None)
+    """
+    n_nodes = G.number_of_nodes()
+    if not G.is_directed() or n_nodes <= 2:
+        # Yönsüz graflarda networkx'in kendi örneklemesi kullanılır
+        pivots = None if k in (None, 'auto') or int(k) >= n_nodes else int(k)
+        return nx.betweenness_centrality(G, k=pivots, seed=seed), pivots
+
+    start_time = time.time()
+    nodes, matrix = scipy_adjacency(G, weight=None)
+    matrix_t = matrix.T.tocsr()
+    sources = contributing_sources(matrix)
+    sources = sources[np.random.default_rng(seed).permutation(len(sources))]
+    if k is None:
+        limit = len(sources)
+    elif k == 'auto':
+        limit = auto_pivots(n_nodes, matrix.nnz, len(sources))
+    else:
+        limit = min(int(k), len(sources))
+
+    totals = np.zeros(n_nodes)
+    done = 0
+    while done < limit:
+        batch = sources[done:min(done + PIVOT_BATCH, limit)]
+        totals += _brandes_batch(matrix, matrix_t, batch)
+        done += len(batch)
+        if k == 'auto' and time_budget is not None and done < limit:
+            # Üst sınır: bir sonraki grup süre bütçesini aşacaksa dur
+            elapsed = time.time() - start_time
+            if elapsed + elapsed / done * PIVOT_BATCH > time_budget:
+                break
+
+    scale = (len(sources) / done if done else 0.0) / ((n_nodes - 1) * (n_nodes - 2))
+    centrality = dict(zip(nodes, (totals * scale).tolist()))
+    return centrality, (None if done == len(sources) else done)
+
+def top_betweenness(G, n=5, k='auto', seed=BETWEENNESS_SEED, time_budget=BETWEENNESS_TIME_BUDGET,
+                    version=None):
+    """
+    Betweenness merkeziliği en yüksek n düğümü döndür.
+
+    k için bkz. approximate_betweenness. Sonuç graf sürümü (version
+    verilmezse graph_fingerprint), k ve seed için önbelleklenir.
+
+    Returns:
+    --------
+    (top, pivots) : tuple
+        [(düğüm, değer), ...] azalan sırada ve kullanılan kaynak sayısı (tam hesapta None)
+    """
+    if version is None:
+        version = graph_fingerprint(G)
+    key = (version, k, seed, time_budget if k == 'auto' else None)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+    if cached is None:
+        centrality, pivots = approximate_betweenness(G, k, seed, time_budget)
+        cached = (sorted(centrality.items(), key=lambda x: x[1], reverse=True), pivots)
+        with _cache_lock:
+            _cache[key] = cached
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    ranked, pivots = cached
+    return ranked[:n], pivots
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,272 @@
+from concurrent.futures import ProcessPoolExecutor
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from .csr_graph import CSRGraph, scipy_adjacency
+
+# Varsayılan topluluk algoritması ve tekrarlanabilirlik için seed
+DEFAULT_COMMUNITY_METHOD = 'louvain'
+COMMUNITY_SEED = 42
+
+# Yerel taşıma adımı için sınırlar
+MAX_MOVE_ITERATIONS = 50
+MAX_LEVELS = 10
+MIN_MODULARITY_GAIN = 1e-7
+MAX_STALLED_ITERATIONS = 3
+
+def undirected_adjacency(n_nodes, src, dst, weights=None):
+    """
+    Yönlü kenar dizilerinden simetrik (yönsüz) CSR komşuluk matrisi oluştur.
+
+    nx.Graph.to_undirected ile aynı kabul: karşılıklı kenarlar tek kenardır,
+    ağırlıksız grafta her kenar 1'dir. Köşegende kendine döngüler derece
+    katkısı gibi iki kez (2w) tutulur; böylece satır toplamları dereceyi,
+    matrisin toplamı 2m'yi verir.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weights = np.ones(len(src)) if weights is None else np.asarray(weights, dtype=np.float64)
+    loops = src == dst
+    directed = sparse.csr_array((weights[~loops], (src[~loops], dst[~loops])), shape=(n_nodes, n_nodes))
+    # Karşılıklı kenarlarda networkx'te olduğu gibi tek ağırlık kalır
+    adjacency = directed.maximum(directed.T).tocsr()
+    if loops.any():
+        diagonal = np.zeros(n_nodes)
+        np.maximum.at(diagonal, src[loops], weights[loops])
+        adjacency = (adjacency + sparse.diags_array(2.0 * diagonal)).tocsr()
+    return adjacency
+
+def graph_adjacency(G, weight=None):
+    """networkx grafı ya da CSRGraph için (düğüm kimlikleri, simetrik CSR) döndür"""
+    if isinstance(G, CSRGraph):
+        weights = None if weight is None or G.weights is None else G.weights
+        return G.node_ids, undirected_adjacency(G.n_nodes, G.src, G.dst, weights)
+    nodes, directed = scipy_adjacency(G, weight=weight)
+    coo = directed.tocoo()
+    return nodes, undirected_adjacency(len(nodes), coo.row, coo.col, None if weight is None else coo.data)
+
+def _edge_modularity(rows, cols, weights, degree, total, labels, resolution=1.0):
+    """Kenar dizileri (tüm simetrik girdiler) ve dereceler üzerinden modülerlik"""
+    if total == 0:
+        return 0.0
+    intra = weights[labels[rows] == labels[cols]].sum()
+    degree_sums = np.bincount(labels, weights=degree)
+    return float(intra / total - resolution * np.sum((degree_sums / total) ** 2))
+
+def modularity(adjacency, labels, resolution=1.0):
+    """Simetrik komşuluk matrisi ve düğüm etiketleri için modülerlik (nx.community.modularity ile aynı)"""
+    coo = adjacency.tocoo()
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    return _edge_modularity(coo.row, coo.col, coo.data, degree, coo.data.sum(), labels, resolution)
+
+def _best_candidates(node, candidate, scores, priority):
+    """
+    Her düğüm için puanı en yüksek aday satırı; eşitlikte önceliği en küçük aday.
+
+    Satırlar düğüme göre gruplu (np.unique çıktısı) olduğundan grup içi
+    maksimum ve minimum reduceat ile tek geçişte bulunur.
+    """
+    starts = np.flatnonzero(np.r_[True, node[1:] != node[:-1]])
+    group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(node)]))
+    is_max = scores >= np.maximum.reduceat(scores, starts)[group]
+    candidate_priority = np.where(is_max, priority[candidate], len(priority))
+    return np.flatnonzero(is_max & (candidate_priority == np.minimum.reduceat(candidate_priority, starts)[group]))
+
+def _move_nodes(adjacency, resolution, rng):
+    """
+    Louvain yerel taşıma adımı (vektörel).
+
+    Her turda tüm düğümler için komşu topluluklara taşınmanın modülerlik
+    kazancı kenar dizileri üzerinden birlikte hesaplanır. Karşılıklı takas
+    salınımlarını önlemek için her turda düğümlerin rastgele yarısı taşınır.
+    """
+    n_nodes = adjacency.shape[0]
+    total = adjacency.sum()
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    labels = np.arange(n_nodes)
+
+    coo = adjacency.tocoo()
+    off_diagonal = coo.row != coo.col
+    rows, cols, weights = coo.row[off_diagonal], coo.col[off_diagonal], coo.data[off_diagonal]
+    if len(rows) == 0:
+        return labels
+
+    def score(labels):
+        return _edge_modularity(coo.row, coo.col, coo.data, degree, total, labels, resolution)
+
+    current_modularity = score(labels)
+    stalled = 0
+    for _ in range(MAX_MOVE_ITERATIONS):
+        community_degree = np.bincount(labels, weights=degree, minlength=n_nodes)
+
+        # (düğüm, komşu topluluk) başına bağlantı ağırlığı
+        keys, inverse = np.unique(rows * n_nodes + labels[cols], return_inverse=True)
+        k_in = np.bincount(inverse, weights=weights)
+        node, community = keys // n_nodes, keys % n_nodes
+
+        # Kazanç (m ile ölçeklenmiş): k_i,in(C) - γ k_i Σ_tot(C \ i) / 2m
+        own = community == labels[node]
+        others = community_degree[community] - np.where(own, degree[node], 0.0)
+        scores = k_in - resolution * degree[node] * others / total
+
+        # Yerinde kalma puanı (kendi topluluğunda komşusu yoksa k_in = 0)
+        stay = -resolution * degree * (community_degree[labels] - degree) / total
+        stay[node[own]] = scores[own]
+
+        best = _best_candidates(node, community, scores, rng.permutation(n_nodes))
+        candidates = node[best]
+        improves = scores[best] > stay[candidates] + 1e-12
+        if not improves.any():
+            break
+        move = improves & (rng.random(len(best)) < 0.5)
+        new_labels = labels.copy()
+        new_labels[candidates[move]] = community[best[move]]
+
+        # Eşzamanlı taşımalar birbirini etkileyebildiğinden yalnızca iyileştiren tur kabul edilir
+        new_modularity = score(new_labels)
+        if new_modularity > current_modularity + MIN_MODULARITY_GAIN:
+            labels, current_modularity = new_labels, new_modularity
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= MAX_STALLED_ITERATIONS:
+                break
+    return labels
+
+def louvain_labels(adjacency, seed=COMMUNITY_SEED, resolution=1.0):
+    """
+    CSR komşuluk matrisi üzerinde Louvain.
+
+    Her seviyede yerel taşıma adımı çalışır, ardından topluluklar tek düğüme
+    indirgenir (Pᵀ A P) ve topluluk sayısı değişmeyene kadar tekrarlanır.
+
+    Returns:
+    --------
+    numpy.ndarray
+        Orijinal düğüm başına topluluk etiketi (0..c-1)
+    """
+    rng = np.random.default_rng(seed)
+    n_nodes = adjacency.shape[0]
+    labels = np.arange(n_nodes)
+    current = adjacency
+    for _ in range(MAX_LEVELS):
+        level_labels = _move_nodes(current, resolution, rng)
+        _, level_labels = np.unique(level_labels, return_inverse=True)
+        n_communities = level_labels.max() + 1 if len(level_labels) else 0
+        labels = level_labels[labels]
+        if n_communities == current.shape[0]:
+            break
+        membership = sparse.csr_array(
+            (np.ones(len(level_labels)), (np.arange(len(level_labels)), level_labels)),
+            shape=(current.shape[0], n_communities)
+        )
+        current = (membership.T @ current @ membership).tocsr()
+    return labels
+
+def label_propagation_labels(adjacency, seed=COMMUNITY_SEED, max_iterations=100):
+    """
+    CSR komşuluk matrisi üzerinde etiket yayılımı (vektörel, yarı eşzamanlı).
+
+    Her turda düğümlerin rastgele yarısı, komşularında toplam ağırlığı en
+    yüksek etiketi alır; eşitlikler seed'e bağlı rastgele öncelikle bozulur.
+    """
+    rng = np.random.default_rng(seed)
+    n_nodes = adjacency.shape[0]
+    labels = np.arange(n_nodes)
+    coo = adjacency.tocoo()
+    off_diagonal = coo.row != coo.col
+    rows, cols, weights = coo.row[off_diagonal], coo.col[off_diagonal], coo.data[off_diagonal]
+    if len(rows) == 0:
+        return labels
+
+    for _ in range(max_iterations):
+        keys, inverse = np.unique(rows * n_nodes + labels[cols], return_inverse=True)
+        label_weight = np.bincount(inverse, weights=weights)
+        node, label = keys // n_nodes, keys % n_nodes
+        best = _best_candidates(node, label, label_weight, rng.permutation(n_nodes))
+
+        # Mevcut etiket de en ağır etiketlerdense değişmez
+        current_weight = np.zeros(n_nodes)
+        own = label == labels[node]
+        current_weight[node[own]] = label_weight[own]
+        candidates = node[best]
+        changes = label_weight[best] > current_weight[candidates]
+        if not changes.any():
+            break
+        update = changes & (rng.random(len(best)) < 0.5)
+        labels = labels.copy()
+        labels[candidates[update]] = label[best[update]]
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels
+
+def _greedy_labels(G, seed=None):
+    """Önceki yöntem: networkx greedy modularity (yalnızca networkx grafı)"""
+    labels = {}
+    for i, community in enumerate(nx.community.greedy_modularity_communities(G.to_undirected())):
+        for node in community:
+            labels[node] = i
+    return np.array([labels[node] for node in G.nodes()], dtype=np.int64)
+
+COMMUNITY_METHODS = {
+    'louvain': louvain_labels,
+    'label_propagation': label_propagation_labels,
+    'greedy': None
+}
+
+def _run_method(method, adjacency, seed):
+    """Tek çalıştırma: (modülerlik, etiketler); süreç havuzunda da kullanılır"""
+    labels = COMMUNITY_METHODS[method](adjacency, seed=seed)
+    return modularity(adjacency, labels), labels
+
+def community_labels(G, method=DEFAULT_COMMUNITY_METHOD, seed=COMMUNITY_SEED, runs=1, n_jobs=1, weight=None):
+    """
+    Topluluk etiketlerini ve modülerliği hesapla.
+
+    Parameters:
+    -----------
+    G : networkx.Graph veya CSRGraph
+    method : str
+        COMMUNITY_METHODS anahtarlarından biri ('greedy' yalnızca networkx grafı için)
+    seed : int
+        İlk çalıştırmanın seed'i; diğer çalıştırmalar seed+1, seed+2... kullanır
+    runs : int
+        Farklı seed'lerle çalıştırma sayısı; modülerliği en yüksek sonuç seçilir
+    n_jobs : int
+        Çalıştırmaları paralel yürüten süreç sayısı
+
+    Returns:
+    --------
+    (node_ids, labels, modularity) : tuple
+    """
+    if method not in COMMUNITY_METHODS:
+        raise ValueError(f"Bilinmeyen topluluk algoritması: {method}")
+
+    node_ids, adjacency = graph_adjacency(G, weight=weight)
+    if method == 'greedy':
+        if isinstance(G, CSRGraph):
+            G = G.to_networkx()
+        labels = _greedy_labels(G)
+        return node_ids, labels, modularity(adjacency, labels)
+
+    seeds = [seed + i for i in range(max(1, runs))]
+    if n_jobs > 1 and len(seeds) > 1:
+        # NumPy sıralamaları GIL'i bırakmadığından çalıştırmalar ayrı süreçlerde yürür
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(seeds))) as executor:
+            results = list(executor.map(_run_method, [method] * len(seeds), [adjacency] * len(seeds), seeds))
+    else:
+        results = [_run_method(method, adjacency, run_seed) for run_seed in seeds]
+    # Eşit modülerlikte ilk seed'in sonucu kalır
+    best_modularity, best_labels = max(results, key=lambda result: result[0])
+    return node_ids, best_labels, best_modularity
+
+def labels_to_communities(node_ids, labels):
+    """Etiket dizisini büyükten küçüğe sıralı düğüm kümeleri listesine çevir"""
+    if len(labels) == 0:
+        return []
+    order = np.argsort(labels, kind='stable')
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    groups = np.split(order, boundaries)
+    node_ids = np.asarray(node_ids, dtype=object) if not isinstance(node_ids, np.ndarray) else node_ids
+    communities = [set(node_ids[group].tolist()) for group in groups]
+    communities.sort(key=len, reverse=True)
+    return communities
@@ -0,0 +1,274 @@
+import numpy as np
+import networkx as nx
+from scipy import sparse
+
+class CSRGraph:
+    """
+    Yoğun int32 düğüm indeksli, CSR (çıkan) ve CSC (giren) komşuluk dizileriyle
+    tutulan yönlü graf.
+
+    Düğümler 0..n-1 arasında indekslenir; gerçek kimlikler (txId, adres)
+    node_ids dizisinde tutulur. Tüm yapı NumPy ile vektörel olarak kurulur,
+    böylece ~200k düğüm / ~234k kenarlık Elliptic grafı milisaniyeler içinde
+    oluşturulabilir.
+    """
+    def __init__(self, node_ids, src, dst, weights=None, node_labels=None):
+        self.node_ids = np.asarray(node_ids)
+        self.node_labels = node_labels
+        n_nodes = len(self.node_ids)
+
+        src = np.asarray(src, dtype=np.int32)
+        dst = np.asarray(dst, dtype=np.int32)
+
+        # CSR: kenarlar kaynağa göre sıralanır
+        order = np.argsort(src, kind='stable')
+        self.src = src[order]
+        self.dst = dst[order]
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)[order]
+        self.indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.src, minlength=n_nodes), out=self.indptr[1:])
+        self.indices = self.dst
+
+        # CSC: aynı kenarlar hedefe göre sıralanır; rev_edge CSR'deki kenar numarasını verir
+        rev_order = np.argsort(self.dst, kind='stable')
+        self.rev_indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.dst, minlength=n_nodes), out=self.rev_indptr[1:])
+        self.rev_indices = self.src[rev_order]
+        self.rev_edge = rev_order.astype(np.int64)
+
+        self._sorted_ids = None
+        self._sorted_order = None
+
+    @classmethod
+    def from_id_edges(cls, node_ids, source_ids, target_ids, weights=None, node_labels=None, drop_missing=True):
+        """
+        Kimlik (txId/adres) tabanlı kenar listesinden graf oluştur.
+
+        node_ids içinde olmayan uçlara sahip kenarlar drop_missing=True ise atılır.
+        """
+        graph = cls(node_ids, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32), node_labels=node_labels)
+        src = graph.index_of(source_ids)
+        dst = graph.index_of(target_ids)
+        keep = (src >= 0) & (dst >= 0) if drop_missing else np.ones(len(src), dtype=bool)
+        if weights is not None:
+            weights = np.asarray(weights)[keep]
+        return cls(node_ids, src[keep], dst[keep], weights=weights, node_labels=node_labels)
+
+    @property
+    def n_nodes(self):
+        return len(self.node_ids)
+
+    @property
+    def n_edges(self):
+        return len(self.indices)
+
+    @property
+    def out_degree(self):
+        return np.diff(self.indptr)
+
+    @property
+    def in_degree(self):
+        return np.diff(self.rev_indptr)
+
+    @property
+    def degree(self):
+        return self.out_degree + self.in_degree
+
+    def index_of(self, ids):
+        """Kimlikleri yoğun indekslere çevir (bulunamayanlar için -1)"""
+        if self._sorted_ids is None:
+            self._sorted_order = np.argsort(self.node_ids, kind='stable')
+            self._sorted_ids = self.node_ids[self._sorted_order]
+        ids = np.asarray(ids)
+        scalar = ids.ndim == 0
+        ids = np.atleast_1d(ids)
+        if len(self._sorted_ids) == 0:
+            result = np.full(len(ids), -1, dtype=np.int32)
+        else:
+            pos = np.minimum(np.searchsorted(self._sorted_ids, ids), len(self._sorted_ids) - 1)
+            found = self._sorted_ids[pos] == ids
+            result = np.where(found, self._sorted_order[pos], -1).astype(np.int32)
+        return int(result[0]) if scalar else result
+
+    def successors(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def predecessors(self, node):
+        return self.rev_indices[self.rev_indptr[node]:self.rev_indptr[node + 1]]
+
+    def neighborhood(self, node, hops=2, direction='both', max_nodes=None):
+        """
+        node etrafındaki k-adımlı giriş/çıkış komşuluğu (seviye seviye BFS).
+
+        Her adımda sınırdaki düğümlerin komşuları indptr dilimlerinden tek
+        seferde toplanır; ziyaret kümesi boolean maskedir. 'out' kenar
+        yönünde (alıcılar), 'in' ters yönde (gönderenler) ilerler, 'both'
+        ikisinin birleşimidir. max_nodes aşılacaksa düğümler keşif sırasına
+        göre kesilir.
+
+        Returns:
+            (nodes, hops, sides, truncated): Düğüm indeksleri, merkeze uzaklık,
+            yön (0 merkez, 1 giriş, 2 çıkış) ve kesilip kesilmediği
+        """
+        if direction not in ('in', 'out', 'both'):
+            raise ValueError(f"Geçersiz yön: {direction}")
+        visited = np.zeros(self.n_nodes, dtype=bool)
+        visited[node] = True
+        nodes = [np.array([node], dtype=np.int64)]
+        distances, sides = [np.zeros(1, dtype=np.int64)], [np.zeros(1, dtype=np.int64)]
+        n_found, truncated = 1, False
+
+        # (yön kodu, indptr, indices, sınır)
+        frontiers = []
+        if direction in ('out', 'both'):
+            frontiers.append([2, self.indptr, self.indices, nodes[0]])
+        if direction in ('in', 'both'):
+            frontiers.append([1, self.rev_indptr, self.rev_indices, nodes[0]])
+
+        for hop in range(1, hops + 1):
+            for frontier in frontiers:
+                side, indptr, indices, current = frontier
+                if not len(current) or truncated:
+                    continue
+                found = _gather(indptr, indices, current)
+                found = found[~visited[found]]
+                # Keşif sırasını koruyarak tekrarları at
+                _, first = np.unique(found, return_index=True)
+                found = found[np.sort(first)].astype(np.int64)
+                if max_nodes is not None and n_found + len(found) > max_nodes:
+                    found = found[:max(0, max_nodes - n_found)]
+                    truncated = True
+                visited[found] = True
+                n_found += len(found)
+                nodes.append(found)
+                distances.append(np.full(len(found), hop, dtype=np.int64))
+                sides.append(np.full(len(found), side, dtype=np.int64))
+                frontier[3] = found
+            if truncated or not any(len(frontier[3]) for frontier in frontiers):
+                break
+
+        return np.concatenate(nodes), np.concatenate(distances), np.concatenate(sides), truncated
+
+    def top_degree(self, n=5):
+        """En yüksek dereceli n düğümü (kimlik, derece) olarak döndür"""
+        degree = self.degree
+        n = min(n, self.n_nodes)
+        if n == 0:
+            return []
+        top = np.argpartition(-degree, n - 1)[:n]
+        top = top[np.lexsort((top, -degree[top]))]
+        return [(self.node_ids[i].item(), int(degree[i])) for i in top]
+
+    def induced_edges(self, nodes):
+        """Verilen düğüm kümesi içinde kalan kenarların numaralarını döndür"""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        mask = np.zeros(self.n_nodes, dtype=bool)
+        mask[nodes] = True
+        # Yalnızca seçili düğümlerin çıkan kenar dilimleri taranır
+        edges = _slice_positions(self.indptr, nodes)
+        return np.sort(edges[mask[self.dst[edges]]])
+
+    def to_networkx(self, nodes=None, node_attrs=None):
+        """
+        Grafın tamamını ya da verilen düğümlerin oluşturduğu alt grafı
+        networkx.DiGraph'a çevir. Düğüm anahtarları gerçek kimliklerdir.
+
+        Args:
+            nodes: Yoğun düğüm indeksleri (None ise tüm graf)
+            node_attrs: indeks -> öznitelik sözlüğü döndüren fonksiyon
+        """
+        if nodes is None:
+            nodes = np.arange(self.n_nodes)
+            edge_ids = np.arange(self.n_edges)
+        else:
+            nodes = np.asarray(nodes, dtype=np.int64)
+            edge_ids = self.induced_edges(nodes)
+
+        G = nx.DiGraph()
+        ids = self.node_ids
+        if node_attrs is None:
+            G.add_nodes_from(ids[nodes].tolist())
+        else:
+            G.add_nodes_from((ids[i].item(), node_attrs(i)) for i in nodes.tolist())
+
+        sources = ids[self.src[edge_ids]].tolist()
+        targets = ids[self.dst[edge_ids]].tolist()
+        weights = [1.0] * len(edge_ids) if self.weights is None else self.weights[edge_ids].tolist()
+        G.add_edges_from(
+            (u, v, {'weight': w, 'timestamp': 0}) for u, v, w in zip(sources, targets, weights)
+        )
+        return G
+
+def _slice_positions(indptr, nodes):
+    """Verilen düğümlerin indptr[u]:indptr[u+1] dilimlerindeki konumları tek dizide birleştir"""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    # Her dilimin çıktıdaki başlangıcı ile kaynaktaki başlangıcı arasındaki fark
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return offsets + np.arange(offsets.size)
+
+def _gather(indptr, indices, nodes):
+    """Verilen düğümlerin komşuluk dilimlerini tek dizide birleştir"""
+    return indices[_slice_positions(indptr, nodes)]
+
+def scipy_adjacency(G, weight="weight"):
+    """
+    networkx grafını (düğüm listesi, scipy CSR komşuluk matrisi) olarak döndür.
+
+    weight=None ise tüm kenarlar 1'dir; aksi halde eksik ağırlıklar 0 sayılır
+    ve sıfır ağırlıklı kenarlar matriste açık girdi olarak korunur.
+    """
+    nodes = list(G.nodes())
+    position = {node: i for i, node in enumerate(nodes)}
+    edges = list(G.edges(data=weight, default=0.0)) if weight is not None else [(u, v, 1.0) for u, v in G.edges()]
+    src = np.fromiter((position[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((position[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    weights = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+    return nodes, sparse.csr_array((weights, (src, dst)), shape=(len(nodes), len(nodes)))
+
+def elliptic_node_attrs(labels):
+    """Elliptic sınıf dizisinden networkx düğüm özniteliği üreten fonksiyon döndür"""
+    def attrs(i):
+        class_val = int(labels[i])
+        return {
+            'class_value': class_val,
+            'is_illicit': class_val == 1,
+            'is_licit': class_val == 0,
+            'is_unknown': class_val == -1,
+            'type': 'transaction'
+        }
+    return attrs
+
+def build_elliptic_graph(dataset):
+    """
+    Elliptic veri setinin tamamından CSRGraph oluştur.
+
+    Düğüm sırası features çerçevesinin satır sırasıyla aynıdır; compact modda
+    yüklenen veri setinde hazır edge_src/edge_dst indeksleri kullanılır.
+    """
+    features = dataset.features
+    node_ids = features['txId'].to_numpy(dtype=np.int64)
+    labels = features['class'].to_numpy(dtype=np.int8)
+
+    edge_src = getattr(dataset, 'edge_src', None)
+    edge_dst = getattr(dataset, 'edge_dst', None)
+    if edge_src is not None and edge_dst is not None:
+        keep = (edge_src >= 0) & (edge_dst >= 0)
+        return CSRGraph(node_ids, edge_src[keep], edge_dst[keep], node_labels=labels)
+
+    edges = dataset.edges
+    return CSRGraph.from_id_edges(
+        node_ids,
+        edges.iloc[:, 0].to_numpy(dtype=np.int64),
+        edges.iloc[:, 1].to_numpy(dtype=np.int64),
+        node_labels=labels
+    )
+
+def class_distribution(graph):
+    """Elliptic grafındaki sınıf dağılımı"""
+    labels = graph.node_labels
+    return {
+        'illicit': int(np.count_nonzero(labels == 1)),
+        'licit': int(np.count_nonzero(labels == 0)),
+        'unknown': int(np.count_nonzero(labels == -1))
+    }
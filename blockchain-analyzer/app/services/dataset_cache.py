@@ -0,0 +1,209 @@
+import json
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+# Önbellek biçimi değiştiğinde artırılır, eski önbellekler geçersiz sayılır
+CACHE_FORMAT_VERSION = 2
+CACHE_DIRNAME = '.cache'
+
+SOURCE_FILES = (
+    'elliptic_txs_features.csv',
+    'elliptic_txs_classes.csv',
+    'elliptic_txs_edgelist.csv'
+)
+
+# Önbellekteki dizi dosyaları
+ARRAY_FILES = {
+    'features': 'features_f32.npy',     # Ölçeklenmiş öznitelik matrisi (float32)
+    'txid': 'txid_i64.npy',             # features satırlarının txId değerleri
+    'label': 'class_i8.npy',            # features satırlarının sınıfları (1, 0, -1)
+    'time_step': 'time_step_i32.npy',   # features satırlarının zaman adımları
+    'classes_txid': 'classes_txid_i64.npy',
+    'classes_label': 'classes_class_i8.npy',
+    'edges': 'edges_i64.npy',           # (kenar sayısı, 2) txId çiftleri
+    'edge_src': 'edge_src_i32.npy',     # Kenar kaynaklarının features satır indeksleri
+    'edge_dst': 'edge_dst_i32.npy'      # Kenar hedeflerinin features satır indeksleri
+}
+META_FILE = 'meta.json'
+
+def get_cache_dir(data_dir):
+    return os.path.join(data_dir, CACHE_DIRNAME)
+
+def source_fingerprint(data_dir):
+    """Kaynak CSV dosyalarının boyut ve mtime bilgisinden parmak izi oluştur"""
+    fingerprint = {'format': CACHE_FORMAT_VERSION, 'files': {}}
+    for name in SOURCE_FILES:
+        stat = os.stat(os.path.join(data_dir, name))
+        fingerprint['files'][name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    return fingerprint
+
+def _read_meta(cache_dir):
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def is_cache_valid(data_dir):
+    """Önbellek mevcut ve kaynak dosyalarla uyumlu mu?"""
+    cache_dir = get_cache_dir(data_dir)
+    meta = _read_meta(cache_dir)
+    if meta is None:
+        return False
+    try:
+        fingerprint = source_fingerprint(data_dir)
+    except OSError:
+        return False
+    if meta.get('fingerprint') != fingerprint:
+        return False
+    return all(os.path.exists(os.path.join(cache_dir, f)) for f in ARRAY_FILES.values())
+
+def _save_array(cache_dir, key, array):
+    # Önce geçici dosyaya yaz, sonra atomik olarak yerine koy
+    path = os.path.join(cache_dir, ARRAY_FILES[key])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(tmp_path, path)
+
+def write_cache(loader, fingerprint=None):
+    """
+    Hazırlanmış (birleştirilmiş ve ölçeklenmiş) veri setini ikili biçimde kaydet.
+
+    Args:
+        loader: compact modda load_data() çağrılmış EllipticDatasetLoader örneği
+        fingerprint: Kaynak dosyaların parmak izi (verilmezse hesaplanır)
+
+    Returns:
+        str: Önbellek dizini
+    """
+    data_dir = loader.data_dir
+    cache_dir = get_cache_dir(data_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    if fingerprint is None:
+        fingerprint = source_fingerprint(data_dir)
+
+    features = loader.features
+    feature_cols = loader.feature_columns
+    edge_cols = loader.edges.columns[:2].tolist()
+    class_cols = loader.classes.columns[:2].tolist()
+
+    # Meta dosyası en son yazılır; yarım kalmış bir yazım geçersiz sayılır
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    _save_array(cache_dir, 'features', features[feature_cols].to_numpy(dtype=np.float32))
+    _save_array(cache_dir, 'txid', features['txId'].to_numpy(dtype=np.int64))
+    _save_array(cache_dir, 'label', features['class'].to_numpy(dtype=np.int8))
+    _save_array(cache_dir, 'time_step', features['time_step'].to_numpy(dtype=np.int32))
+    _save_array(cache_dir, 'classes_txid', loader.classes[class_cols[0]].to_numpy(dtype=np.int64))
+    _save_array(cache_dir, 'classes_label', loader.classes[class_cols[1]].to_numpy(dtype=np.int8))
+    _save_array(cache_dir, 'edges', loader.edges[edge_cols].to_numpy(dtype=np.int64))
+    _save_array(cache_dir, 'edge_src', loader.edge_src)
+    _save_array(cache_dir, 'edge_dst', loader.edge_dst)
+
+    scaler = loader.scaler
+    meta = {
+        'fingerprint': fingerprint,
+        'created_at': time.time(),
+        'feature_columns': [str(col) for col in feature_cols],
+        'edge_columns': [str(col) for col in edge_cols],
+        'class_columns': [str(col) for col in class_cols],
+        'scaler': {
+            'mean': scaler.mean_.tolist(),
+            'var': scaler.var_.tolist(),
+            'scale': scaler.scale_.tolist(),
+            'n_samples_seen': int(np.max(scaler.n_samples_seen_))
+        }
+    }
+    tmp_meta_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp_meta_path, meta_path)
+
+    print(f"İkili önbellek yazıldı: {cache_dir}")
+    return cache_dir
+
+def _restore_scaler(meta):
+    params = meta['scaler']
+    scaler = StandardScaler()
+    scaler.mean_ = np.asarray(params['mean'], dtype=np.float64)
+    scaler.var_ = np.asarray(params['var'], dtype=np.float64)
+    scaler.scale_ = np.asarray(params['scale'], dtype=np.float64)
+    scaler.n_samples_seen_ = params['n_samples_seen']
+    scaler.n_features_in_ = len(params['mean'])
+    scaler.feature_names_in_ = np.asarray(meta['feature_columns'], dtype=object)
+    return scaler
+
+def load_cache(data_dir):
+    """
+    İkili önbelleği bellek eşlemeli (mmap) olarak yükle.
+
+    Diziler salt okunur eşlenir; aynı önbelleği açan tüm işçi süreçleri
+    işletim sisteminin sayfa önbelleğini paylaşır.
+
+    Returns:
+        dict: features, edges, classes çerçeveleri, edge_src/edge_dst
+        indeks dizileri ve scaler; önbellek geçersizse None
+    """
+    if not is_cache_valid(data_dir):
+        return None
+
+    cache_dir = get_cache_dir(data_dir)
+    meta = _read_meta(cache_dir)
+    arrays = {
+        key: np.load(os.path.join(cache_dir, filename), mmap_mode='r')
+        for key, filename in ARRAY_FILES.items()
+    }
+
+    # copy=False: öznitelik bloğu mmap üzerinde kalır, kopyalanmaz
+    features = pd.DataFrame(arrays['features'], columns=meta['feature_columns'], copy=False)
+    features.insert(0, 'txId', arrays['txid'])
+    features['class'] = arrays['label']
+    features['time_step'] = arrays['time_step']
+
+    edge_cols = meta['edge_columns']
+    edges = pd.DataFrame({
+        edge_cols[0]: arrays['edges'][:, 0],
+        edge_cols[1]: arrays['edges'][:, 1]
+    })
+
+    class_cols = meta['class_columns']
+    classes = pd.DataFrame({
+        class_cols[0]: arrays['classes_txid'],
+        class_cols[1]: arrays['classes_label']
+    })
+
+    return {
+        'features': features,
+        'edges': edges,
+        'classes': classes,
+        'edge_src': arrays['edge_src'],
+        'edge_dst': arrays['edge_dst'],
+        'scaler': _restore_scaler(meta)
+    }
+
+def build_cache(data_dir):
+    """CSV dosyalarını okuyup ikili önbelleği (yeniden) oluştur"""
+    from .dataset_loader import EllipticDatasetLoader
+
+    loader = EllipticDatasetLoader(data_dir=data_dir, use_cache=False)
+    fingerprint = source_fingerprint(data_dir)
+    loader.load_data()
+    return write_cache(loader, fingerprint)
+
+if __name__ == "__main__":
+    # Kullanım: python -m app.services.dataset_cache [veri_seti_dizini]
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else './elliptic_bitcoin_dataset'
+    start_time = time.time()
+    build_cache(target_dir)
+    print(f"Önbellek {time.time() - start_time:.2f} sn içinde oluşturuldu")
@@ -3,14 +3,28 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 import os
+from .dataset_cache import load_cache, write_cache, source_fingerprint
+
+# features çerçevesinde öznitelik olarak kullanılmayan sütunlar
+META_COLUMNS = ['txId', 'class', 'time_step']
 
 class EllipticDatasetLoader:
-    def __init__(self, data_dir='./elliptic_bitcoin_dataset'):
+    def __init__(self, data_dir='./elliptic_bitcoin_dataset', use_cache=True, compact=True):
         self.data_dir = data_dir
+        self.compact = compact      # Bellek dostu tipler (float32 öznitelik, int8 sınıf...)
+        self.use_cache = use_cache  # İkili (mmap) önbelleği kullan/oluştur (yalnızca compact modda)
         self.features = None
         self.edges = None
         self.classes = None
+        self.edge_src = None  # Kenar kaynaklarının features içindeki satır indeksleri (int32, yoksa -1)
+        self.edge_dst = None  # Kenar hedeflerinin features içindeki satır indeksleri (int32, yoksa -1)
+        self.memory_footprint = None
         self.scaler = StandardScaler()
+    
+    @property
+    def feature_columns(self):
+        """Model girdisi olarak kullanılan öznitelik sütunları"""
+        return [col for col in self.features.columns if col not in META_COLUMNS]
         
     def _convert_df_types(self, df):
         """
@@ -26,6 +40,74 @@ class EllipticDatasetLoader:
                 # Convert object to string
                 df[col] = df[col].astype(str)
         return df
+    
+    def _frames_memory(self):
+        """Yüklü çerçevelerin bellek kullanımını (byte) döndür"""
+        footprint = {
+            'features': int(self.features.memory_usage(deep=True).sum()),
+            'edges': int(self.edges.memory_usage(deep=True).sum()),
+            'classes': int(self.classes.memory_usage(deep=True).sum())
+        }
+        if self.edge_src is not None:
+            footprint['edge_index'] = int(self.edge_src.nbytes + self.edge_dst.nbytes)
+        footprint['total'] = sum(footprint.values())
+        return footprint
+    
+    def _build_edge_index(self):
+        """Kenar listesindeki txId'leri features satır indekslerine (int32) çevir"""
+        txids = self.features['txId'].to_numpy(dtype=np.int64)
+        order = np.argsort(txids, kind='stable')
+        sorted_txids = txids[order]
+        
+        def lookup(values):
+            if len(sorted_txids) == 0:
+                return np.full(len(values), -1, dtype=np.int32)
+            pos = np.searchsorted(sorted_txids, values)
+            pos = np.minimum(pos, len(sorted_txids) - 1)
+            found = sorted_txids[pos] == values
+            return np.where(found, order[pos], -1).astype(np.int32)
+        
+        edge_cols = self.edges.columns[:2]
+        return (lookup(self.edges[edge_cols[0]].to_numpy(dtype=np.int64)),
+                lookup(self.edges[edge_cols[1]].to_numpy(dtype=np.int64)))
+    
+    def _compact_df_types(self):
+        """
+        Çerçeveleri bellek dostu tiplere çevir:
+        txId int64, class int8, öznitelikler float32, time_step int32 ve
+        kenar listesi için iki int32 satır indeksi dizisi.
+        """
+        before = self._frames_memory()
+        
+        feature_cols = self.feature_columns
+        # Elliptic düzeninde txId'den sonraki ilk sütun zaman adımıdır; ölçeklenmiş değerden geri hesaplanır
+        time_col = feature_cols[0]
+        time_step = np.rint(
+            self.features[time_col].to_numpy(dtype=np.float64) * self.scaler.scale_[0] + self.scaler.mean_[0]
+        ).astype(np.int32)
+        
+        # Tüm öznitelikler tek seferde float32 matrise çevrilir (sütun sütun değil)
+        matrix = self.features[feature_cols].to_numpy(dtype=np.float32)
+        compact = pd.DataFrame(matrix, columns=feature_cols, copy=False)
+        compact.insert(0, 'txId', self.features['txId'].to_numpy(dtype=np.int64))
+        compact['class'] = self.features['class'].to_numpy(dtype=np.int8)
+        compact['time_step'] = time_step
+        self.features = compact
+        
+        edge_cols = self.edges.columns[:2]
+        self.edges = pd.DataFrame({col: self.edges[col].to_numpy(dtype=np.int64) for col in edge_cols})
+        
+        class_cols = self.classes.columns[:2]
+        self.classes = pd.DataFrame({
+            class_cols[0]: self.classes[class_cols[0]].to_numpy(dtype=np.int64),
+            class_cols[1]: self.classes[class_cols[1]].to_numpy(dtype=np.int8)
+        })
+        
+        self.edge_src, self.edge_dst = self._build_edge_index()
+        
+        after = self._frames_memory()
+        self.memory_footprint = {'before': before, 'after': after}
+        print(f"Bellek kullanımı: {before['total'] / 2**20:.1f} MB -> {after['total'] / 2**20:.1f} MB")
         
     def load_data(self):
         """Veri setini yükle ve hazırla"""
@@ -56,6 +138,23 @@ class EllipticDatasetLoader:
             print(error_msg)
             raise FileNotFoundError(error_msg)
         
+        # Geçerli bir ikili önbellek varsa CSV'leri hiç okumadan yükle
+        if self.use_cache and self.compact:
+            cached = load_cache(self.data_dir)
+            if cached is not None:
+                self.features = cached['features']
+                self.edges = cached['edges']
+                self.classes = cached['classes']
+                self.edge_src = cached['edge_src']
+                self.edge_dst = cached['edge_dst']
+                self.scaler = cached['scaler']
+                self.memory_footprint = {'after': self._frames_memory()}
+                print(f"Veri seti ikili önbellekten yüklendi: {self.features.shape}")
+                return self.features, self.edges, self.classes
+        
+        # Parmak izi okumadan önce alınır; okuma sırasında dosya değişirse önbellek bir sonraki yüklemede yenilenir
+        fingerprint = source_fingerprint(self.data_dir)
+        
         # CSV dosyalarını oku
         # İlk satırı okuyarak sütun başlıklarını kontrol et
         with open(features_path, 'r') as f:
@@ -100,10 +199,20 @@ class EllipticDatasetLoader:
         # Verileri birleştir
         self._prepare_data()
         
-        # Ensure proper type conversion before returning
-        self.features = self._convert_df_types(self.features)
-        self.edges = self._convert_df_types(self.edges)
-        self.classes = self._convert_df_types(self.classes)
+        if self.compact:
+            self._compact_df_types()
+        else:
+            # Ensure proper type conversion before returning
+            self.features = self._convert_df_types(self.features)
+            self.edges = self._convert_df_types(self.edges)
+            self.classes = self._convert_df_types(self.classes)
+        
+        # Sonraki yüklemeler için ikili önbelleği yaz
+        if self.use_cache and self.compact:
+            try:
+                write_cache(self, fingerprint)
+            except OSError as e:
+                print(f"İkili önbellek yazılamadı: {e}")
         
         return self.features, self.edges, self.classes
     
@@ -149,7 +258,7 @@ class EllipticDatasetLoader:
         
         # Sınıf etiketlerini düzenle (1: dolandırıcılık, 0: meşru)
         # Elliptic verisetinde 1=illicit, 2=licit, unknown=sınıflandırılmamış
-        if self.classes[class_column].dtype == object:
+        if not pd.api.types.is_numeric_dtype(self.classes[class_column]):
             # Eğer string ise
             self.classes[class_column] = self.classes[class_column].map({'2': 0, '1': 1, 'unknown': -1})
         else:
@@ -193,7 +302,7 @@ class EllipticDatasetLoader:
         # Sadece etiketlenmiş verileri kullan (class != -1)
         labeled_data = self.features[self.features['class'] != -1]
         
-        X = labeled_data.drop(['txId', 'class'], axis=1)
+        X = labeled_data[self.feature_columns]
         y = labeled_data['class']
         
         return train_test_split(X, y, test_size=test_size, random_state=random_state)
@@ -201,7 +310,7 @@ class EllipticDatasetLoader:
     def get_graph_data(self):
         """Graf verilerini hazırla"""
         # Düğüm özellikleri
-        node_features = self.features.drop(['txId', 'class'], axis=1)
+        node_features = self.features[self.feature_columns]
         node_labels = self.features['class']
         
         # Kenar listesi düzenle
@@ -222,7 +331,7 @@ class EllipticDatasetLoader:
         # Sadece meşru işlemleri kullan (class == 0)
         normal_data = self.features[self.features['class'] == 0]
         
-        X = normal_data.drop(['txId', 'class'], axis=1)
+        X = normal_data[self.feature_columns]
         
         return X
     
@@ -238,7 +347,7 @@ class EllipticDatasetLoader:
             'fraud_transactions': len(self.features[self.features['class'] == 1]),
             'legitimate_transactions': len(self.features[self.features['class'] == 0]),
             'total_edges': len(self.edges) if self.edges is not None else 0,
-            'feature_count': len(self.features.columns) - 2  # txId ve class hariç
+            'feature_count': len(self.feature_columns)  # txId, class ve time_step hariç
         }
         
         return stats
\ No newline at end of file
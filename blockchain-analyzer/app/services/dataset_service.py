@@ -0,0 +1,181 @@
+import hashlib
+import os
+import threading
+import time
+from .dataset_loader import EllipticDatasetLoader
+
+# Veri setini oluşturan kaynak dosyalar
+ELLIPTIC_FILES = (
+    'elliptic_txs_features.csv',
+    'elliptic_txs_classes.csv',
+    'elliptic_txs_edgelist.csv'
+)
+
+class EllipticDataset:
+    """
+    Belleğe yüklenmiş Elliptic veri setinin paylaşılan görünümü.
+
+    Aynı nesne tüm isteklere verilir; features/edges/classes çerçeveleri
+    salt okunur kabul edilmelidir. Değişiklik gerekiyorsa önce .copy() alınmalı.
+    """
+    def __init__(self, loader, signature, load_seconds):
+        self._loader = loader
+        self.signature = signature
+        self.version = hashlib.md5(repr(signature).encode('utf-8')).hexdigest()[:16]
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self._derived = {}
+        self._derived_locks = {}
+        self._derived_guard = threading.Lock()
+
+    @property
+    def data_dir(self):
+        return self._loader.data_dir
+
+    @property
+    def features(self):
+        return self._loader.features
+
+    @property
+    def edges(self):
+        return self._loader.edges
+
+    @property
+    def classes(self):
+        return self._loader.classes
+
+    @property
+    def scaler(self):
+        return self._loader.scaler
+
+    @property
+    def edge_src(self):
+        return self._loader.edge_src
+
+    @property
+    def edge_dst(self):
+        return self._loader.edge_dst
+
+    @property
+    def feature_columns(self):
+        return self._loader.feature_columns
+
+    @property
+    def memory_footprint(self):
+        return self._loader.memory_footprint
+
+    def get_statistics(self):
+        return self._loader.get_statistics()
+
+    def derived(self, key, factory):
+        """
+        Veri setinden türetilen bir nesneyi (graf, istatistik, skor...) bu
+        sürüm için yalnızca bir kez hesapla. Veri seti yeniden yüklendiğinde
+        yeni EllipticDataset nesnesi oluştuğundan türetilenler de yenilenir.
+        """
+        if key in self._derived:
+            return self._derived[key]
+        with self._derived_guard:
+            lock = self._derived_locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._derived:
+                self._derived[key] = factory(self)
+            return self._derived[key]
+
+    def info(self):
+        """Yükleme bilgilerini döndür"""
+        return {
+            'data_dir': self.data_dir,
+            'version': self.version,
+            'load_seconds': round(self.load_seconds, 3),
+            'loaded_at': self.loaded_at
+        }
+
+class EllipticDatasetService:
+    """
+    Elliptic veri setini süreç boyunca bir kez yükleyip bellekte tutan servis.
+
+    Her erişimde kaynak CSV dosyalarının mtime/boyut bilgisi kontrol edilir;
+    dosyalar değiştiyse veri seti yeniden yüklenir, değişmediyse bellekteki
+    kopya döndürülür. Yükleme kilit altında yapılır, böylece eşzamanlı
+    istekler veri setini birden fazla kez yüklemez.
+    """
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._dataset = None
+
+    def _file_signature(self):
+        """Kaynak dosyaların (ad, mtime, boyut) imzasını döndür"""
+        signature = []
+        for name in ELLIPTIC_FILES:
+            path = os.path.join(self.data_dir, name)
+            try:
+                stat = os.stat(path)
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((name, None, None))
+        return tuple(signature)
+
+    def get(self):
+        """Güncel veri setini döndür, gerekirse (yeniden) yükle"""
+        signature = self._file_signature()
+        dataset = self._dataset
+        if dataset is not None and dataset.signature == signature:
+            return dataset
+
+        with self._lock:
+            # Kilit beklenirken başka bir istek yüklemiş olabilir
+            dataset = self._dataset
+            if dataset is not None and dataset.signature == signature:
+                return dataset
+
+            start_time = time.time()
+            loader = EllipticDatasetLoader(data_dir=self.data_dir)
+            loader.load_data()
+            dataset = EllipticDataset(loader, signature, time.time() - start_time)
+            print(f"Elliptic veri seti belleğe alındı ({dataset.load_seconds:.2f} sn)")
+
+            self._dataset = dataset
+            return dataset
+
+    def preload(self, background=True):
+        """Veri setini önceden yükle (varsayılan olarak arka planda)"""
+        def _load():
+            try:
+                self.get()
+            except Exception as e:
+                print(f"Elliptic veri seti önceden yüklenemedi: {e}")
+
+        if not background:
+            _load()
+            return None
+
+        thread = threading.Thread(target=_load, name='elliptic-preload', daemon=True)
+        thread.start()
+        return thread
+
+    def invalidate(self):
+        """Bellekteki veri setini bırak, bir sonraki erişimde yeniden yüklenir"""
+        with self._lock:
+            self._dataset = None
+
+    def is_loaded(self):
+        return self._dataset is not None
+
+_services = {}
+_services_lock = threading.Lock()
+
+def get_elliptic_service(data_dir):
+    """Verilen dizin için süreç genelinde tek servis örneğini döndür"""
+    key = os.path.abspath(data_dir)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = EllipticDatasetService(key)
+            _services[key] = service
+        return service
+
+def get_elliptic_dataset(data_dir):
+    """Paylaşılan Elliptic veri setini döndür"""
+    return get_elliptic_service(data_dir).get()
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import threading
+import pandas as pd
+
+class FeatureStore:
+    """
+    Adres bazlı öznitelik matrisini veri sürümü başına bir kez hesaplayıp saklar.
+
+    Veri sürümü, kaynak dosyanın yolu, boyutu ve mtime bilgisinden oluşan
+    parmak izidir; dosya değişmedikçe aynı matris bellekten (ve cache_dir
+    verildiyse diskten) döndürülür.
+    """
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._entries = {}  # kaynak yolu -> (parmak izi, öznitelik çerçevesi)
+
+    @staticmethod
+    def fingerprint(data_path):
+        """Kaynak dosyanın parmak izi (yol, boyut, mtime)"""
+        stat = os.stat(data_path)
+        key = f"{os.path.abspath(data_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, fingerprint):
+        return os.path.join(self.cache_dir, f"features_{fingerprint}.pkl")
+
+    def _load_from_disk(self, fingerprint):
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(fingerprint)
+        if not os.path.exists(path):
+            return None
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            print(f"Öznitelik önbelleği okunamadı: {e}")
+            return None
+
+    def _save_to_disk(self, fingerprint, features):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._disk_path(fingerprint)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            features.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Öznitelik önbelleği yazılamadı: {e}")
+
+    def get(self, data_path, compute):
+        """
+        data_path'in güncel sürümü için öznitelik matrisini döndür.
+
+        Parameters:
+        -----------
+        data_path : str
+            İşlem verilerinin kaynak dosyası
+        compute : callable
+            Önbellekte yoksa matrisi hesaplayan fonksiyon
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Paylaşılan öznitelik matrisi (değiştirilmeden önce kopyalanmalı)
+        """
+        key = os.path.abspath(data_path)
+        fingerprint = self.fingerprint(data_path)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1]
+
+            features = self._load_from_disk(fingerprint)
+            if features is None:
+                features = compute()
+                self._save_to_disk(fingerprint, features)
+
+            self._entries[key] = (fingerprint, features)
+            return features
+
+    def invalidate(self, data_path=None):
+        """Bellekteki kayıtları temizle"""
+        with self._lock:
+            if data_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(data_path), None)
+
+# Süreç genelinde paylaşılan depo; FEATURE_CACHE_DIR verilirse diske de yazar
+default_feature_store = FeatureStore(cache_dir=os.getenv("FEATURE_CACHE_DIR"))
@@ -0,0 +1,187 @@
+import numpy as np
+
+WEI_DECIMALS = 18
+WEI_PER_ETH = 10 ** WEI_DECIMALS
+
+# Her limb 18 ondalık basamak taşır; 36 basamağa kadar değerler vektörel ayrıştırılır
+LIMB_DIGITS = 18
+LIMB_BASE = 10 ** LIMB_DIGITS
+MAX_VECTOR_DIGITS = 2 * LIMB_DIGITS
+# Temsil edilebilen üst sınır (~9.2e36 wei, toplam ETH arzının çok üzerinde)
+MAX_VALUE = (2 ** 63) * LIMB_BASE
+
+_POW10 = 10 ** np.arange(LIMB_DIGITS, dtype=np.int64)
+_CHUNK_ROWS = 65536
+
+def _digits_to_int64(digits):
+    """(n, k<=18) basamak matrisini int64 değerlere çevir"""
+    return digits @ _POW10[digits.shape[1] - 1::-1]
+
+def _parse_chunk(chars):
+    """
+    Sabit genişlikli unicode dizisini (U<=36) iki int64 limb'e çevir.
+
+    Karakterler UCS-4 kod noktaları olarak okunur. Satırlar uzunluklarına
+    göre gruplanır; her grupta basamak matrisi sabit 10'un kuvvetleri
+    vektörüyle çarpılarak high ve low limb'ler hesaplanır.
+    """
+    n = len(chars)
+    width = chars.dtype.itemsize // 4
+    codes = chars.view(np.uint32).reshape(n, width)
+    # Numpy unicode dizileri sağdan NUL (0) ile doldurulur
+    lengths = np.count_nonzero(codes, axis=1)
+    # uint32 çıkarma '0' altındaki karakterlerde (ve NUL'da) taşar; geçerli
+    # satırlarda 0-9 aralığındaki karakter sayısı uzunluğa eşit olmalıdır
+    shifted = codes - 48
+    bad_rows = np.flatnonzero((np.count_nonzero(shifted <= 9, axis=1) != lengths) | (lengths == 0))
+    if len(bad_rows):
+        raise ValueError(f"Geçersiz tamsayı değeri: {chars[bad_rows[0]]!r}")
+    digits = shifted.astype(np.int8)
+
+    high = np.zeros(n, dtype=np.int64)
+    low = np.zeros(n, dtype=np.int64)
+    for length in np.unique(lengths):
+        rows = np.flatnonzero(lengths == length)
+        block = digits[rows, :length].astype(np.int64)
+        split = max(0, length - LIMB_DIGITS)
+        if split:
+            high[rows] = _digits_to_int64(block[:, :split])
+        low[rows] = _digits_to_int64(block[:, split:])
+    return high, low
+
+class FixedPointArray:
+    """
+    Büyük tamsayı değerler (wei) için iki limb'li sabit noktalı sütun.
+
+    Değer = high * 10**18 + low (0 <= low < 10**18). Wei için high tam ETH,
+    low kalan wei'dir. Toplamlar ve eşik karşılaştırmaları float'a
+    dönüştürülmeden, tam olarak ve NumPy hızında yapılır.
+    """
+    __slots__ = ('high', 'low')
+
+    def __init__(self, high, low):
+        self.high = high
+        self.low = low
+
+    @classmethod
+    def from_strings(cls, values):
+        """
+        Ondalık string (veya int) listesini vektörel olarak ayrıştır.
+
+        36 basamaktan uzun değerler satır bazında Python int ile ayrıştırılır;
+        MAX_VALUE'yu aşan veya negatif değerler ValueError yükseltir.
+        """
+        chars = np.asarray(values, dtype=str)
+        if chars.ndim != 1:
+            chars = chars.reshape(-1)
+        n = len(chars)
+        high = np.zeros(n, dtype=np.int64)
+        low = np.zeros(n, dtype=np.int64)
+        if n == 0:
+            return cls(high, low)
+
+        overflow_rows = None
+        if chars.dtype.itemsize // 4 > MAX_VECTOR_DIGITS:
+            overflow_rows = np.flatnonzero(np.char.str_len(chars) > MAX_VECTOR_DIGITS)
+            overflow_values = [int(chars[i]) for i in overflow_rows]
+            chars = chars.copy()
+            chars[overflow_rows] = '0'
+            chars = chars.astype(f'U{MAX_VECTOR_DIGITS}')
+
+        for start in range(0, n, _CHUNK_ROWS):
+            stop = start + _CHUNK_ROWS
+            high[start:stop], low[start:stop] = _parse_chunk(chars[start:stop])
+
+        if overflow_rows is not None:
+            for i, value in zip(overflow_rows, overflow_values):
+                if not 0 <= value < MAX_VALUE:
+                    raise ValueError(f"Değer sabit noktalı aralığın dışında: {value}")
+                high[i], low[i] = divmod(value, LIMB_BASE)
+        return cls(high, low)
+
+    def __len__(self):
+        return len(self.low)
+
+    def __getitem__(self, key):
+        return FixedPointArray(self.high[key], self.low[key])
+
+    def to_int(self, index):
+        """Tek bir değeri tam Python int olarak döndür"""
+        return int(self.high[index]) * LIMB_BASE + int(self.low[index])
+
+    def to_float(self, decimals=WEI_DECIMALS):
+        """10**decimals birimine ölçeklenmiş float64 değerler (ör. wei -> ETH)"""
+        if decimals == LIMB_DIGITS:
+            return self.high + self.low / float(LIMB_BASE)
+        return self.high * (float(LIMB_BASE) / 10.0 ** decimals) + self.low / 10.0 ** decimals
+
+    def sum(self):
+        """Tam toplam (Python int); ara toplamlar int64 taşmasın diye limb'ler 9 basamaklı parçalara bölünür"""
+        total = 0
+        for limb, scale in ((self.high, LIMB_BASE), (self.low, 1)):
+            upper, lower = np.divmod(limb, 10 ** 9)
+            total += (int(upper.sum()) * 10 ** 9 + int(lower.sum())) * scale
+        return total
+
+    def add_at(self, index, values):
+        """
+        values (FixedPointArray) değerlerini index konumlarına yerinde ve tam
+        olarak ekle; tekrar eden indeksler toplanır (np.add.at gibi).
+        """
+        targets, inverse = np.unique(index, return_inverse=True)
+        # low limb'ler 9 basamaklı parçalar halinde toplanır, int64 taşmaz
+        high = self.high[targets]
+        upper, lower = np.divmod(self.low[targets], 10 ** 9)
+        values_upper, values_lower = np.divmod(values.low, 10 ** 9)
+        np.add.at(high, inverse, values.high)
+        np.add.at(upper, inverse, values_upper)
+        np.add.at(lower, inverse, values_lower)
+        upper += lower // 10 ** 9
+        high += upper // 10 ** 9
+        self.high[targets] = high
+        self.low[targets] = (upper % 10 ** 9) * 10 ** 9 + lower % 10 ** 9
+
+    def greater_than(self, threshold):
+        """Değer > threshold maskesi (threshold taban birimde tam sayı, ör. wei)"""
+        threshold_high, threshold_low = divmod(int(threshold), LIMB_BASE)
+        return (self.high > threshold_high) | ((self.high == threshold_high) & (self.low > threshold_low))
+
+    def argsort(self, descending=False):
+        """Kararlı sıralama indeksleri; eşit değerler orijinal sırasını korur"""
+        if descending:
+            return np.lexsort((-self.low, -self.high))
+        return np.lexsort((self.low, self.high))
+
+    def top_k(self, k):
+        """
+        En büyük k değerin indeksleri; argsort(descending=True)[:k] ile aynı.
+
+        Tüm dizi sıralanmaz: float yaklaşığı üzerinde argpartition ile eşik
+        bulunur. Dönüşüm monoton olduğundan gerçek ilk k değer eşiğin
+        üstündeki adaylar arasındadır; yalnızca adaylar tam olarak sıralanır.
+        """
+        n = len(self)
+        if k >= n:
+            return self.argsort(descending=True)
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        approx = self.to_float()
+        threshold = approx[np.argpartition(approx, n - k)[n - k]]
+        candidates = np.flatnonzero(approx >= threshold)
+        order = np.lexsort((candidates, -self.low[candidates], -self.high[candidates]))
+        return candidates[order[:k]]
+
+    def iter_descending(self, initial=64):
+        """
+        İndeksleri büyükten küçüğe (eşitlikte orijinal sıra) üreten üreteç.
+
+        top_k ile parça parça ilerler ve her turda aday sayısını iki katına
+        çıkarır; tüketim erken bırakılırsa dizinin yalnızca gereken kısmı
+        sıralanmış olur.
+        """
+        k, consumed = max(1, initial), 0
+        while consumed < len(self):
+            order = self.top_k(k)
+            yield from order[consumed:].tolist()
+            consumed = len(order)
+            k *= 2
@@ -0,0 +1,290 @@
+import threading
+import networkx as nx
+import numpy as np
+import pandas as pd
+from .csr_graph import CSRGraph
+from .fixed_point import WEI_PER_ETH, FixedPointArray
+
+# Dizilerin başlangıç kapasitesi; dolduğunda iki katına çıkarılır
+INITIAL_CAPACITY = 1024
+
+_MAX_TIMESTAMP = np.iinfo(np.int64).max
+_MIN_TIMESTAMP = np.iinfo(np.int64).min
+
+def _grow(array, size):
+    """Diziyi en az size elemanlık olacak şekilde (iki katına) büyüt"""
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+def _present(column):
+    """Adres sütununda dolu satırların maskesi (None, NaN ve boş string geçersiz)"""
+    mask = np.asarray(pd.notna(column), dtype=bool)
+    mask[mask] = column[mask] != ''
+    return mask
+
+def _columns(transactions):
+    """İşlem listesi veya DataFrame'den from, to, value, timeStamp, hash sütunları"""
+    if isinstance(transactions, pd.DataFrame):
+        n = len(transactions)
+        return [
+            transactions[col].to_numpy(dtype=object) if col in transactions else np.full(n, None, dtype=object)
+            for col in ("from", "to", "value", "timeStamp", "hash")
+        ]
+    return [
+        np.array([tx.get(col) for tx in transactions], dtype=object)
+        for col in ("from", "to", "value", "timeStamp", "hash")
+    ]
+
+class GraphAccumulator:
+    """
+    İşlem partilerini artımlı olarak toplayan yönlü çoklu graf.
+
+    Aynı (gönderen, alıcı) çiftindeki paralel transferler tek kenarda
+    birleştirilir: işlem sayısı, tam (wei) toplam değer, ilk ve son zaman
+    damgası ile en son işlemin hash'i tutulur. Düğüm başına giriş/çıkış
+    derecesi (farklı karşı taraf sayısı), işlem sayıları ve hacimler de
+    sayaç olarak tutulur. add() yalnızca gelen partiyi işler; maliyeti
+    geçmişin değil partinin boyutuyla orantılıdır.
+
+    graph() ile istenen networkx grafı da saklanır ve sonraki add()
+    çağrılarında yalnızca partide değişen kenarlar güncellenir. Dışarıya
+    bu grafın dondurulmuş bir kopyası verilir; verilen graf sonraki add()
+    çağrılarıyla hiçbir zaman değişmez.
+    """
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self._lock = threading.Lock()
+        self.node_ids = []          # indeks -> adres (ilk görülme sırası)
+        self._node_index = {}       # adres -> indeks
+        self._edge_index = {}       # (kaynak << 32 | hedef) -> kenar indeksi
+        self.n_edges = 0
+        self.n_transactions = 0
+        self._graph = None          # add() ile güncellenen iç graf
+        self._snapshot = None       # graph() ile verilen dondurulmuş kopya
+
+        # Düğüm sayaçları
+        self._out_degree = np.zeros(capacity, dtype=np.int64)
+        self._in_degree = np.zeros(capacity, dtype=np.int64)
+        self._sent_count = np.zeros(capacity, dtype=np.int64)
+        self._received_count = np.zeros(capacity, dtype=np.int64)
+        self._out_volume = FixedPointArray(np.zeros(capacity, dtype=np.int64), np.zeros(capacity, dtype=np.int64))
+        self._in_volume = FixedPointArray(np.zeros(capacity, dtype=np.int64), np.zeros(capacity, dtype=np.int64))
+
+        # Kenar toplamları
+        self._src = np.zeros(capacity, dtype=np.int32)
+        self._dst = np.zeros(capacity, dtype=np.int32)
+        self._count = np.zeros(capacity, dtype=np.int64)
+        self._value = FixedPointArray(np.zeros(capacity, dtype=np.int64), np.zeros(capacity, dtype=np.int64))
+        self._first_timestamp = np.zeros(capacity, dtype=np.int64)
+        self._last_timestamp = np.zeros(capacity, dtype=np.int64)
+        self._hash = np.zeros(capacity, dtype=object)
+
+    @property
+    def n_nodes(self):
+        return len(self.node_ids)
+
+    def _reserve(self, n_nodes, n_edges):
+        """Düğüm ve kenar dizilerini gerekli boyuta büyüt"""
+        for name in ('_out_degree', '_in_degree', '_sent_count', '_received_count'):
+            setattr(self, name, _grow(getattr(self, name), n_nodes))
+        for name in ('_out_volume', '_in_volume'):
+            volume = getattr(self, name)
+            setattr(self, name, FixedPointArray(_grow(volume.high, n_nodes), _grow(volume.low, n_nodes)))
+        for name in ('_src', '_dst', '_count', '_first_timestamp', '_last_timestamp', '_hash'):
+            setattr(self, name, _grow(getattr(self, name), n_edges))
+        self._value = FixedPointArray(_grow(self._value.high, n_edges), _grow(self._value.low, n_edges))
+
+    def _intern(self, senders, receivers):
+        """Adresleri kalıcı düğüm indekslerine çevir; yeni adresler sona eklenir"""
+        n = len(senders)
+        # Gönderen ve alıcı işlem sırasıyla iç içe: düğüm sırası tek tek eklemeyle aynı olur
+        combined = np.empty(2 * n, dtype=object)
+        combined[0::2] = senders
+        combined[1::2] = receivers
+        codes, uniques = pd.factorize(combined)
+        ids = np.empty(len(uniques), dtype=np.int32)
+        for i, address in enumerate(uniques.tolist()):
+            node = self._node_index.get(address)
+            if node is None:
+                node = self._node_index[address] = len(self.node_ids)
+                self.node_ids.append(address)
+            ids[i] = node
+        ids = ids[codes]
+        return ids[0::2], ids[1::2]
+
+    def add(self, transactions):
+        """
+        Etherscan biçimindeki işlem partisini (dict listesi ya da string
+        sütunlu DataFrame) ekle. Göndereni veya alıcısı olmayan işlemler
+        (kontrat oluşturma) atlanır.
+
+        Returns:
+            int: Grafa eklenen işlem sayısı
+        """
+        senders, receivers, values, timestamps, hashes = _columns(transactions)
+        keep = _present(senders) & _present(receivers)
+        if not keep.any():
+            return 0
+        senders, receivers, hashes = senders[keep], receivers[keep], hashes[keep]
+        values = FixedPointArray.from_strings(values[keep])
+        timestamps = np.array(timestamps[keep], dtype=np.int64)
+        n = len(timestamps)
+
+        with self._lock:
+            n_old_nodes = self.n_nodes
+            src, dst = self._intern(senders, receivers)
+
+            # Partideki paralel transferleri grupla; gruplar ilk görülme sırasında
+            keys = (src.astype(np.int64) << 32) | dst.astype(np.int64)
+            unique_keys, first_index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            order = np.argsort(first_index, kind='stable')
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            unique_keys = unique_keys[order]
+            group = rank[inverse.ravel()]
+
+            # Grup başına ilk ve son işlem (zamana, eşitlikte parti sırasına göre)
+            by_time = np.lexsort((np.arange(n), timestamps, group))
+            sorted_group = group[by_time]
+            boundaries = np.flatnonzero(sorted_group[1:] != sorted_group[:-1]) + 1
+            first_tx = by_time[np.concatenate(([0], boundaries))]
+            last_tx = by_time[np.concatenate((boundaries - 1, [n - 1]))]
+
+            # Kenar indeksleri: bilinen çiftler güncellenir, yeniler sona eklenir
+            edge_ids = np.fromiter((self._edge_index.get(k, -1) for k in unique_keys.tolist()),
+                                   dtype=np.int64, count=len(unique_keys))
+            new = edge_ids < 0
+            new_ids = np.arange(self.n_edges, self.n_edges + np.count_nonzero(new))
+            edge_ids[new] = new_ids
+            self._edge_index.update(zip(unique_keys[new].tolist(), new_ids.tolist()))
+            self._reserve(self.n_nodes, self.n_edges + len(new_ids))
+            self.n_edges += len(new_ids)
+
+            self._src[new_ids] = unique_keys[new] >> 32
+            self._dst[new_ids] = unique_keys[new] & 0xFFFFFFFF
+            self._first_timestamp[new_ids] = _MAX_TIMESTAMP
+            self._last_timestamp[new_ids] = _MIN_TIMESTAMP
+            np.add.at(self._out_degree, self._src[new_ids], 1)
+            np.add.at(self._in_degree, self._dst[new_ids], 1)
+
+            self._count[edge_ids] += np.bincount(group, minlength=len(edge_ids))
+            self._value.add_at(edge_ids[group], values)
+            self._first_timestamp[edge_ids] = np.minimum(self._first_timestamp[edge_ids], timestamps[first_tx])
+            newer = timestamps[last_tx] >= self._last_timestamp[edge_ids]
+            self._last_timestamp[edge_ids[newer]] = timestamps[last_tx[newer]]
+            self._hash[edge_ids[newer]] = hashes[last_tx[newer]]
+
+            np.add.at(self._sent_count, src, 1)
+            np.add.at(self._received_count, dst, 1)
+            self._out_volume.add_at(src, values)
+            self._in_volume.add_at(dst, values)
+            self.n_transactions += n
+
+            if self._graph is not None:
+                if nx.is_frozen(self._graph):
+                    # İlk graph() çağrısında iç graf kopyalanmadan verilmişti
+                    self._graph = self._graph.copy()
+                # Yalnızca partide değişen kenarlar yazılır (mevcutların öznitelikleri güncellenir)
+                self._graph.add_nodes_from(self.node_ids[n_old_nodes:])
+                self._graph.add_edges_from(self.edges(edge_ids))
+            self._snapshot = None
+        return n
+
+    def edges(self, edge_ids=None):
+        """
+        Kenarları verilen sırada (kaynak, hedef, öznitelikler) listesi olarak
+        döndür; öznitelikler graph() ile aynıdır. edge_ids verilmezse tümü.
+        """
+        if edge_ids is None:
+            edge_ids = np.arange(self.n_edges)
+        edge_ids = np.asarray(edge_ids, dtype=np.int64)
+        ids = self.node_ids
+        return [
+            (ids[u], ids[v], {'weight': w, 'count': c, 'first_timestamp': f, 'timestamp': t, 'hash': h})
+            for u, v, w, c, f, t, h in zip(
+                self._src[edge_ids].tolist(), self._dst[edge_ids].tolist(),
+                self._value[edge_ids].to_float().tolist(), self._count[edge_ids].tolist(),
+                self._first_timestamp[edge_ids].tolist(), self._last_timestamp[edge_ids].tolist(),
+                self._hash[edge_ids].tolist()
+            )
+        ]
+
+    def graph(self):
+        """
+        Toplanmış grafı networkx.DiGraph olarak döndür.
+
+        Kenar öznitelikleri: weight (toplam ETH), count, first_timestamp,
+        timestamp (son işlem zamanı) ve hash (son işlem). Dönen graf
+        dondurulmuştur (nx.freeze) ve çağrı anındaki durumu gösterir;
+        sonraki add() çağrılarından etkilenmez. Kopya add() sonrası ilk
+        çağrıda bir kez alınır; tek seferlik yüklemede (ilk çağrı) iç graf
+        kopyalanmadan verilir.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                if self._graph is None:
+                    self._graph = nx.DiGraph()
+                    self._graph.add_nodes_from(self.node_ids)
+                    self._graph.add_edges_from(self.edges())
+                    self._snapshot = nx.freeze(self._graph)
+                else:
+                    self._snapshot = nx.freeze(self._graph.copy())
+            return self._snapshot
+
+    def to_csr(self):
+        """Toplam ETH ağırlıklı CSRGraph olarak döndür"""
+        with self._lock:
+            edges = slice(0, self.n_edges)
+            return CSRGraph(np.array(self.node_ids, dtype=object), self._src[edges], self._dst[edges],
+                            weights=self._value[edges].to_float())
+
+    @property
+    def src(self):
+        """Kenar kaynaklarının düğüm indeksleri"""
+        return self._src[:self.n_edges]
+
+    @property
+    def dst(self):
+        """Kenar hedeflerinin düğüm indeksleri"""
+        return self._dst[:self.n_edges]
+
+    @property
+    def edge_value(self):
+        """Kenar başına tam toplam değer (wei, FixedPointArray)"""
+        return self._value[:self.n_edges]
+
+    @property
+    def out_degree(self):
+        return self._out_degree[:self.n_nodes]
+
+    @property
+    def in_degree(self):
+        return self._in_degree[:self.n_nodes]
+
+    @property
+    def degree(self):
+        return self.out_degree + self.in_degree
+
+    @property
+    def sent_count(self):
+        return self._sent_count[:self.n_nodes]
+
+    @property
+    def received_count(self):
+        return self._received_count[:self.n_nodes]
+
+    @property
+    def out_volume(self):
+        """Düğüm başına gönderilen toplam ETH"""
+        return self._out_volume[:self.n_nodes].to_float()
+
+    @property
+    def in_volume(self):
+        """Düğüm başına alınan toplam ETH"""
+        return self._in_volume[:self.n_nodes].to_float()
+
+    def total_volume(self):
+        """Tüm işlemlerin tam toplamı (ETH)"""
+        return self._value[:self.n_edges].sum() / WEI_PER_ETH
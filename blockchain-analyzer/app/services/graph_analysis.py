@@ -1,49 +1,71 @@
-import json
+import time
 import networkx as nx
-from collections import defaultdict
 import numpy as np
 from datetime import datetime
+from scipy.sparse.csgraph import dijkstra
+from .centrality import top_betweenness
+from .communities import COMMUNITY_SEED, DEFAULT_COMMUNITY_METHOD, community_labels, labels_to_communities
+from .csr_graph import build_elliptic_graph, elliptic_node_attrs, scipy_adjacency
+from .fixed_point import FixedPointArray
+from .graph_accumulator import GraphAccumulator
+from .temporal import DEFAULT_RESOLUTION, TemporalIndex, temporal_summary
+from app.utils.tx_io import iter_chunks
+
+# Graf için okunan işlem alanları
+GRAPH_COLUMNS = ['hash', 'from', 'to', 'value', 'timeStamp']
+
+# Komşuluk çıkarımı varsayılanları: adım sayısı ve yanıttaki en fazla düğüm
+NEIGHBORHOOD_HOPS = 2
+NEIGHBORHOOD_MAX_NODES = 500
 
 def load_graph_from_json(filepath):
-    with open(filepath, "r", encoding="utf-8") as f:
-        transactions = json.load(f)
+    """
+    İşlem dosyasından (JSON dizisi, NDJSON veya Parquet) yönlü graf oluştur.
 
-    G = nx.DiGraph()
-    for tx in transactions:
-        sender = tx["from"]
-        receiver = tx["to"]
-        value = int(tx["value"]) / 1e18
-        timestamp = int(tx["timeStamp"])
-        if sender and receiver:
-            G.add_edge(sender, receiver, 
-                      weight=value,
-                      timestamp=timestamp,
-                      hash=tx["hash"])
-    return G
+    İşlemler parçalar halinde GraphAccumulator'a eklenir; aynı çiftteki
+    paralel transferler tek kenarda toplanır (weight toplam ETH, count
+    işlem sayısı, timestamp/hash son işlem).
+    """
+    accumulator = GraphAccumulator()
+    for chunk in iter_chunks(filepath, columns=GRAPH_COLUMNS):
+        accumulator.add(chunk)
+    return accumulator.graph()
 
-def create_graph_from_transactions(transactions, max_nodes=50):
+def create_graph_from_transactions(transactions, max_nodes=50, aggregate=False):
     """
     Etherscan API'den alınan işlemlerden işlem ağı oluştur.
     
+    İşlemler değere göre azalan sırada eklenir ve max_nodes adrese
+    ulaşınca durulur. Liste tümüyle sıralanmaz; en büyük değerler
+    FixedPointArray.iter_descending ile gerektiği kadar seçilir, böylece
+    maliyet geçmişin uzunluğuna değil çıktının boyutuna bağlı kalır.
+    
     Args:
         transactions: Etherscan API'den alınan işlemler listesi
         max_nodes: Ağdaki maksimum düğüm sayısı (kısıtlamak için)
+        aggregate: True ise işlemler (gönderen, alıcı) çiftine göre toplanır
+            ve toplam değeri en yüksek karşı taraflar seçilir
         
     Returns:
         nx.DiGraph: İşlem ağını temsil eden yönlü graf
     """
+    if aggregate:
+        return _create_counterparty_graph(transactions, max_nodes)
+
     G = nx.DiGraph()
     
-    # İşlemleri ağırlıklarına göre sırala
-    sorted_txs = sorted(transactions, key=lambda tx: int(tx.get("value", 0)), reverse=True)
+    # İşlemleri ağırlıklarına göre seç (wei değerleri tam karşılaştırılır)
+    values = FixedPointArray.from_strings([tx.get("value", 0) for tx in transactions])
+    values_eth = values.to_float()
     
     # Adresleri ve bağlantıları takip et
     nodes = set()
     
-    for tx in sorted_txs:
+    for idx in values.iter_descending(initial=max_nodes):
+        tx = transactions[idx]
         sender = tx.get("from")
         receiver = tx.get("to")
-        value = int(tx.get("value", 0)) / 1e18
+        value = float(values_eth[idx])
         timestamp = int(tx.get("timeStamp", 0))
         
         if not sender or not receiver:
@@ -58,11 +80,22 @@ def create_graph_from_transactions(transactions, max_nodes=50):
             nodes.add(receiver)
             G.add_node(receiver, type="receiver")
             
-        # Kenarı ekle
-        G.add_edge(sender, receiver, 
-                  weight=value,
-                  timestamp=timestamp,
-                  hash=tx.get("hash", ""))
+        # Kenarı ekle; aynı çiftteki paralel transferler tek kenarda toplanır
+        if G.has_edge(sender, receiver):
+            edge = G[sender][receiver]
+            edge["weight"] += value
+            edge["count"] += 1
+            edge["first_timestamp"] = min(edge["first_timestamp"], timestamp)
+            if timestamp >= edge["timestamp"]:
+                edge["timestamp"] = timestamp
+                edge["hash"] = tx.get("hash", "")
+        else:
+            G.add_edge(sender, receiver,
+                      weight=value,
+                      count=1,
+                      first_timestamp=timestamp,
+                      timestamp=timestamp,
+                      hash=tx.get("hash", ""))
                   
         # Maksimum düğüm sayısı kontrolü
         if len(nodes) >= max_nodes:
@@ -70,66 +103,143 @@ def create_graph_from_transactions(transactions, max_nodes=50):
     
     return G
 
-def create_graph_from_elliptic(loader, max_nodes=200):
+def _create_counterparty_graph(transactions, max_nodes):
+    """Çift toplamlarına göre en yüksek değerli karşı taraflardan işlem ağı"""
+    accumulator = GraphAccumulator()
+    accumulator.add(transactions)
+    node_ids, src, dst = accumulator.node_ids, accumulator.src, accumulator.dst
+
+    G = nx.DiGraph()
+    selected = []
+    for idx in accumulator.edge_value.iter_descending(initial=max_nodes):
+        sender, receiver = node_ids[src[idx]], node_ids[dst[idx]]
+        if sender not in G:
+            G.add_node(sender, type="sender")
+        if receiver not in G:
+            G.add_node(receiver, type="receiver")
+        selected.append(idx)
+        if G.number_of_nodes() >= max_nodes:
+            break
+
+    G.add_edges_from(accumulator.edges(selected))
+    return G
+
+def create_graph_from_elliptic(loader, max_nodes=200, graph=None):
     """
     Elliptic dataset'inden işlem ağı oluştur.
     
     Args:
-        loader: EllipticDatasetLoader örneği
+        loader: EllipticDatasetLoader ya da paylaşılan EllipticDataset örneği
         max_nodes: Maksimum düğüm sayısı
+        graph: Önceden oluşturulmuş CSRGraph (verilmezse oluşturulur)
         
     Returns:
-        nx.DiGraph: İşlem ağını temsil eden yönlü graf
+        nx.DiGraph: İlk max_nodes işlem ve aralarındaki kenarlardan oluşan yönlü graf
     """
-    G = nx.DiGraph()
-    
     # Veri setini yükle
     if not hasattr(loader, 'features') or loader.features is None:
         loader.load_data()
     
-    # Düğümleri ve özellikleri ekle
-    for idx, row in loader.features.iterrows():
-        if idx >= max_nodes:
-            break
-            
-        txid = row['txId']
-        
-        # Sınıf bilgisi
-        class_val = row.get('class', -1)
-        is_illicit = class_val == 1
-        is_licit = class_val == 0
-        is_unknown = class_val == -1
-        
-        # Düğüm ekle
-        G.add_node(txid, 
-                  class_value=int(class_val),
-                  is_illicit=bool(is_illicit),
-                  is_licit=bool(is_licit),
-                  is_unknown=bool(is_unknown),
-                  type="transaction")
+    if graph is None:
+        graph = build_elliptic_graph(loader)
     
-    # Kenarları ekle
-    for idx, row in loader.edges.iterrows():
-        if idx >= max_nodes * 3:  # Kenar sayısını sınırla
-            break
-            
-        # Kenar sütun adlarını belirle
-        if 'txId1' in loader.edges.columns and 'txId2' in loader.edges.columns:
-            source = row['txId1']
-            target = row['txId2']
-        else:
-            # İlk iki sütun muhtemelen txId1 ve txId2'dir
-            source = row.iloc[0]
-            target = row.iloc[1]
-        
-        # Her iki düğüm de grafikte var mı kontrol et
-        if source in G.nodes() and target in G.nodes():
-            # Kenar ekle (Elliptic verisinde ağırlık yok, 1.0 olarak ayarla)
-            G.add_edge(source, target, weight=1.0, timestamp=0)
+    nodes = np.arange(min(max_nodes, graph.n_nodes))
+    return graph.to_networkx(nodes, node_attrs=elliptic_node_attrs(graph.node_labels))
+
+def extract_neighborhood(graph, node_id, hops=NEIGHBORHOOD_HOPS, direction='both', max_nodes=NEIGHBORHOOD_MAX_NODES):
+    """
+    txId veya adres etrafındaki k-adımlı komşuluğu /network-visualization
+    biçiminde (nodes/links) döndür.
+
+    BFS doğrudan CSRGraph dizileri üzerinde çalışır, böylece Elliptic
+    grafının tamamında (~200k düğüm) milisaniyeler sürer. Düğümlerde
+    group 1 gönderen tarafı (giriş), 2 alıcı tarafı (çıkış); hop merkeze
+    uzaklıktır. Elliptic'te isAnomaly illicit işlemleri işaretler.
+
+    Raises:
+        KeyError: Düğüm grafta yoksa
+    """
+    if graph.node_ids.dtype.kind in 'iu':
+        try:
+            node_id = int(node_id)
+        except (TypeError, ValueError):
+            raise KeyError(node_id)
+    center = graph.index_of(node_id)
+    if center < 0:
+        raise KeyError(node_id)
+
+    nodes, distances, sides, truncated = graph.neighborhood(center, hops=hops, direction=direction, max_nodes=max_nodes)
+    ids = graph.node_ids[nodes].tolist()
+    labels = graph.node_labels[nodes].tolist() if graph.node_labels is not None else [None] * len(ids)
+    node_list = []
+    for node, hop, side, label in zip(ids, distances.tolist(), sides.tolist(), labels):
+        node = str(node)
+        node_list.append({
+            "id": node,
+            "label": node[:6] + "..." + node[-4:] if len(node) > 12 else node,
+            "group": 2 if side == 2 else 1,
+            "hop": hop,
+            "isAnomaly": label == 1,
+            "isMain": hop == 0
+        })
+
+    edge_ids = graph.induced_edges(nodes)
+    weights = np.ones(len(edge_ids)) if graph.weights is None else graph.weights[edge_ids]
+    links = [
+        {"source": str(u), "target": str(v), "value": min(10, w), "realValue": w}
+        for u, v, w in zip(graph.node_ids[graph.src[edge_ids]].tolist(),
+                           graph.node_ids[graph.dst[edge_ids]].tolist(), weights.tolist())
+    ]
+    return {
+        "center": str(ids[0]),
+        "hops": hops,
+        "direction": direction,
+        "truncated": truncated,
+        "nodes": node_list,
+        "links": links
+    }
+
+def csr_graph_stats(graph, sample_nodes=1000, betweenness_k='auto'):
+    """
+    CSRGraph için basic_graph_stats ile aynı biçimde istatistik üret.
     
-    return G
+    Düğüm/kenar sayıları, dereceler ve topluluklar grafın tamamı üzerinden
+    hesaplanır; betweenness en yüksek dereceli sample_nodes düğümün
+    oluşturduğu alt graf üzerinde hesaplanır (betweenness_k için bkz.
+    basic_graph_stats).
+    """
+    degree = graph.degree
+    n_nodes = graph.n_nodes
+    stats = {
+        "node_count": n_nodes,
+        "edge_count": graph.n_edges,
+        "total_volume": float(graph.n_edges if graph.weights is None else graph.weights.sum()),
+        "avg_degree": float(degree.sum() / n_nodes) if n_nodes > 0 else 0,
+        "top_degree": graph.top_degree(5)
+    }
+    
+    # Merkezilik ve topluluklar için yoğun merkez (hub) alt grafı
+    hubs = np.argsort(-degree, kind='stable')[:sample_nodes]
+    G = graph.to_networkx(hubs)
+    stats["top_betweenness"], stats["betweenness_pivots"] = top_betweenness(G, 5, k=betweenness_k)
+    stats["sampled_node_count"] = G.number_of_nodes()
+
+    # Topluluklar doğrudan CSR dizileri üzerinden tüm graf için bulunur
+    _, labels, stats["modularity"] = community_labels(graph)
+    sizes = np.bincount(labels)
+    stats["community_count"] = len(sizes)
+    stats["largest_community"] = int(sizes.max()) if len(sizes) else 0
+    
+    return stats
+
+def basic_graph_stats(G, betweenness_k='auto', version=None):
+    """
+    Graf için temel metrikler, merkezi düğümler ve topluluk sayısı.
 
-def basic_graph_stats(G):
+    betweenness_k: 'auto' (graf boyutundan seçilen pivot sayısı; küçük
+    graflarda tam), None (tam) veya pivot sayısı. version verilirse (ör. kaynak
+    dosyanın parmak izi) betweenness sonucu bu anahtarla önbelleklenir.
+    """
     # Temel metrikler
     stats = {
         "node_count": G.number_of_nodes(),
@@ -140,8 +250,8 @@ def basic_graph_stats(G):
     
     # Merkezi düğümler
     stats["top_degree"] = sorted(G.degree, key=lambda x: x[1], reverse=True)[:5]
-    stats["top_betweenness"] = sorted(nx.betweenness_centrality(G).items(), 
-                                    key=lambda x: x[1], reverse=True)[:5]
+    stats["top_betweenness"], stats["betweenness_pivots"] = top_betweenness(
+        G, 5, k=betweenness_k, version=version)
     
     # Community detection
     communities = detect_communities(G)
@@ -150,12 +260,17 @@ def basic_graph_stats(G):
     
     return stats
 
-def detect_communities(G):
-    # Undirected graph oluştur
-    G_undirected = G.to_undirected()
-    # Community detection
-    communities = list(nx.community.greedy_modularity_communities(G_undirected))
-    return communities
+def detect_communities(G, method=DEFAULT_COMMUNITY_METHOD, seed=COMMUNITY_SEED, runs=1, n_jobs=1):
+    """
+    Toplulukları büyükten küçüğe düğüm kümeleri listesi olarak döndür.
+
+    G networkx grafı ya da CSRGraph olabilir; yönler yok sayılır. Varsayılan
+    algoritma CSR üzerinde Louvain'dir, önceki greedy modularity yöntemi
+    method='greedy' ile seçilebilir. runs > 1 ise farklı seed'lerle
+    (n_jobs süreçte) çalıştırılıp modülerliği en yüksek sonuç alınır.
+    """
+    node_ids, labels, _ = community_labels(G, method=method, seed=seed, runs=runs, n_jobs=n_jobs)
+    return labels_to_communities(node_ids, labels)
 
 def detect_isolated_nodes(G):
     return [n for n in G.nodes if G.degree(n) == 0]
@@ -172,42 +287,93 @@ def detect_heavy_senders(G, threshold=1000):
             })
     return sorted(heavy, key=lambda x: x["value"], reverse=True)
 
-def analyze_temporal_patterns(G):
-    # Zaman bazlı analiz
-    timestamps = [d["timestamp"] for _, _, d in G.edges(data=True)]
-    if not timestamps:
-        return {}
-    
-    first_tx = min(timestamps)
-    last_tx = max(timestamps)
-    time_span = last_tx - first_tx
-    
-    # Zaman dilimlerine göre işlem hacmi
-    time_bins = defaultdict(float)
-    for _, _, d in G.edges(data=True):
-        bin_idx = (d["timestamp"] - first_tx) // (time_span // 10)  # 10 zaman dilimi
-        time_bins[bin_idx] += d["weight"]
-    
-    return {
-        "time_span_days": time_span / (24 * 3600),
-        "transaction_volume_by_time": dict(time_bins)
-    }
+def analyze_temporal_patterns(G, resolution=DEFAULT_RESOLUTION, block_range=None):
+    """
+    Zaman bazlı analiz (bkz. temporal.temporal_summary).
+
+    G bir graf ise kenar zaman damgaları ve ağırlıkları kullanılır; işlem
+    düzeyinde analiz için TemporalIndex (ör. TemporalIndex.from_file)
+    verilebilir. resolution: 'hour', 'day', 'week' veya saniye; block_range
+    verilirse blok aralıklarına göre dilimler de eklenir.
+    """
+    index = G if isinstance(G, TemporalIndex) else TemporalIndex.from_graph(G)
+    return temporal_summary(index, resolution=resolution, block_range=block_range)
+
+def _path_from_predecessors(predecessors, source, target):
+    """Dijkstra öncül dizisinden source -> target yolunu (indeks olarak) kur"""
+    path = [target]
+    while path[-1] != source:
+        path.append(int(predecessors[path[-1]]))
+    path.reverse()
+    return path
+
+def find_critical_paths(G, top_k=5, max_sources=200, time_budget=2.0, batch_size=16):
+    """
+    Ağırlıklı en kısa yollar arasından toplam ağırlığı en yüksek top_k yolu bul.
+
+    Her (u, v) çifti için ayrı shortest_path çağırmak yerine (O(V²) Dijkstra)
+    her kaynaktan tek bir Dijkstra çalıştırılır; bir kaynağın tüm hedeflerine
+    olan mesafeleri aynı aramada elde edilir. Aramalar scipy'nin CSR Dijkstra'sı
+    ile batch_size kaynaklık gruplar halinde yapılır. Kaynaklar çıkan ağırlığı
+    en yüksek max_sources düğümle (hub) sınırlandırılır ve time_budget saniye
+    dolduğunda yeni grup başlatılmaz. Her gruptan sonra yalnızca en iyi top_k
+    yol ve öncül satırları tutulur.
+
+    Düğüm sayısı max_sources'tan azsa ve süre yeterliyse sonuç tüm çiftler
+    üzerinden yapılan aramayla aynıdır.
+
+    Returns:
+        (paths, truncated): [{"path": [...], "weight": float}, ...] ağırlığa
+        göre azalan ve süre sınırı yüzünden kaynakların bir kısmının
+        taranmadığını belirten bayrak (kesik sonuç kalıcı önbelleğe alınmamalıdır)
+    """
+    start_time = time.time()
+    if G.number_of_edges() == 0:
+        return [], False
+    nodes, matrix = scipy_adjacency(G)
+
+    # Kaynaklar: çıkan ağırlığı en yüksek düğümler (eşitlikte graf sırası)
+    strength = np.asarray(matrix.sum(axis=1)).ravel()
+    candidates = np.flatnonzero(np.diff(matrix.indptr) > 0)
+    sources = candidates[np.lexsort((candidates, -strength[candidates]))][:max_sources]
+
+    # En iyi yollar: ağırlık, kaynak ve hedef indeksi, kaynağın öncül satırı
+    best_weight = np.empty(0)
+    best_source = np.empty(0, dtype=np.int64)
+    best_target = np.empty(0, dtype=np.int64)
+    best_pred = []
+    searched = 0
+    for start in range(0, len(sources), batch_size):
+        if searched and time.time() - start_time > time_budget:
+            break
+        batch = sources[start:start + batch_size]
+        dist, predecessors = dijkstra(matrix, directed=True, indices=batch, return_predecessors=True)
+        searched += len(batch)
+        dist[np.arange(len(batch)), batch] = np.inf  # u == v çiftleri sayılmaz
+        reachable = np.isfinite(dist)
+        if np.count_nonzero(reachable) > top_k:
+            # Gruptaki top_k'ıncı ağırlığın altındaki çiftler hiçbir zaman seçilemez
+            threshold = np.partition(dist[reachable], -top_k)[-top_k]
+            reachable &= dist >= threshold
+        rows, targets = np.nonzero(reachable)
+        if len(rows) == 0:
+            continue
+
+        weight = np.concatenate([best_weight, dist[rows, targets]])
+        source = np.concatenate([best_source, batch[rows]])
+        target = np.concatenate([best_target, targets])
+        # Ağırlığa göre azalan; eşitlikte önce gelen kaynak ve hedef
+        order = np.lexsort((target, source, -weight))[:top_k]
+        n_previous = len(best_weight)
+        best_pred = [best_pred[i] if i < n_previous else predecessors[rows[i - n_previous]].copy() for i in order]
+        best_weight, best_source, best_target = weight[order], source[order], target[order]
 
-def find_critical_paths(G):
-    # En önemli path'leri bul
     paths = []
-    for u in G.nodes():
-        for v in G.nodes():
-            if u != v:
-                try:
-                    path = nx.shortest_path(G, u, v, weight="weight")
-                    path_weight = sum(G[path[i]][path[i+1]]["weight"] 
-                                    for i in range(len(path)-1))
-                    paths.append({
-                        "path": path,
-                        "weight": path_weight
-                    })
-                except nx.NetworkXNoPath:
-                    continue
-    
-    return sorted(paths, key=lambda x: x["weight"], reverse=True)[:5]
+    for source, target, predecessors in zip(best_source.tolist(), best_target.tolist(), best_pred):
+        path = [nodes[i] for i in _path_from_predecessors(predecessors, source, target)]
+        # Yol ağırlığı kenar ağırlıklarının toplamı olarak raporlanır
+        paths.append({
+            "path": path,
+            "weight": sum(G[path[i]][path[i+1]]["weight"] for i in range(len(path)-1))
+        })
+    return paths, searched < len(sources)
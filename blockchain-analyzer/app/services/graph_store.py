@@ -0,0 +1,294 @@
+import glob
+import json
+import os
+import shutil
+import threading
+import networkx as nx
+import numpy as np
+from .csr_graph import CSRGraph
+
+# Anlık görüntü biçimi değiştiğinde artırılır, eski görüntüler geçersiz sayılır
+GRAPH_FORMAT_VERSION = 2
+
+# Anlık görüntüdeki dizi dosyaları
+ARRAY_FILES = {
+    'node_ids': 'node_ids.npy',     # Düğüm kimlikleri (adresler)
+    'src': 'src_i32.npy',           # Kenar kaynaklarının düğüm indeksleri
+    'dst': 'dst_i32.npy',           # Kenar hedeflerinin düğüm indeksleri
+    'weight': 'weight_f64.npy',     # Kenar ağırlıkları (toplam ETH)
+    'count': 'count_i64.npy',       # Kenardaki işlem sayısı
+    'first_timestamp': 'first_timestamp_i64.npy',
+    'timestamp': 'timestamp_i64.npy',
+    'hash': 'hash.npy'              # Kenardaki son işlemin hash'i
+}
+STATS_FILE = 'stats.json'
+
+class GraphSnapshot:
+    """
+    İşlem grafının dizi tabanlı anlık görüntüsü.
+
+    Düğümler 0..n-1 arasında indekslenir; kenar öznitelikleri (ağırlık,
+    zaman, hash) paralel dizilerde tutulur. Diskten mmap ile yüklenen diziler
+    işçi süreçleri arasında işletim sisteminin sayfa önbelleğini paylaşır.
+    """
+    def __init__(self, arrays):
+        self.node_ids = arrays['node_ids']
+        self.src = arrays['src']
+        self.dst = arrays['dst']
+        self.weight = arrays['weight']
+        self.count = arrays['count']
+        self.first_timestamp = arrays['first_timestamp']
+        self.timestamp = arrays['timestamp']
+        self.hash = arrays['hash']
+        self._graph = None
+        self._csr = None
+        self._graph_lock = threading.Lock()
+
+    @property
+    def n_nodes(self):
+        return len(self.node_ids)
+
+    @property
+    def n_edges(self):
+        return len(self.src)
+
+    def arrays(self):
+        return {key: getattr(self, key) for key in ARRAY_FILES}
+
+    @classmethod
+    def from_networkx(cls, G):
+        """load_graph_from_json biçimindeki DiGraph'tan anlık görüntü oluştur"""
+        nodes = list(G.nodes())
+        position = {node: i for i, node in enumerate(nodes)}
+        # Komşuluk sözlükleri tek geçişte gezilir (G.edges ile aynı sıra)
+        src, dst, weight, count, first_timestamp, timestamp, hashes = [], [], [], [], [], [], []
+        for u, neighbors in G.adjacency():
+            i = position[u]
+            for v, d in neighbors.items():
+                src.append(i)
+                dst.append(position[v])
+                weight.append(d.get('weight', 0.0))
+                count.append(d.get('count', 1))
+                first_timestamp.append(d.get('first_timestamp', d.get('timestamp', 0)))
+                timestamp.append(d.get('timestamp', 0))
+                hashes.append(d.get('hash', ''))
+        return cls({
+            'node_ids': np.array(nodes, dtype=str),
+            'src': np.array(src, dtype=np.int32),
+            'dst': np.array(dst, dtype=np.int32),
+            'weight': np.array(weight, dtype=np.float64),
+            'count': np.array(count, dtype=np.int64),
+            'first_timestamp': np.array(first_timestamp, dtype=np.int64),
+            'timestamp': np.array(timestamp, dtype=np.int64),
+            'hash': np.array(hashes, dtype=str)
+        })
+
+    def graph(self):
+        """Görüntüden networkx.DiGraph oluştur (süreç başına bir kez, paylaşılır)"""
+        if self._graph is not None:
+            return self._graph
+        with self._graph_lock:
+            if self._graph is None:
+                ids = self.node_ids.tolist()
+                G = nx.DiGraph()
+                G.add_nodes_from(ids)
+                G.add_edges_from(
+                    (ids[u], ids[v], {'weight': w, 'count': c, 'first_timestamp': f, 'timestamp': t, 'hash': h})
+                    for u, v, w, c, f, t, h in zip(self.src.tolist(), self.dst.tolist(), self.weight.tolist(),
+                                                   self.count.tolist(), self.first_timestamp.tolist(),
+                                                   self.timestamp.tolist(), self.hash.tolist())
+                )
+                self._graph = G
+            return self._graph
+
+    def to_csr(self):
+        """Ağırlıklı CSRGraph olarak döndür (süreç başına bir kez, paylaşılır)"""
+        if self._csr is None:
+            with self._graph_lock:
+                if self._csr is None:
+                    self._csr = CSRGraph(self.node_ids, self.src, self.dst, weights=self.weight)
+        return self._csr
+
+class GraphStore:
+    """
+    İşlem grafı anlık görüntülerini ve bunlardan hesaplanan istatistikleri
+    kaynak verinin parmak izi başına bir kez oluşturup saklar.
+
+    Her kaynak (ör. 'raw_data', 'elliptic') için cache_dir altında
+    <ad>_<parmak izi>_v<biçim> klasörü tutulur: diziler .npy, istatistikler
+    stats.json olarak yazılır. Parmak izi değişince eski klasör silinir ve
+    görüntü yeniden oluşturulur. cache_dir verilmezse yalnızca bellekte tutulur.
+    """
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._entries = {}  # ad -> {'fingerprint', 'snapshot', 'stats', 'transient'}
+        self._stat_locks = {}
+
+    def _directory(self, name, fingerprint):
+        return os.path.join(self.cache_dir, f"{name}_{fingerprint}_v{GRAPH_FORMAT_VERSION}")
+
+    def _remove_stale(self, name, fingerprint):
+        """Aynı kaynağın eski parmak izli klasörlerini sil"""
+        current = self._directory(name, fingerprint)
+        for path in glob.glob(os.path.join(self.cache_dir, f"{name}_*")):
+            if path != current and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _load_stats(self, name, fingerprint):
+        if not self.cache_dir:
+            return {}
+        path = os.path.join(self._directory(name, fingerprint), STATS_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_stats(self, name, fingerprint, stats):
+        if not self.cache_dir:
+            return
+        try:
+            directory = self._directory(name, fingerprint)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, STATS_FILE)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Graf istatistikleri yazılamadı: {e}")
+
+    def _load_snapshot(self, name, fingerprint):
+        if not self.cache_dir:
+            return None
+        directory = self._directory(name, fingerprint)
+        paths = {key: os.path.join(directory, filename) for key, filename in ARRAY_FILES.items()}
+        if not all(os.path.exists(path) for path in paths.values()):
+            return None
+        try:
+            return GraphSnapshot({key: np.load(path, mmap_mode='r') for key, path in paths.items()})
+        except (OSError, ValueError) as e:
+            print(f"Graf anlık görüntüsü okunamadı: {e}")
+            return None
+
+    def _save_snapshot(self, name, fingerprint, snapshot):
+        if not self.cache_dir:
+            return
+        try:
+            directory = self._directory(name, fingerprint)
+            os.makedirs(directory, exist_ok=True)
+            # Önce geçici dosyaya yaz, sonra atomik olarak yerine koy
+            for key, array in snapshot.arrays().items():
+                path = os.path.join(directory, ARRAY_FILES[key])
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, np.ascontiguousarray(array))
+                os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Graf anlık görüntüsü yazılamadı: {e}")
+
+    def _entry(self, name, fingerprint):
+        """Geçerli kaydı döndür; parmak izi değiştiyse eskisini at (kilit altında çağrılır)"""
+        entry = self._entries.get(name)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            if self.cache_dir:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._remove_stale(name, fingerprint)
+            entry = {'fingerprint': fingerprint, 'snapshot': None, 'stats': self._load_stats(name, fingerprint),
+                     'transient': set()}
+            self._entries[name] = entry
+        return entry
+
+    def get(self, name, fingerprint, build):
+        """
+        Kaynağın güncel anlık görüntüsünü döndür.
+
+        Parameters:
+        -----------
+        name : str
+            Kaynak adı ('raw_data' gibi)
+        fingerprint : str
+            Kaynak verinin parmak izi (ör. FeatureStore.fingerprint)
+        build : callable
+            Görüntü yoksa networkx.DiGraph oluşturan fonksiyon
+        """
+        entry = self._entries.get(name)
+        if entry is not None and entry['fingerprint'] == fingerprint and entry['snapshot'] is not None:
+            return entry['snapshot']
+
+        with self._lock:
+            entry = self._entry(name, fingerprint)
+            if entry['snapshot'] is None:
+                snapshot = self._load_snapshot(name, fingerprint)
+                if snapshot is None:
+                    G = build()
+                    snapshot = GraphSnapshot.from_networkx(G)
+                    self._save_snapshot(name, fingerprint, snapshot)
+                    # Yeni oluşturulan graf yeniden kurulmadan kullanılır
+                    snapshot._graph = G
+                entry['snapshot'] = snapshot
+            return entry['snapshot']
+
+    def stat(self, name, fingerprint, stat_name, compute, persist=True):
+        """
+        Kaynağın güncel sürümü için bir istatistiği bir kez hesapla ve sakla.
+
+        Değer JSON'a çevrilerek saklanır ve döndürülür; böylece ilk hesaplama
+        ile diskten okunan sonuç aynı biçimdedir (tuple -> list, anahtarlar str).
+        persist False ise ya da değeri alıp False döndüren bir fonksiyonsa
+        (ör. süre sınırında kesilmiş sonuçlar) değer yalnızca bu süreçte
+        bellekte tutulur, stats.json'a yazılmaz.
+
+        stat_name sabit bir küme içinden seçilmelidir; istek parametrelerinden
+        türetilen serbest adlar önbelleği sınırsız büyütür.
+        """
+        with self._lock:
+            stats = self._entry(name, fingerprint)['stats']
+            if stat_name in stats:
+                return stats[stat_name]
+            lock = self._stat_locks.setdefault((name, stat_name), threading.Lock())
+
+        with lock:
+            with self._lock:
+                entry = self._entry(name, fingerprint)
+                if stat_name in entry['stats']:
+                    return entry['stats'][stat_name]
+            value = json_ready(compute())
+            keep = persist(value) if callable(persist) else persist
+            with self._lock:
+                entry = self._entry(name, fingerprint)
+                entry['stats'][stat_name] = value
+                if keep:
+                    entry['transient'].discard(stat_name)
+                    self._save_stats(name, fingerprint, {
+                        key: stat for key, stat in entry['stats'].items() if key not in entry['transient']
+                    })
+                else:
+                    entry['transient'].add(stat_name)
+            return value
+
+    def invalidate(self, name=None):
+        """Bellekteki kayıtları temizle (disk klasörleri parmak izi değişince silinir)"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+def json_ready(value):
+    """Değeri stat() ile aynı JSON biçimine çevir (NumPy tipleri, tuple -> list)"""
+    return json.loads(json.dumps(value, default=_json_default))
+
+def _json_default(obj):
+    # NumPy skalerleri ve dizileri
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(obj).__name__}")
+
+# Süreç genelinde paylaşılan depo; GRAPH_CACHE_DIR boş verilirse yalnızca bellekte tutulur
+default_graph_store = GraphStore(cache_dir=os.getenv("GRAPH_CACHE_DIR", os.path.join("data", "graph_cache")) or None)
@@ -1,130 +1,297 @@
-import json
 import os
+import threading
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import IsolationForest
 from sklearn.cluster import DBSCAN
 from sklearn.neighbors import LocalOutlierFactor
 from sklearn.svm import OneClassSVM
+from .feature_store import FeatureStore, default_feature_store
+from app.utils.tx_io import find_raw_transactions, read_transactions
 
-DATA_PATH = os.path.join(os.path.dirname(__file__), '../../data/raw_transactions.json')
+DATA_PATH = find_raw_transactions(os.path.join(os.path.dirname(__file__), '../../data'))
+
+# Öznitelik matrisi için ham işlemlerden okunan sütunlar
+SOURCE_COLUMNS = ['from', 'to', 'value', 'timeStamp', 'isError']
+
+SECONDS_PER_DAY = 24 * 3600
+
+# Modellere verilen adres öznitelikleri
+FEATURE_COLUMNS = [
+    'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent',
+    'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap'
+]
+RESULT_COLUMNS = ['from', 'anomaly_score', 'is_anomaly'] + FEATURE_COLUMNS
+
+def _group_max(values, starts):
+    """Sıralı gruplar için (starts: grup başlangıç indeksleri) grup başına maksimum"""
+    if len(values) == 0:
+        return values
+    return np.maximum.reduceat(values, starts)
+
+def extract_address_features(address, transactions):
+    """
+    Tek bir adres için işlem verilerinden özellik vektörü çıkarır.
+
+    Yalnızca isteğin kendi işlemlerini kullanır; global veri setine
+    (ham işlem dosyası) dokunmaz.
+
+    Parameters:
+    -----------
+    address : str
+        Ethereum adresi
+    transactions : list veya pandas.DataFrame
+        Etherscan txlist kayıtları
+
+    Returns:
+    --------
+    list
+        [tx_count, total_sent, avg_sent, max_sent, unique_receivers, tx_per_day]
+        (standard Python tiplerinde)
+    """
+    try:
+        df = transactions if isinstance(transactions, pd.DataFrame) else pd.DataFrame(transactions)
+
+        # Sadece bu adresin gönderdiği işlemleri filtrele
+        df = df[df['from'].str.lower() == address.lower()]
+
+        tx_count = len(df)
+        if tx_count == 0:
+            # Eğer işlem yoksa, varsayılan değerler döndür
+            return [0, 0, 0, 0, 0, 0]
+
+        value_eth = df['value'].to_numpy().astype(float) / 1e18
+        timestamps = df['timeStamp'].to_numpy().astype(np.int64)
+
+        # Günlük işlem sayısı
+        days_active = int((timestamps.max() - timestamps.min()) // SECONDS_PER_DAY) + 1
+        tx_per_day = float(tx_count / max(1, days_active))
+
+        return [
+            tx_count,
+            float(value_eth.sum()),
+            float(value_eth.mean()),
+            float(value_eth.max()),
+            int(df['to'].nunique()),
+            tx_per_day
+        ]
+    except Exception as e:
+        print(f"Adres özellik çıkarımı hatası: {e}")
+        return [0, 0, 0, 0, 0, 0]
+
+def build_feature_matrix(df):
+    """
+    Ham işlem çerçevesinden adres bazlı öznitelik matrisini çıkarır.
+
+    Tüm hesaplama tek sıralama üzerinden vektörel yapılır: işlemler bir kez
+    (gönderen, zaman) sırasına dizilir; boşluklar diff ile, günler tam sayı
+    epoch-gün ile, grup maksimumları reduceat ile bulunur. Adres başına
+    Python fonksiyonu çağrılmaz.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Etherscan txlist sütunlarını içeren işlem verileri
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Gönderen adres başına bir satır ve 14 öznitelik
+    """
+    df = df[df['isError'] == '0']
+    codes, senders = pd.factorize(df['from'], sort=True)
+    valid = codes >= 0
+    codes = codes[valid]
+    value_eth = df['value'].to_numpy()[valid].astype(float) / 1e18
+    ts = df['timeStamp'].to_numpy()[valid].astype(np.int64)
+    receivers, _ = pd.factorize(df['to'])
+    receivers = receivers[valid]
+
+    # Tek sıralama: gönderen, sonra zaman (tek int64 anahtar üzerinde)
+    ts_offset = ts - ts.min() if len(ts) else ts
+    order = np.argsort((codes.astype(np.int64) << 32) | ts_offset, kind='stable')
+    codes = codes[order]
+    ts = ts[order]
+    value_eth = value_eth[order]
+    receivers = receivers[order]
+    day = ts // SECONDS_PER_DAY
+
+    n = len(codes)
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = codes[1:] != codes[:-1]
+    starts = np.flatnonzero(is_start)
+    n_groups = len(starts)
+    ends = np.append(starts[1:], n) if n_groups else starts
+
+    # Değer istatistikleri (sayısal grup koduna göre cython toplama)
+    value_stats = pd.Series(value_eth).groupby(codes, sort=True).agg(
+        ['size', 'sum', 'mean', 'max', 'min', 'median', 'std']
+    )
+
+    first_ts = ts[starts]
+    last_ts = ts[ends - 1]
+
+    # Benzersiz alıcı: (gönderen, alıcı) çiftlerinin tekil sayısı (alıcısı olmayanlar hariç)
+    has_receiver = receivers >= 0
+    pairs = np.sort((codes[has_receiver].astype(np.int64) << 32) | receivers[has_receiver])
+    new_pair = np.ones(len(pairs), dtype=bool)
+    new_pair[1:] = pairs[1:] != pairs[:-1]
+    unique_receivers = np.bincount((pairs[new_pair] >> 32).astype(np.int64), minlength=n_groups)
+
+    # Günler: sıralı olduğundan yeni gün = gönderen ya da gün değişimi
+    new_day = is_start.copy()
+    new_day[1:] |= day[1:] != day[:-1]
+    day_starts = np.flatnonzero(new_day)
+    unique_days = np.bincount(codes[day_starts], minlength=n_groups)
+
+    # Burstiness: bir günde yapılan en fazla işlem (gün segmentlerinin en uzunu)
+    day_lengths = np.diff(np.append(day_starts, n))
+    group_first_segment = np.searchsorted(day_starts, starts)
+    burstiness = _group_max(day_lengths, group_first_segment)
+
+    # İşlemler arası en uzun bekleme (saat); grup sınırlarındaki farklar sayılmaz
+    gaps = np.zeros(n, dtype=np.int64)
+    gaps[1:] = np.diff(ts)
+    gaps[is_start] = 0
+    max_gap = _group_max(gaps, starts) / 3600
+
+    span_days = (last_ts - first_ts) // SECONDS_PER_DAY
+    grouped = pd.DataFrame({
+        'from': np.asarray(senders)[codes[starts]] if n_groups else np.asarray([], dtype=object),
+        'tx_count': value_stats['size'].to_numpy(),
+        'total_sent': value_stats['sum'].to_numpy(),
+        'avg_sent': value_stats['mean'].to_numpy(),
+        'max_sent': value_stats['max'].to_numpy(),
+        'min_sent': value_stats['min'].to_numpy(),
+        'median_sent': value_stats['median'].to_numpy(),
+        'std_sent': value_stats['std'].to_numpy(),
+        'unique_receivers': unique_receivers,
+        'first_tx': pd.to_datetime(first_ts, unit='s'),
+        'last_tx': pd.to_datetime(last_ts, unit='s'),
+        'unique_days': unique_days
+    })
+    # Aktif olduğu gün sayısı
+    grouped['active_days'] = span_days + 1
+    grouped['tx_per_day'] = grouped['tx_count'] / grouped['active_days'].replace(0, 1)
+    # İlk ve son transfer arası gün farkı
+    grouped['first_last_diff'] = span_days
+    grouped['burstiness'] = burstiness
+    grouped['max_gap'] = max_gap
+    return grouped.fillna(0)
 
 class MLAnomalyDetector:
-    def __init__(self, data_path=DATA_PATH):
+    """
+    Ham işlem verisinde adres bazlı anomali tespiti.
+
+    Örnek süreç genelinde paylaşıldığından (bkz. get_ml_detector) istek
+    başına durum tutulmaz: fit_* metotları sonuçlarını döndürür, algoritma
+    sonuçları veri sürümü başına bir kez hesaplanıp kilit altında saklanır.
+    """
+    def __init__(self, data_path=DATA_PATH, feature_store=default_feature_store):
         self.data_path = data_path
-        self.df = self._load_data()
-        self.features = None
-        self.model = None
-        self.scores = None
+        self.feature_store = feature_store
+        self._df = None
+        self._df_version = None
+        self._df_lock = threading.Lock()
+        self._results = {}      # algoritma -> (veri sürümü, sonuç)
+        self._results_lock = threading.Lock()
+        self._fit_locks = {}
+
+    @property
+    def df(self):
+        # Ham işlemler yalnızca gerektiğinde okunur; dosya değişirse yeniden okunur
+        version = FeatureStore.fingerprint(self.data_path)
+        with self._df_lock:
+            if self._df is None or self._df_version != version:
+                self._df = self._load_data()
+                self._df_version = version
+            return self._df
 
     def _load_data(self):
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            txs = json.load(f)
-        return pd.DataFrame(txs)
+        # Yalnızca gereken sütunlar okunur; Parquet'te diğerleri diskten hiç okunmaz
+        return read_transactions(self.data_path, columns=SOURCE_COLUMNS)
 
     def extract_features(self):
-        df = self.df
-        df = df[df['isError'] == '0']
-        df['value_eth'] = df['value'].astype(float) / 1e18
-        df['time'] = pd.to_datetime(df['timeStamp'], unit='s')
-        df = df.sort_values(['from', 'time'])
-        # Günlük işlem sayısı
-        df['date'] = df['time'].dt.date
-        # Adres bazında öznitelikler
-        grouped = df.groupby('from').agg(
-            tx_count=('hash', 'count'),
-            total_sent=('value_eth', 'sum'),
-            avg_sent=('value_eth', 'mean'),
-            max_sent=('value_eth', 'max'),
-            min_sent=('value_eth', 'min'),
-            median_sent=('value_eth', 'median'),
-            std_sent=('value_eth', 'std'),
-            unique_receivers=('to', 'nunique'),
-            first_tx=('time', 'min'),
-            last_tx=('time', 'max'),
-            unique_days=('date', 'nunique')
-        ).reset_index()
-        # Aktif olduğu gün sayısı
-        grouped['active_days'] = (grouped['last_tx'] - grouped['first_tx']).dt.days + 1
-        grouped['tx_per_day'] = grouped['tx_count'] / grouped['active_days'].replace(0, 1)
-        # İlk ve son transfer arası gün farkı
-        grouped['first_last_diff'] = (grouped['last_tx'] - grouped['first_tx']).dt.days
-        # Burstiness: bir günde yapılan en fazla işlem
-        burst = df.groupby(['from', 'date']).size().groupby('from').max().rename('burstiness')
-        grouped = grouped.merge(burst, on='from', how='left')
-        # İşlemler arası en uzun bekleme süresi (saat cinsinden)
-        def max_gap(times):
-            if len(times) < 2:
-                return 0
-            gaps = np.diff(np.sort(times.values.astype(np.int64) // 10**9))
-            return np.max(gaps) / 3600  # saate çevir
-        grouped['max_gap'] = df.groupby('from')['time'].apply(max_gap).values
-        self.features = grouped.fillna(0)
-        return self.features
+        """Öznitelik matrisini döndür (veri sürümü başına bir kez hesaplanır)"""
+        if self.feature_store is None:
+            features = build_feature_matrix(self.df)
+        else:
+            features = self.feature_store.get(self.data_path, lambda: build_feature_matrix(self.df))
+        # Paylaşılan matris değiştirilmesin diye algoritmalar kopya üzerinde çalışır
+        return features.copy()
 
     def fit_isolation_forest(self):
         feats = self.extract_features()
-        X = feats[[
-            'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent',
-            'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap'
-        ]].values
+        X = feats[FEATURE_COLUMNS].values
         model = IsolationForest(n_estimators=100, contamination=0.05, random_state=42)
         model.fit(X)
         scores = model.decision_function(X)
         feats['anomaly_score'] = -scores  # Yüksek skor = daha anormal
         feats['is_anomaly'] = model.predict(X) == -1
-        self.model = model
-        self.scores = feats
-        return feats[['from', 'anomaly_score', 'is_anomaly', 'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent', 'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap']]
+        return feats[RESULT_COLUMNS]
 
     def fit_dbscan(self):
         feats = self.extract_features()
-        X = feats[[
-            'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent',
-            'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap'
-        ]].values
+        X = feats[FEATURE_COLUMNS].values
         model = DBSCAN(eps=2.5, min_samples=5)
         labels = model.fit_predict(X)
         feats['is_anomaly'] = labels == -1
         feats['anomaly_score'] = np.where(feats['is_anomaly'], 1, 0)
-        return feats[feats['is_anomaly']][['from', 'anomaly_score', 'is_anomaly', 'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent', 'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap']]
+        return feats[feats['is_anomaly']][RESULT_COLUMNS]
 
     def fit_lof(self):
         feats = self.extract_features()
-        X = feats[[
-            'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent',
-            'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap'
-        ]].values
+        X = feats[FEATURE_COLUMNS].values
         model = LocalOutlierFactor(n_neighbors=20, contamination=0.05)
         y_pred = model.fit_predict(X)
         scores = -model.negative_outlier_factor_
         feats['anomaly_score'] = scores
         feats['is_anomaly'] = y_pred == -1
-        return feats[feats['is_anomaly']][['from', 'anomaly_score', 'is_anomaly', 'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent', 'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap']]
+        return feats[feats['is_anomaly']][RESULT_COLUMNS]
 
     def fit_oneclass_svm(self):
         feats = self.extract_features()
-        X = feats[[
-            'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent',
-            'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap'
-        ]].values
+        X = feats[FEATURE_COLUMNS].values
         model = OneClassSVM(nu=0.05, kernel='rbf', gamma='scale')
         y_pred = model.fit_predict(X)
         feats['anomaly_score'] = -model.decision_function(X)
         feats['is_anomaly'] = y_pred == -1
-        return feats[feats['is_anomaly']][['from', 'anomaly_score', 'is_anomaly', 'tx_count', 'total_sent', 'avg_sent', 'max_sent', 'min_sent', 'median_sent', 'std_sent', 'unique_receivers', 'tx_per_day', 'active_days', 'first_last_diff', 'unique_days', 'burstiness', 'max_gap']]
+        return feats[feats['is_anomaly']][RESULT_COLUMNS]
 
-    def get_anomalies_by_method(self, algo='isoforest', n=10):
-        if algo == 'isoforest':
-            df = self.fit_isolation_forest()
-        elif algo == 'dbscan':
-            df = self.fit_dbscan()
-        elif algo == 'lof':
-            df = self.fit_lof()
-        elif algo == 'ocsvm':
-            df = self.fit_oneclass_svm()
-        else:
+    def fit(self, algo):
+        """
+        Algoritmanın sonucunu döndür; veri sürümü başına bir kez hesaplanır.
+
+        Aynı algoritmayı isteyen eşzamanlı istekler tek hesaplamayı bekler,
+        farklı algoritmalar birbirinin sonucunu ezmez. Dönen çerçeve
+        paylaşılır, değiştirilmemelidir.
+        """
+        fit_methods = {
+            'isoforest': self.fit_isolation_forest,
+            'dbscan': self.fit_dbscan,
+            'lof': self.fit_lof,
+            'ocsvm': self.fit_oneclass_svm
+        }
+        if algo not in fit_methods:
             raise ValueError(f'Bilinmeyen algoritma: {algo}')
+        version = FeatureStore.fingerprint(self.data_path)
+        with self._results_lock:
+            cached = self._results.get(algo)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            lock = self._fit_locks.setdefault(algo, threading.Lock())
+        with lock:
+            with self._results_lock:
+                cached = self._results.get(algo)
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+            result = fit_methods[algo]()
+            with self._results_lock:
+                self._results[algo] = (version, result)
+            return result
+
+    def get_anomalies_by_method(self, algo='isoforest', n=10):
+        df = self.fit(algo)
         
         # Convert to records and ensure all values are Python native types
         records = df.sort_values('anomaly_score', ascending=False).head(n).to_dict(orient='records')
@@ -161,7 +328,7 @@ class MLAnomalyDetector:
         # Algoritma ile anomalileri tespit et
         anom_df = self.get_anomalies_by_method(algo=algo, n=1000)  # Tüm anomalileri al
         anom_addrs = set([row['from'] for row in anom_df])
-        feats['is_anomaly'] = feats['from'].apply(lambda x: x in anom_addrs)
+        feats['is_anomaly'] = feats['from'].isin(anom_addrs)
         
         # Önemli öznitelikleri seçelim
         features = ['burstiness', 'tx_per_day', 'total_sent', 'avg_sent', 'max_sent']
@@ -180,54 +347,22 @@ class MLAnomalyDetector:
         return result
     
     def extract_features_for_address(self, address, df):
-        """
-        Tek bir adres için işlem verilerinden özellik vektörü çıkarır
-        
-        Parameters:
-        -----------
-        address : str
-            Ethereum adresi
-        df : pandas.DataFrame
-            İşlem verileri DataFrame'i
-        
-        Returns:
-        --------
-        list
-            Özellik vektörü (standard Python tiplerinde)
-        """
-        try:
-            # Sadece bu adresin gönderdiği işlemleri filtrele
-            df = df[df['from'].str.lower() == address.lower()]
-            
-            # Gerekli dönüşümleri yap
-            df['value_eth'] = df['value'].astype(float) / 1e18
-            df['time'] = pd.to_datetime(df['timeStamp'], unit='s')
-            df = df.sort_values('time')
-            
-            # Günlük işlem sayısı
-            df['date'] = df['time'].dt.date
-            
-            # Özellikleri hesapla
-            tx_count = len(df)
-            
-            if tx_count == 0:
-                # Eğer işlem yoksa, varsayılan değerler döndür
-                return [0, 0, 0, 0, 0, 0]
-            
-            total_sent = float(df['value_eth'].sum())
-            avg_sent = float(df['value_eth'].mean())
-            max_sent = float(df['value_eth'].max())
-            unique_receivers = int(df['to'].nunique())
-            
-            # Günlük işlem sayısı
-            first_day = df['time'].min()
-            last_day = df['time'].max()
-            days_active = (last_day - first_day).days + 1
-            tx_per_day = float(tx_count / max(1, days_active))
-            
-            # Sonuç: Özellik vektörü (numpy array yerine Python liste)
-            return [tx_count, total_sent, avg_sent, max_sent, unique_receivers, tx_per_day]
-            
-        except Exception as e:
-            print(f"Adres özellik çıkarımı hatası: {e}")
-            return [0, 0, 0, 0, 0, 0]
\ No newline at end of file
+        """Geriye dönük uyumluluk için: extract_address_features'a yönlendirir"""
+        return extract_address_features(address, df)
+
+_shared_detector = None
+_shared_detector_lock = threading.Lock()
+
+def get_ml_detector():
+    """
+    Süreç genelinde paylaşılan MLAnomalyDetector örneğini döndür.
+
+    Detektör ilk kullanımda oluşturulur; ham veri ve öznitelik matrisi
+    feature store üzerinden veri sürümü başına bir kez hazırlanır.
+    """
+    global _shared_detector
+    if _shared_detector is None:
+        with _shared_detector_lock:
+            if _shared_detector is None:
+                _shared_detector = MLAnomalyDetector()
+    return _shared_detector
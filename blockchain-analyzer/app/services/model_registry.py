@@ -0,0 +1,124 @@
+import os
+import pickle
+import threading
+import time
+import joblib
+
+class _ByteCounter:
+    """pickle çıktısını saklamadan yalnızca boyutunu sayan dosya benzeri nesne"""
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+def estimate_model_size(model):
+    """Modelin serileştirilmiş boyutu (byte) - bellekteki boyutun yaklaşık ölçüsü"""
+    counter = _ByteCounter()
+    pickle.dump(model, counter, protocol=pickle.HIGHEST_PROTOCOL)
+    return counter.size
+
+class _ModelEntry:
+    def __init__(self, model, signature, load_seconds):
+        self.model = model
+        self.signature = signature
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self._size_bytes = None
+
+    @property
+    def size_bytes(self):
+        # Model tüm halinde serileştirildiğinden yüklemede değil ilk istendiğinde hesaplanır
+        if self._size_bytes is None:
+            self._size_bytes = estimate_model_size(self.model)
+        return self._size_bytes
+
+class ModelRegistry:
+    """
+    Anomali modellerini bir kez yükleyip bellekten sunan kayıt defteri.
+
+    Her erişimde model dosyasının mtime/boyut bilgisi kontrol edilir; dosya
+    değiştiyse yeni model kilit altında yüklenir ve kayıt tek atamayla
+    değiştirilir. Yükleme sürerken diğer istekler eski modeli kullanmaya
+    devam eder.
+    """
+    def __init__(self, model_dir, model_files):
+        self.model_dir = model_dir
+        self.model_files = dict(model_files)
+        self._entries = {}
+        self._locks = {name: threading.Lock() for name in self.model_files}
+
+    def model_path(self, name):
+        if name not in self.model_files:
+            raise ValueError(f"Bilinmeyen algoritma: {name}")
+        return os.path.join(self.model_dir, self.model_files[name])
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self, name, path, signature):
+        with self._locks[name]:
+            entry = self._entries.get(name)
+            if entry is not None and entry.signature == signature:
+                return entry
+
+            start_time = time.time()
+            model = joblib.load(path)
+            load_seconds = time.time() - start_time
+            entry = _ModelEntry(model, signature, load_seconds)
+            # Atomik değişim: okuyucular ya eski ya yeni kaydı görür
+            self._entries[name] = entry
+            print(f"Model yüklendi: {name} ({load_seconds:.2f} sn, dosya {signature[1] / 2**20:.1f} MB)")
+            return entry
+
+    def get(self, name):
+        """Modeli bellekten döndür; dosya değiştiyse yeniden yükle"""
+        path = self.model_path(name)
+        signature = self._signature(path)
+        if signature is None:
+            raise FileNotFoundError(f"Model bulunamadı: {path}")
+
+        entry = self._entries.get(name)
+        if entry is None or entry.signature != signature:
+            entry = self._load(name, path, signature)
+        return entry.model
+
+    def preload(self, background=True):
+        """Diskte bulunan tüm modelleri yükle (varsayılan olarak arka planda)"""
+        def _load_all():
+            for name in self.model_files:
+                try:
+                    self.get(name)
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    print(f"Model önceden yüklenemedi ({name}): {e}")
+
+        if not background:
+            _load_all()
+            return None
+
+        thread = threading.Thread(target=_load_all, name='model-preload', daemon=True)
+        thread.start()
+        return thread
+
+    def info(self, name):
+        """Model dosyası ve bellekteki kopyası hakkında bilgi"""
+        path = self.model_path(name)
+        signature = self._signature(path)
+        entry = self._entries.get(name)
+        return {
+            'available': signature is not None,
+            'loaded': entry is not None,
+            'stale': entry is not None and entry.signature != signature,
+            'file_size_bytes': signature[1] if signature else None,
+            'memory_size_bytes': entry.size_bytes if entry else None,
+            'load_seconds': round(entry.load_seconds, 4) if entry else None,
+            'loaded_at': entry.loaded_at if entry else None
+        }
@@ -0,0 +1,217 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from .fixed_point import FixedPointArray
+from app.utils.tx_io import iter_chunks
+
+# Zaman çözünürlükleri (saniye); sayı verilirse saniye cinsinden dilim genişliğidir
+RESOLUTIONS = {'hour': 3600, 'day': 24 * 3600, 'week': 7 * 24 * 3600}
+DEFAULT_RESOLUTION = 'day'
+# Tüm süreyi bölen eşit genişlikli dilim sayısı (transaction_volume_by_time)
+SPAN_BINS = 10
+# Tek sorguda üretilebilecek en fazla dilim
+MAX_BINS = 100000
+
+# Dosyadan okunan işlem alanları
+TEMPORAL_COLUMNS = ['timeStamp', 'value', 'blockNumber']
+
+_CACHE_SIZE = 4
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def bin_width(resolution):
+    """'hour' / 'day' / 'week' ya da pozitif saniye sayısını dilim genişliğine çevir"""
+    if resolution in RESOLUTIONS:
+        return RESOLUTIONS[resolution]
+    try:
+        width = int(resolution)
+    except (TypeError, ValueError):
+        width = 0
+    if width <= 0:
+        raise ValueError(f"Geçersiz çözünürlük: {resolution}")
+    return width
+
+def _bin_count(first, last, width):
+    n_bins = (last - first) // width + 1
+    if n_bins > MAX_BINS:
+        raise ValueError(f"Çok fazla dilim ({n_bins}); daha kaba bir çözünürlük seçin")
+    return int(n_bins)
+
+def bin_series(keys, values, width, origin=None):
+    """
+    keys (zaman damgası ya da blok numarası) dizisini width genişliğinde
+    dilimlere ayır; sayı ve hacim np.bincount ile birlikte hesaplanır.
+
+    origin verilmezse ilk anahtar width'in katına aşağı yuvarlanır.
+
+    Returns:
+    --------
+    dict
+        {"start": [...], "count": [...], "volume": [...]}; boş dilimler dahil
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    if not len(keys):
+        return {"start": [], "count": [], "volume": []}
+    if origin is None:
+        origin = keys.min() // width * width
+    n_bins = _bin_count(origin, keys.max(), width)
+    positions = (keys - origin) // width
+    return {
+        "start": (origin + width * np.arange(n_bins)).tolist(),
+        "count": np.bincount(positions, minlength=n_bins).tolist(),
+        "volume": np.bincount(positions, weights=values, minlength=n_bins).tolist()
+    }
+
+def _cumulative(values):
+    """Başında 0 olan kümülatif toplam: [a, b) aralığının toplamı cum[b] - cum[a]"""
+    cumulative = np.zeros(len(values) + 1)
+    np.cumsum(values, out=cumulative[1:])
+    return cumulative
+
+class TemporalIndex:
+    """
+    Zaman damgasına (ve varsa blok numarasına) göre sıralanmış işlem
+    değerleri ve kümülatif toplamları.
+
+    Sıralama ve kümülatif toplam bir kez hesaplanır; sonra herhangi bir
+    çözünürlükteki dilimler ve [başlangıç, bitiş) aralık sorguları
+    searchsorted ile O(dilim sayısı · log n) sürede yanıtlanır.
+    """
+    def __init__(self, timestamps, values, blocks=None):
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        order = np.argsort(timestamps, kind='stable')
+        self.timestamps = timestamps[order]
+        self.values = values[order]
+        self._cumulative = _cumulative(self.values)
+
+        self.blocks = None
+        if blocks is not None:
+            blocks = np.asarray(blocks, dtype=np.int64)
+            block_order = np.argsort(blocks, kind='stable')
+            self.blocks = blocks[block_order]
+            self._block_cumulative = _cumulative(values[block_order])
+
+    @classmethod
+    def from_graph(cls, G):
+        """Kenar zaman damgaları ve ağırlıklarından (load_graph_from_json biçimi)"""
+        n_edges = G.number_of_edges()
+        return cls(
+            np.fromiter((d["timestamp"] for _, _, d in G.edges(data=True)), dtype=np.int64, count=n_edges),
+            np.fromiter((d["weight"] for _, _, d in G.edges(data=True)), dtype=np.float64, count=n_edges)
+        )
+
+    @classmethod
+    def from_file(cls, filepath):
+        """İşlem dosyasından işlem düzeyinde indeks (değerler ETH)"""
+        timestamps, values, blocks = [], [], []
+        for chunk in iter_chunks(filepath, columns=TEMPORAL_COLUMNS):
+            timestamps.append(np.array(chunk["timeStamp"].to_numpy(dtype=object), dtype=np.int64))
+            values.append(FixedPointArray.from_strings(chunk["value"].to_numpy(dtype=object)).to_float())
+            block_numbers = chunk["blockNumber"].to_numpy(dtype=object)
+            # Blok numarası olmayan dosyalarda blok aralığı sorguları kullanılamaz
+            blocks.append(None if any(b is None for b in block_numbers) else np.array(block_numbers, dtype=np.int64))
+        if not timestamps:
+            return cls(np.zeros(0, dtype=np.int64), np.zeros(0))
+        has_blocks = all(b is not None for b in blocks)
+        return cls(np.concatenate(timestamps), np.concatenate(values),
+                   np.concatenate(blocks) if has_blocks else None)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def first(self):
+        return int(self.timestamps[0]) if len(self) else 0
+
+    @property
+    def last(self):
+        return int(self.timestamps[-1]) if len(self) else 0
+
+    @property
+    def span(self):
+        """İlk ve son işlem arasındaki süre (saniye)"""
+        return self.last - self.first
+
+    @staticmethod
+    def _query(keys, cumulative, edges):
+        positions = np.searchsorted(keys, edges, side='left')
+        counts = np.diff(positions)
+        volumes = np.diff(cumulative[positions])
+        # Boş dilimlerde kümülatif farkın yuvarlama artığı kalmasın
+        volumes[counts == 0] = 0.0
+        return counts, volumes
+
+    def range(self, start, end):
+        """[start, end) zaman aralığındaki işlem sayısı ve hacmi"""
+        counts, volumes = self._query(self.timestamps, self._cumulative, np.array([start, end], dtype=np.int64))
+        return int(counts[0]), float(volumes[0])
+
+    def _bins(self, keys, cumulative, width, origin):
+        if not len(keys):
+            return {"start": [], "count": [], "volume": []}
+        if origin is None:
+            origin = int(keys[0]) // width * width
+        edges = origin + width * np.arange(_bin_count(origin, int(keys[-1]), width) + 1, dtype=np.int64)
+        counts, volumes = self._query(keys, cumulative, edges)
+        return {"start": edges[:-1].tolist(), "count": counts.tolist(), "volume": volumes.tolist()}
+
+    def bins(self, resolution=DEFAULT_RESOLUTION, origin=None):
+        """
+        Zaman dilimlerine göre işlem sayısı ve hacmi.
+
+        resolution: 'hour', 'day', 'week' ya da saniye cinsinden genişlik.
+        Dilimler origin'den (varsayılan: ilk işlemin dilim başı) başlar.
+        """
+        width = bin_width(resolution)
+        return {"resolution": resolution, "width": width,
+                **self._bins(self.timestamps, self._cumulative, width, origin)}
+
+    def block_bins(self, size, origin=None):
+        """size bloklık aralıklara göre işlem sayısı ve hacmi"""
+        if self.blocks is None:
+            raise ValueError("Blok numarası olmayan veride blok aralığı kullanılamaz")
+        size = int(size)
+        if size <= 0:
+            raise ValueError(f"Geçersiz blok aralığı: {size}")
+        return {"block_range": size, **self._bins(self.blocks, self._block_cumulative, size, origin)}
+
+    def span_bins(self, n_bins=SPAN_BINS):
+        """
+        Tüm süreyi n_bins eşit genişlikli dilime böl (ilk işlemden başlayarak).
+        Süre n_bins saniyeden kısaysa dilim genişliği 1 saniyedir.
+        """
+        return bin_series(self.timestamps, self.values, max(1, self.span // n_bins), origin=self.first)
+
+def temporal_summary(index, resolution=DEFAULT_RESOLUTION, block_range=None):
+    """
+    Zamansal analiz özeti: toplam süre, SPAN_BINS eşit dilimdeki hacim ve
+    sayılar, istenen çözünürlükteki dilimler ve (varsa) blok aralıkları.
+    """
+    if not len(index):
+        return {}
+    span = index.span_bins()
+    summary = {
+        "time_span_days": index.span / (24 * 3600),
+        "transaction_volume_by_time": {i: v for i, (c, v) in enumerate(zip(span["count"], span["volume"])) if c},
+        "transaction_count_by_time": {i: c for i, c in enumerate(span["count"]) if c}
+    }
+    if resolution:
+        summary["bins"] = index.bins(resolution)
+    if block_range:
+        summary["block_bins"] = index.block_bins(block_range)
+    return summary
+
+def cached_index(version, build):
+    """Sürüm (ör. dosya parmak izi) başına bir kez oluşturulan TemporalIndex"""
+    with _cache_lock:
+        index = _cache.get(version)
+        if index is not None:
+            _cache.move_to_end(version)
+            return index
+    index = build()
+    with _cache_lock:
+        _cache[version] = index
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
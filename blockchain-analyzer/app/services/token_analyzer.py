@@ -1,11 +1,17 @@
 import json
 from web3 import Web3
 from collections import defaultdict
-import requests
+from concurrent.futures import ThreadPoolExecutor
 import os
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
+from app.utils.etherscan_client import get_etherscan_client
+from app.services.analyzer import HIGH_VALUE_WEI
+from app.services.burst_detection import rapid_pairs, sliding_window_bursts
+from app.services.fixed_point import MAX_VECTOR_DIGITS, FixedPointArray
+from app.services.tx_frame import TxFrame
 
 # ERC20 ABI
 ERC20_ABI = json.loads('''[
@@ -22,56 +28,111 @@ ERC721_ABI = json.loads('''[
     {"constant":true,"inputs":[{"name":"_owner","type":"address"}],"name":"balanceOf","outputs":[{"name":"","type":"uint256"}],"type":"function"}
 ]''')
 
+# analyze_tokens için istek başına bir kez çekilen Etherscan aksiyonları
+FETCH_PLAN = ('txlist', 'tokentx', 'tokennft')
+
+def _token_amounts(raw_values, token_decimals):
+    """
+    Convert raw integer token amounts to display units (float64).
+
+    Amounts are parsed exactly into a FixedPointArray and scaled once per
+    distinct decimals value; only the final display value is a float.
+    Amounts wider than the fixed-point range (e.g. 2**256 - 1 spam
+    transfers) are divided as exact Python ints.
+    """
+    raw_values = np.asarray(raw_values, dtype=str)
+    decimals = np.asarray(token_decimals, dtype=np.int64)
+    values = np.empty(len(raw_values))
+    wide = np.char.str_len(raw_values) > MAX_VECTOR_DIGITS
+    rows = np.flatnonzero(~wide)
+    amounts = FixedPointArray.from_strings(raw_values[rows])
+    for d in np.unique(decimals[rows]):
+        group = decimals[rows] == d
+        values[rows[group]] = amounts[group].to_float(int(d))
+    for i in np.flatnonzero(wide):
+        values[i] = int(raw_values[i]) / 10 ** int(decimals[i])
+    return values
+
 class TokenAnalyzer:
     def __init__(self):
         # Önce .env'den node URL'ini al, yoksa public node kullan
         node_url = os.getenv('ETHEREUM_NODE_URL', 'https://eth.llamarpc.com')
         self.w3 = Web3(Web3.HTTPProvider(node_url))
         self.etherscan_api_key = os.getenv('ETHERSCAN_API_KEY', 'MNBZMBKZFY2D1FBCCSPPF4RSM9ZHACR56S')
+        # Bağlantı havuzu ve hız sınırı tüm analizler arasında paylaşılır
+        self.etherscan = get_etherscan_client()
+
+    def _etherscan(self, action, address):
+        """Paylaşılan istemci üzerinden Etherscan account çağrısı"""
+        return self.etherscan.call('account', action, api_key=self.etherscan_api_key, address=address)
+
+    def _fetch(self, action, address):
+        """Aksiyonun sonuç listesini döndür (başarısız yanıtlar boş liste sayılır)"""
+        data = self._etherscan(action, address)
+        if data.get('status') == '1':
+            return data['result']
+        return []
+
+    def _fetch_plan(self, address, actions=FETCH_PLAN):
+        """
+        Analiz için gereken her Etherscan aksiyonunu bir kez ve eşzamanlı çek.
+
+        Toplam süre en yavaş tek çağrıya yaklaşır; hız sınırı paylaşılan
+        istemcide uygulanır.
+        """
+        with ThreadPoolExecutor(max_workers=len(actions)) as executor:
+            futures = {action: executor.submit(self._fetch, action, address) for action in actions}
+            return {action: future.result() for action, future in futures.items()}
 
     def analyze_tokens(self, address):
         """Analyze all token interactions for a given address"""
+        fetched = self._fetch_plan(address)
+        # txlist gaz ve risk hesaplarında ortak kullanılır
+        transactions = fetched['txlist']
         results = {
-            'erc20': self._analyze_erc20(address),
-            'erc721': self._analyze_erc721(address),
+            'erc20': self._analyze_erc20(address, fetched['tokentx']),
+            'erc721': self._analyze_erc721(address, fetched['tokennft']),
             'erc1155': self._analyze_erc1155(address),
-            'gas_analysis': self._analyze_gas_usage(address),
-            'risk_score': self._calculate_risk_score(address)
+            'gas_analysis': self._analyze_gas_usage(address, transactions),
+            'risk_score': self._calculate_risk_score(address, transactions)
         }
         return results
 
-    def _analyze_erc20(self, address):
+    def _analyze_erc20(self, address, transfers=None):
         """Analyze ERC20 token interactions"""
         tokens = []
         # Get token transfers from Etherscan
-        url = f"https://api.etherscan.io/api?module=account&action=tokentx&address={address}&apikey={self.etherscan_api_key}"
-        response = requests.get(url)
-        data = response.json()
+        if transfers is None:
+            transfers = self._fetch('tokentx', address)
+
+        if transfers:
+            values = _token_amounts(
+                [tx['value'] for tx in transfers], [tx['tokenDecimal'] for tx in transfers]
+            ).tolist()
+            address_lower = address.lower()
 
-        if data['status'] == '1':
-            for tx in data['result']:
+            for tx, value in zip(transfers, values):
                 token = {
                     'contract_address': tx['contractAddress'],
                     'token_name': tx['tokenName'],
                     'token_symbol': tx['tokenSymbol'],
                     'decimals': tx['tokenDecimal'],
-                    'value': float(tx['value']) / (10 ** int(tx['tokenDecimal'])),
+                    'value': value,
                     'timestamp': tx['timeStamp'],
-                    'type': 'in' if tx['to'].lower() == address.lower() else 'out'
+                    'type': 'in' if tx['to'].lower() == address_lower else 'out'
                 }
                 tokens.append(token)
 
         return tokens
 
-    def _analyze_erc721(self, address):
+    def _analyze_erc721(self, address, transfers=None):
         """Analyze ERC721 (NFT) interactions"""
         nfts = []
-        url = f"https://api.etherscan.io/api?module=account&action=tokennft&address={address}&apikey={self.etherscan_api_key}"
-        response = requests.get(url)
-        data = response.json()
+        if transfers is None:
+            transfers = self._fetch('tokennft', address)
 
-        if data['status'] == '1':
-            for tx in data['result']:
+        if transfers:
+            for tx in transfers:
                 nft = {
                     'contract_address': tx['contractAddress'],
                     'token_name': tx['tokenName'],
@@ -90,11 +151,10 @@ class TokenAnalyzer:
         # This would require custom event listening or additional data sources
         return []
 
-    def _analyze_gas_usage(self, address):
+    def _analyze_gas_usage(self, address, transactions=None):
         """Analyze gas usage patterns"""
-        url = f"https://api.etherscan.io/api?module=account&action=txlist&address={address}&apikey={self.etherscan_api_key}"
-        response = requests.get(url)
-        data = response.json()
+        if transactions is None:
+            transactions = self._fetch('txlist', address)
 
         gas_analysis = {
             'total_gas_used': 0,
@@ -103,9 +163,9 @@ class TokenAnalyzer:
             'transactions': []
         }
 
-        if data['status'] == '1':
+        if transactions:
             gas_prices = []
-            for tx in data['result']:
+            for tx in transactions:
                 gas_used = int(tx['gasUsed'])
                 gas_price = int(tx['gasPrice'])
                 gas_cost = gas_used * gas_price / 1e18  # Convert to ETH
@@ -127,34 +187,30 @@ class TokenAnalyzer:
 
         return gas_analysis
 
-    def _calculate_risk_score(self, address):
+    def _calculate_risk_score(self, address, transactions=None):
         """Calculate risk score based on various factors"""
         risk_factors = {
             'high_value_transactions': 0,
             'suspicious_contracts': 0,
             'rapid_transactions': 0,
+            'rapid_bursts': 0,
             'total_score': 0
         }
 
         # Get transaction history
-        url = f"https://api.etherscan.io/api?module=account&action=txlist&address={address}&apikey={self.etherscan_api_key}"
-        response = requests.get(url)
-        data = response.json()
-
-        if data['status'] == '1':
-            transactions = data['result']
-            
-            # Check for high value transactions (>100 ETH)
-            for tx in transactions:
-                value = float(tx['value']) / 1e18
-                if value > 100:
-                    risk_factors['high_value_transactions'] += 1
-
-            # Check for rapid transactions (multiple transactions within 1 minute)
-            for i in range(1, len(transactions)):
-                time_diff = int(transactions[i]['timeStamp']) - int(transactions[i-1]['timeStamp'])
-                if time_diff < 60:
-                    risk_factors['rapid_transactions'] += 1
+        if transactions is None:
+            transactions = self._fetch('txlist', address)
+
+        if transactions:
+            frame = TxFrame.from_transactions(transactions)
+
+            # Check for high value transactions (>100 ETH), exact wei comparison
+            risk_factors['high_value_transactions'] = int(frame.value.greater_than(HIGH_VALUE_WEI).sum())
+
+            # Check for rapid transactions (same sender within 1 minute, in time order)
+            first, _, _ = rapid_pairs(frame.from_id, frame.timestamp)
+            risk_factors['rapid_transactions'] = len(first)
+            risk_factors['rapid_bursts'] = len(sliding_window_bursts(frame.from_id, frame.timestamp))
 
         # Calculate total risk score (0-100)
         risk_factors['total_score'] = min(100, (
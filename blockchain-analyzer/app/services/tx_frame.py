@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from .fixed_point import FixedPointArray
+
+class TxFrame:
+    """
+    Etherscan txlist kayıtlarının tipli, sütunlu gösterimi.
+
+    Dict listesi tek adımda NumPy dizilerine çevrilir; adresler bir kez
+    tekilleştirilip tamsayı kimliklere (from_id, to_id) dönüştürülür. Tüm
+    metrikler ve anomali kuralları bu diziler üzerinde vektörel hesaplanır.
+
+    Attributes:
+    -----------
+    hash : numpy.ndarray (object)
+    value : FixedPointArray
+        Tam wei değerleri (toplam ve eşikler için)
+    value_eth : numpy.ndarray (float64)
+        Gösterim için ETH değerleri
+    timestamp : numpy.ndarray (int64)
+    is_error : numpy.ndarray (bool)
+    from_id, to_id : numpy.ndarray (int32)
+        addresses dizisindeki indeks; alan yoksa (None) -1
+    addresses : numpy.ndarray (object)
+        Tekil adresler (ilk görülme sırasıyla)
+    """
+    def __init__(self, hashes, value, timestamp, is_error, from_id, to_id, addresses):
+        self.hash = hashes
+        self.value = value
+        self.value_eth = value.to_float()
+        self.timestamp = timestamp
+        self.is_error = is_error
+        self.from_id = from_id
+        self.to_id = to_id
+        self.addresses = addresses
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    @staticmethod
+    def _intern(from_values, to_values):
+        """from ve to adreslerini tek tabloda tamsayı kimliklere çevir"""
+        n = len(from_values)
+        combined = np.empty(n + len(to_values), dtype=object)
+        combined[:n] = from_values
+        combined[n:] = to_values
+        codes, addresses = pd.factorize(combined)
+        codes = codes.astype(np.int32)
+        return codes[:n], codes[n:], np.asarray(addresses, dtype=object)
+
+    @classmethod
+    def from_transactions(cls, transactions):
+        """Etherscan dict listesinden TxFrame oluştur"""
+        if isinstance(transactions, pd.DataFrame):
+            return cls.from_frame(transactions)
+
+        from_id, to_id, addresses = cls._intern(
+            [tx["from"] for tx in transactions],
+            [tx.get("to") for tx in transactions]
+        )
+        return cls(
+            hashes=np.array([tx["hash"] for tx in transactions], dtype=object),
+            value=FixedPointArray.from_strings([tx["value"] for tx in transactions]),
+            timestamp=np.array([tx["timeStamp"] for tx in transactions], dtype=np.int64),
+            is_error=np.array([tx["isError"] for tx in transactions], dtype=object) != "0",
+            from_id=from_id,
+            to_id=to_id,
+            addresses=addresses
+        )
+
+    @classmethod
+    def from_frame(cls, df):
+        """String sütunlu (read_transactions çıktısı) DataFrame'den TxFrame oluştur"""
+        from_id, to_id, addresses = cls._intern(
+            df["from"].to_numpy(dtype=object),
+            df["to"].to_numpy(dtype=object) if "to" in df else np.full(len(df), None, dtype=object)
+        )
+        return cls(
+            hashes=df["hash"].to_numpy(dtype=object),
+            value=FixedPointArray.from_strings(df["value"].to_numpy(dtype=object)),
+            timestamp=np.array(df["timeStamp"].to_numpy(dtype=object), dtype=np.int64),
+            is_error=df["isError"].to_numpy(dtype=object) != "0",
+            from_id=from_id,
+            to_id=to_id,
+            addresses=addresses
+        )
+
+    @property
+    def ok(self):
+        """Başarılı işlemler maskesi"""
+        return ~self.is_error
+
+    def address(self, ids):
+        """Kimlik dizisini adres string'lerine çevir (-1 -> None)"""
+        ids = np.asarray(ids)
+        result = np.full(len(ids), None, dtype=object)
+        valid = ids >= 0
+        result[valid] = self.addresses[ids[valid]]
+        return result
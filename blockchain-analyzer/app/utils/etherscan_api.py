@@ -1,22 +1,49 @@
-import requests
 import os
+import threading
+from app.utils.etherscan_client import get_etherscan_client
+from app.utils.tx_store import TransactionStore
 
-ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY")  # .env dosyasına yazılabilir
+# İşlem önbelleği (SQLite); ETHERSCAN_CACHE=false ile devre dışı bırakılır
+CACHE_ENABLED = os.getenv("ETHERSCAN_CACHE", "true").lower() == "true"
 
-BASE_URL = "https://api.etherscan.io/api"
+_store = None
+_store_lock = threading.Lock()
 
-def get_transactions(address, start_block=0, end_block=99999999):
-    params = {
-        "module": "account",
-        "action": "txlist",
-        "address": address,
-        "startblock": start_block,
-        "endblock": end_block,
-        "sort": "asc",
-        "apikey": ETHERSCAN_API_KEY
-    }
-    response = requests.get(BASE_URL, params=params)
-    data = response.json()
-    if data["status"] != "1":
-        raise ValueError(f"Etherscan API error: {data.get('message', 'Unknown error')}")
-    return data["result"]
+def get_store():
+    """Paylaşılan işlem önbelleğini döndür"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TransactionStore()
+    return _store
+
+def fetch_transactions(address, start_block=0, end_block=99999999):
+    """Etherscan'den tek bir txlist çağrısı yap (önbelleksiz)"""
+    # Yeni blok aralığında işlem olmaması hata değildir; istemci boş liste döndürür
+    return get_etherscan_client().get_result(
+        "account", "txlist",
+        address=address,
+        startblock=start_block,
+        endblock=end_block,
+        sort="asc"
+    )
+
+def get_transactions(address, start_block=0, end_block=99999999, use_cache=CACHE_ENABLED):
+    """
+    Adresin işlemlerini döndür; aralıkta işlem yoksa ValueError yükseltir.
+
+    Önbellek açıkken adres yalnızca son senkronize edilen bloktan sonrası için
+    Etherscan'e sorulur; geri kalanı yerel depodan okunur.
+    """
+    if use_cache:
+        store = get_store()
+        store.sync(address, fetch_transactions)
+        transactions = store.get_transactions(address, start_block, end_block)
+    else:
+        transactions = fetch_transactions(address, start_block, end_block)
+
+    # Önceki davranış korunur: hiç işlem yoksa Etherscan hatası yükseltilir
+    if not transactions:
+        raise ValueError("Etherscan API error: No transactions found")
+    return transactions
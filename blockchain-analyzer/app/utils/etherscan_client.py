@@ -0,0 +1,186 @@
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.getenv("ETHERSCAN_BASE_URL", "https://api.etherscan.io/api")
+
+# API anahtarının saniyedeki çağrı hakkı (ücretsiz katman: 5/sn)
+CALLS_PER_SECOND = float(os.getenv("ETHERSCAN_CALLS_PER_SECOND", "5"))
+
+class TokenBucket:
+    """
+    Uyarlanabilir token bucket hız sınırlayıcı.
+
+    Etherscan "Max rate limit reached" döndürdüğünde hız yarıya indirilir,
+    başarılı çağrılarla yavaşça tanımlı üst sınıra geri çıkar.
+    """
+    def __init__(self, rate, capacity=None, min_rate=0.5):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = min(min_rate, self.max_rate)
+        self.capacity = capacity or max(1.0, self.max_rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Bir çağrı hakkı alınana kadar bekle"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_throttled(self):
+        """Sunucu hız sınırı bildirdi: hızı düşür ve biriken hakları sıfırla"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            self._updated = time.monotonic()
+
+    def on_success(self):
+        """Başarılı çağrı: hızı kademeli olarak üst sınıra yaklaştır"""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+class EtherscanClient:
+    """
+    Tüm Etherscan çağrıları için ortak istemci.
+
+    Keep-alive bağlantı havuzu kullanan tek bir requests.Session, API
+    anahtarının katmanına uygun token bucket, hız sınırı ve ağ hatalarında
+    jitter'lı üstel geri çekilme ile yeniden deneme ve çağrı başına gecikme
+    sayaçları sağlar. Birden fazla iş parçacığı aynı istemciyi paylaşabilir.
+    """
+    def __init__(self, api_key=None, base_url=BASE_URL, calls_per_second=CALLS_PER_SECOND,
+                 max_retries=5, timeout=30, pool_size=16, backoff_base=0.5, backoff_max=16.0):
+        self.api_key = api_key if api_key is not None else os.getenv("ETHERSCAN_API_KEY")
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = TokenBucket(calls_per_second)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self._stats = defaultdict(lambda: {
+            'calls': 0, 'errors': 0, 'retries': 0, 'rate_limited': 0,
+            'total_latency': 0.0, 'max_latency': 0.0
+        })
+
+    @staticmethod
+    def is_rate_limited(data):
+        return data.get("status") == "0" and "rate limit" in str(data.get("result", "")).lower()
+
+    def _record(self, action, latency=None, error=False, retry=False, rate_limited=False):
+        with self._stats_lock:
+            stats = self._stats[action]
+            if latency is not None:
+                stats['calls'] += 1
+                stats['total_latency'] += latency
+                stats['max_latency'] = max(stats['max_latency'], latency)
+            stats['errors'] += int(error)
+            stats['retries'] += int(retry)
+            stats['rate_limited'] += int(rate_limited)
+
+    def _backoff(self, attempt):
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        time.sleep(delay * random.uniform(0.5, 1.5))
+
+    def call(self, module, action, api_key=None, **params):
+        """
+        Etherscan API çağrısı yap ve ham JSON yanıtını döndür.
+
+        Hız sınırı yanıtlarında ve ağ hatalarında max_retries kez yeniden dener.
+        """
+        query = {"module": module, "action": action, **params,
+                 "apikey": api_key if api_key is not None else self.api_key}
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            start_time = time.perf_counter()
+            try:
+                response = self.session.get(self.base_url, params=query, timeout=self.timeout)
+                data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                self._record(action, time.perf_counter() - start_time, error=True)
+                if attempt == self.max_retries:
+                    raise ValueError(f"Etherscan API error: {e}")
+                self._record(action, retry=True)
+                self._backoff(attempt)
+                continue
+
+            self._record(action, time.perf_counter() - start_time)
+            if self.is_rate_limited(data):
+                self._record(action, rate_limited=True)
+                self.limiter.on_throttled()
+                if attempt == self.max_retries:
+                    raise ValueError(f"Etherscan API error: {data.get('result')}")
+                self._record(action, retry=True)
+                self._backoff(attempt)
+                continue
+
+            self.limiter.on_success()
+            return data
+
+    def get_result(self, module, action, api_key=None, **params):
+        """
+        Çağrının result alanını döndür; "No transactions found" boş liste sayılır,
+        diğer hatalar ValueError olarak yükseltilir.
+        """
+        data = self.call(module, action, api_key=api_key, **params)
+        if data.get("status") != "1":
+            if str(data.get("message", "")).startswith("No transactions found"):
+                return []
+            raise ValueError(f"Etherscan API error: {data.get('message', 'Unknown error')}")
+        return data["result"]
+
+    def stats(self):
+        """Aksiyon bazında çağrı sayısı, hata ve gecikme sayaçları"""
+        with self._stats_lock:
+            result = {}
+            for action, stats in self._stats.items():
+                calls = stats['calls']
+                result[action] = {
+                    'calls': calls,
+                    'errors': stats['errors'],
+                    'retries': stats['retries'],
+                    'rate_limited': stats['rate_limited'],
+                    'avg_latency_ms': round(stats['total_latency'] / calls * 1000, 2) if calls else 0,
+                    'max_latency_ms': round(stats['max_latency'] * 1000, 2)
+                }
+            return {
+                'current_rate': round(self.limiter.rate, 3),
+                'max_rate': self.limiter.max_rate,
+                'actions': result
+            }
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_etherscan_client():
+    """Süreç genelinde paylaşılan Etherscan istemcisini döndür"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = EtherscanClient()
+    return _client
@@ -0,0 +1,252 @@
+import json
+import os
+import re
+import sys
+import pandas as pd
+
+# Ham işlem deposu için desteklenen dosyalar, tercih sırasına göre
+RAW_TRANSACTION_FILES = ('raw_transactions.parquet', 'raw_transactions.ndjson', 'raw_transactions.json')
+
+DEFAULT_CHUNK_SIZE = 100000
+
+_SEPARATORS = re.compile(r'[\s,]*')
+
+def find_raw_transactions(data_dir):
+    """
+    data_dir içindeki ham işlem dosyasını bul (parquet > ndjson > json).
+
+    Hiçbiri yoksa eski varsayılan olan raw_transactions.json yolu döner.
+    """
+    for name in RAW_TRANSACTION_FILES:
+        path = os.path.join(data_dir, name)
+        if os.path.exists(path):
+            return path
+    return os.path.join(data_dir, RAW_TRANSACTION_FILES[-1])
+
+def format_for_path(path):
+    """Dosya uzantısından biçimi belirle ('parquet', 'ndjson' veya 'json')"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.parquet':
+        return 'parquet'
+    if ext in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    return 'json'
+
+def detect_format(path):
+    """
+    Var olan dosyanın biçimini belirle.
+
+    .json uzantılı dosyalar ilk karaktere bakılarak ayırt edilir: '[' JSON
+    dizisi, '{' satır başına bir işlem (NDJSON) demektir.
+    """
+    fmt = format_for_path(path)
+    if fmt != 'json':
+        return fmt
+    with open(path, 'rb') as f:
+        while True:
+            ch = f.read(1)
+            if not ch or not ch.isspace():
+                break
+    return 'ndjson' if ch == b'{' else 'json'
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet desteği için pyarrow gerekli: pip install pyarrow")
+    return pyarrow
+
+def _iter_json_array(f, buffer_size=1 << 20):
+    """
+    JSON dizisinin elemanlarını tüm dosyayı belleğe almadan sırayla döndür.
+
+    Dosya parça parça okunur ve her eleman raw_decode ile ayrıştırılır;
+    girintili (indent=2) eski dosyalar da desteklenir.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(buffer_size).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("JSON dizisi bekleniyordu")
+    pos = 1
+    eof = False
+
+    while True:
+        pos = _SEPARATORS.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+        try:
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                if pos >= len(buffer):
+                    return
+                raise
+            # Eleman tamponun sonunda kesilmiş: okunmamış kısmı koru ve devam et
+            chunk = f.read(buffer_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        yield item
+
+def iter_transactions(path):
+    """Dosyadaki işlemleri (dict) biçimden bağımsız olarak akış halinde döndür"""
+    fmt = detect_format(path)
+    if fmt == 'parquet':
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=DEFAULT_CHUNK_SIZE):
+            yield from batch.to_pylist()
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if fmt == 'json':
+            yield from _iter_json_array(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+def _frame_from_records(records, columns=None):
+    if columns is None:
+        return pd.DataFrame(records)
+    # Sütun sütun kurmak, satır başına dict oluşturmaktan daha hızlıdır
+    return pd.DataFrame({col: [tx.get(col) for tx in records] for col in columns}, columns=columns)
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNK_SIZE, columns=None):
+    """
+    İşlemleri en fazla chunksize satırlık DataFrame parçaları halinde döndür.
+
+    columns verilirse yalnızca bu sütunlar okunur (Parquet'te diskten hiç
+    okunmaz, JSON biçimlerinde parça oluşturulurken atılır).
+    """
+    if detect_format(path) == 'parquet':
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    records = []
+    for tx in iter_transactions(path):
+        records.append(tx)
+        if len(records) >= chunksize:
+            yield _frame_from_records(records, columns)
+            records = []
+    if records:
+        yield _frame_from_records(records, columns)
+
+def read_transactions(path, columns=None, chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    Tüm işlemleri tek DataFrame olarak oku.
+
+    Parçalar sırayla birleştirildiği için ara Python dict listesi yalnızca
+    bir parça kadar yer kaplar.
+    """
+    if detect_format(path) == 'parquet':
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=columns).to_pandas()
+
+    chunks = list(iter_chunks(path, chunksize, columns))
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(chunks, ignore_index=True)
+
+class TransactionWriter:
+    """
+    İşlemleri NDJSON veya Parquet olarak akış halinde yazan yazıcı.
+
+    NDJSON dosyalarına sonradan ekleme yapılabilir (append=True). Parquet
+    dosyası her row_group_size işlemde bir satır grubu yazar; şema ilk
+    gruptaki alanlardan çıkarılır ve tüm alanlar string olarak saklanır.
+    """
+    def __init__(self, path, fmt=None, append=False, row_group_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.format = fmt or format_for_path(path)
+        if self.format not in ('ndjson', 'parquet'):
+            raise ValueError(f"Desteklenmeyen yazma biçimi: {self.format}")
+        if self.format == 'parquet' and append:
+            raise ValueError("Parquet dosyalarına ekleme yapılamaz; yeni dosya yazın")
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._buffer = []
+        self._schema = None
+        self._writer = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.format == 'ndjson':
+            self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+        else:
+            _require_pyarrow()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, transactions):
+        """İşlem listesini yaz"""
+        if self.format == 'ndjson':
+            for tx in transactions:
+                self._file.write(json.dumps(tx))
+                self._file.write('\n')
+            self.count += len(transactions)
+            return
+
+        self._buffer.extend(transactions)
+        while len(self._buffer) >= self.row_group_size:
+            self._flush_row_group(self._buffer[:self.row_group_size])
+            self._buffer = self._buffer[self.row_group_size:]
+
+    def _flush_row_group(self, records):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self._schema is None:
+            names = list(dict.fromkeys(key for tx in records for key in tx))
+            self._schema = pa.schema([(name, pa.string()) for name in names])
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        arrays = [
+            pa.array([None if tx.get(name) is None else str(tx[name]) for tx in records], type=pa.string())
+            for name in self._schema.names
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self.count += len(records)
+
+    def close(self):
+        if self.format == 'ndjson':
+            if not self._file.closed:
+                self._file.close()
+            return
+        if self._buffer:
+            self._flush_row_group(self._buffer)
+            self._buffer = []
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def convert(src, dst, chunksize=DEFAULT_CHUNK_SIZE):
+    """Ham işlem dosyasını başka bir biçime akış halinde dönüştür"""
+    with TransactionWriter(dst, row_group_size=chunksize) as writer:
+        batch = []
+        for tx in iter_transactions(src):
+            batch.append(tx)
+            if len(batch) >= chunksize:
+                writer.write(batch)
+                batch = []
+        if batch:
+            writer.write(batch)
+    return writer.count
+
+if __name__ == "__main__":
+    # Kullanım: python -m app.utils.tx_io data/raw_transactions.json data/raw_transactions.parquet
+    if len(sys.argv) != 3:
+        print("Kullanım: python -m app.utils.tx_io <kaynak> <hedef(.ndjson|.parquet)>")
+        sys.exit(1)
+    count = convert(sys.argv[1], sys.argv[2])
+    print(f"✅ {count} işlem dönüştürüldü → {sys.argv[2]}")
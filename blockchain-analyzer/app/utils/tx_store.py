@@ -0,0 +1,147 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_DB_PATH = os.getenv(
+    "TX_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data', 'etherscan_txs.sqlite')
+)
+
+# Etherscan txlist tek yanıtta en fazla bu kadar kayıt döndürür
+MAX_RESULTS_PER_CALL = 10000
+
+class TransactionStore:
+    """
+    Etherscan txlist yanıtları için SQLite tabanlı kalıcı önbellek.
+
+    Her adres için senkronize edilen en yüksek blok numarası saklanır; sonraki
+    çağrılarda yalnızca startblock = son + 1 aralığı istenir. Aynı işlem iki
+    kez gelirse (adres, hash) anahtarı sayesinde tekrar eklenmez.
+    """
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._address_locks = {}
+        self._locks_guard = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transactions (
+                    address TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    block_number INTEGER NOT NULL,
+                    tx_index INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (address, hash)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transactions_block
+                ON transactions (address, block_number, tx_index)
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    address TEXT PRIMARY KEY,
+                    last_block INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    def _address_lock(self, address):
+        with self._locks_guard:
+            return self._address_locks.setdefault(address, threading.Lock())
+
+    def last_synced_block(self, address):
+        """Adres için senkronize edilmiş en yüksek blok (hiç yoksa None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_block FROM sync_state WHERE address = ?", (address.lower(),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def add_transactions(self, address, transactions, synced_block=None):
+        """İşlemleri ekle ve senkronizasyon durumunu güncelle"""
+        address = address.lower()
+        rows = [
+            (address, tx["hash"], int(tx["blockNumber"]), int(tx.get("transactionIndex", 0) or 0), json.dumps(tx))
+            for tx in transactions
+        ]
+        if synced_block is None and rows:
+            synced_block = max(row[2] for row in rows)
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO transactions (address, hash, block_number, tx_index, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            if synced_block is not None:
+                conn.execute(
+                    "INSERT INTO sync_state (address, last_block, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(address) DO UPDATE SET "
+                    "last_block = MAX(last_block, excluded.last_block), updated_at = excluded.updated_at",
+                    (address, synced_block, time.time())
+                )
+        return len(rows)
+
+    def get_transactions(self, address, start_block=0, end_block=None):
+        """Saklanan işlemleri blok ve işlem sırasına göre döndür"""
+        query = "SELECT payload FROM transactions WHERE address = ? AND block_number >= ?"
+        params = [address.lower(), start_block]
+        if end_block is not None:
+            query += " AND block_number <= ?"
+            params.append(end_block)
+        query += " ORDER BY block_number, tx_index"
+        with self._connect() as conn:
+            return [json.loads(row[0]) for row in conn.execute(query, params)]
+
+    def sync(self, address, fetch, end_block=99999999):
+        """
+        Adresi Etherscan ile senkronize et; yalnızca yeni bloklar istenir.
+
+        Args:
+            address: Cüzdan adresi
+            fetch: fetch(address, start_block, end_block) -> işlem listesi
+            end_block: Senkronizasyonun üst sınırı
+
+        Returns:
+            int: Eklenen işlem sayısı
+        """
+        address = address.lower()
+        with self._address_lock(address):
+            last_block = self.last_synced_block(address)
+            start_block = 0 if last_block is None else last_block + 1
+            added = 0
+
+            while start_block <= end_block:
+                transactions = fetch(address, start_block, end_block)
+                if not transactions:
+                    break
+                highest = max(int(tx["blockNumber"]) for tx in transactions)
+
+                if len(transactions) < MAX_RESULTS_PER_CALL:
+                    added += self.add_transactions(address, transactions, highest)
+                    break
+
+                # Sonuç sınırına ulaşıldı: son blok eksik gelmiş olabilir, o bloktan devam et
+                complete = [tx for tx in transactions if int(tx["blockNumber"]) < highest]
+                if not complete:
+                    # Tek blokta 10.000'den fazla işlem: alınanları kaydet ve bloğu geç
+                    added += self.add_transactions(address, transactions, highest)
+                    start_block = highest + 1
+                    continue
+                added += self.add_transactions(address, complete, highest - 1)
+                start_block = highest
+
+            return added
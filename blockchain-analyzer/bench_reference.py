@@ -0,0 +1,254 @@
+"""
+benchmark.py ve testler için ortak yardımcılar: sentetik veri üreteçleri ve
+değiştirilen fonksiyonların önceki (referans) uygulamaları.
+"""
+from collections import defaultdict
+from datetime import datetime
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+def synthetic_transactions(n_rows, n_addresses, seed=42):
+    """Etherscan txlist biçiminde (string alanlı) sentetik işlem çerçevesi"""
+    rng = np.random.default_rng(seed)
+    addresses = np.array([f"0x{i:040x}" for i in range(n_addresses)], dtype=object)
+    # Gerçekçi dağılım: az sayıda adres işlemlerin çoğunu yapar
+    senders = addresses[np.minimum(rng.zipf(1.3, n_rows) - 1, n_addresses - 1)]
+    receivers = addresses[rng.integers(0, n_addresses, n_rows)]
+    # Değerler uint64 sınırını aşabilir (balina işlemleri); doğrudan ondalık string üretilir
+    wei = np.minimum(rng.lognormal(40, 4, n_rows), 1e24)
+    timestamps = 1600000000 + rng.integers(0, 3 * 365 * 24 * 3600, n_rows)
+    return pd.DataFrame({
+        'hash': [f"0x{i:064x}" for i in range(n_rows)],
+        'from': senders,
+        'to': receivers,
+        'value': np.char.mod('%.0f', wei).astype(object),
+        'timeStamp': timestamps.astype(str).astype(object),
+        'isError': np.where(rng.random(n_rows) < 0.02, '1', '0').astype(object)
+    })
+
+def legacy_feature_matrix(df):
+    """Eski extract_features uygulaması (karşılaştırma için)"""
+    df = df[df['isError'] == '0'].copy()
+    df['value_eth'] = df['value'].astype(float) / 1e18
+    df['time'] = pd.to_datetime(df['timeStamp'].astype(np.int64), unit='s')
+    df = df.sort_values(['from', 'time'])
+    df['date'] = df['time'].dt.date
+    grouped = df.groupby('from').agg(
+        tx_count=('hash', 'count'),
+        total_sent=('value_eth', 'sum'),
+        avg_sent=('value_eth', 'mean'),
+        max_sent=('value_eth', 'max'),
+        min_sent=('value_eth', 'min'),
+        median_sent=('value_eth', 'median'),
+        std_sent=('value_eth', 'std'),
+        unique_receivers=('to', 'nunique'),
+        first_tx=('time', 'min'),
+        last_tx=('time', 'max'),
+        unique_days=('date', 'nunique')
+    ).reset_index()
+    grouped['active_days'] = (grouped['last_tx'] - grouped['first_tx']).dt.days + 1
+    grouped['tx_per_day'] = grouped['tx_count'] / grouped['active_days'].replace(0, 1)
+    grouped['first_last_diff'] = (grouped['last_tx'] - grouped['first_tx']).dt.days
+    burst = df.groupby(['from', 'date']).size().groupby('from').max().rename('burstiness')
+    grouped = grouped.merge(burst, on='from', how='left')
+    def max_gap(times):
+        if len(times) < 2:
+            return 0
+        gaps = np.diff(np.sort(times.values.astype('datetime64[s]').astype(np.int64)))
+        return np.max(gaps) / 3600
+    grouped['max_gap'] = df.groupby('from')['time'].apply(max_gap).values
+    return grouped.fillna(0)
+
+def legacy_detect_anomalies(transactions):
+    """Eski detect_anomalies uygulaması (karşılaştırma için)"""
+    anomalies = {"high_value_txs": [], "rapid_transactions": [], "suspicious_patterns": []}
+    for tx in transactions:
+        value_eth = int(tx["value"]) / 1e18
+        if value_eth > 100:
+            anomalies["high_value_txs"].append({"hash": tx["hash"], "value": value_eth, "from": tx["from"], "to": tx["to"]})
+    if len(transactions) > 1:
+        for i in range(1, len(transactions)):
+            time_diff = int(transactions[i]["timeStamp"]) - int(transactions[i-1]["timeStamp"])
+            if time_diff < 60 and transactions[i]["from"] == transactions[i-1]["from"]:
+                anomalies["rapid_transactions"].append({
+                    "tx1": transactions[i-1]["hash"], "tx2": transactions[i]["hash"], "time_diff": time_diff
+                })
+    address_counts = defaultdict(int)
+    for tx in transactions:
+        if tx["to"]:
+            address_counts[tx["to"]] += 1
+    for address, count in address_counts.items():
+        if count > 10:
+            anomalies["suspicious_patterns"].append({"address": address, "tx_count": count})
+    return anomalies
+
+def legacy_analyze_transactions(transactions):
+    """Eski analyze_transactions uygulaması (karşılaştırma için)"""
+    total_eth = sum([int(tx["value"]) / 1e18 for tx in transactions if tx["isError"] == "0"])
+    timestamps = [int(tx["timeStamp"]) for tx in transactions]
+    if timestamps:
+        time_span = (datetime.fromtimestamp(max(timestamps)) - datetime.fromtimestamp(min(timestamps))).days
+    else:
+        time_span = 0
+    values = [int(tx["value"]) / 1e18 for tx in transactions if tx["isError"] == "0"]
+    if values:
+        avg_value, max_value, value_std = np.mean(values), max(values), np.std(values)
+    else:
+        avg_value = max_value = value_std = 0
+    anomalies = legacy_detect_anomalies(transactions)
+    contract_interactions = sum(1 for tx in transactions if tx.get("to", "").startswith("0x") and len(tx["to"]) == 42)
+    return {
+        "total_eth_sent": round(total_eth, 4),
+        "tx_count": len(transactions),
+        "time_span_days": time_span,
+        "avg_transaction_value": round(avg_value, 4),
+        "max_transaction_value": round(max_value, 4),
+        "value_std_dev": round(value_std, 4),
+        "contract_interactions": contract_interactions,
+        "anomalies": anomalies
+    }
+
+def synthetic_wallet(n_rows, seed=42):
+    """Tek bir cüzdanın txlist geçmişi (blok sırasında, kontrat oluşturmaları dahil)"""
+    df = synthetic_transactions(n_rows, max(n_rows // 20, 2), seed)
+    rng = np.random.default_rng(seed + 1)
+    wallet = "0x" + "ab" * 20
+    outgoing = rng.random(n_rows) < 0.6
+    df.loc[outgoing, 'from'] = wallet
+    df.loc[~outgoing, 'to'] = wallet
+    df.loc[rng.random(n_rows) < 0.01, 'to'] = ''
+    # Blok sırası: artan zaman damgaları, sık sık aynı dakika içinde
+    df['timeStamp'] = (1600000000 + np.cumsum(rng.exponential(120, n_rows)).astype(np.int64)).astype(str)
+    return df.to_dict('records')
+
+def assert_equivalent(expected, actual, path='sonuç'):
+    """Yapıları karşılaştır; float'lar son basamak yuvarlamasına kadar eşit sayılır"""
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys(), f"{path}: anahtarlar farklı"
+        for key in expected:
+            assert_equivalent(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert len(expected) == len(actual), f"{path}: uzunluk {len(expected)} != {len(actual)}"
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            assert_equivalent(e, a, f"{path}[{i}]")
+    elif isinstance(expected, (float, np.floating)):
+        assert np.isclose(expected, actual, rtol=1e-12, atol=1e-12), f"{path}: {expected} != {actual}"
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+def _sender_timelines(sender_ids, timestamps):
+    """Gönderici başına işlem indeksleri, zaman sırasında (eşit zamanda orijinal sıra)"""
+    timelines = defaultdict(list)
+    for i, sender in enumerate(sender_ids):
+        timelines[sender].append(i)
+    return [sorted(indices, key=lambda i: timestamps[i]) for indices in timelines.values()]
+
+def reference_rapid_pairs(sender_ids, timestamps, window):
+    """Kaba kuvvet: aynı göndericinin ardışık işlemleri window saniyeden yakınsa çift"""
+    pairs = set()
+    for timeline in _sender_timelines(sender_ids, timestamps):
+        for a, b in zip(timeline, timeline[1:]):
+            if timestamps[b] - timestamps[a] < window:
+                pairs.add((a, b, timestamps[b] - timestamps[a]))
+    return pairs
+
+def reference_bursts(sender_ids, timestamps, window, min_count):
+    """
+    Kaba kuvvet: her işlemden başlayan [t, t + window) penceresi en az
+    min_count işlem içeriyorsa yoğunlaşmadır; ortak işlemi olan pencereler
+    birleştirilir. Her yoğunlaşma zaman sıralı indeks demeti olarak döner.
+    """
+    bursts = []
+    for timeline in _sender_timelines(sender_ids, timestamps):
+        current = None
+        for p, i in enumerate(timeline):
+            members = [j for j in timeline[p:] if timestamps[j] < timestamps[i] + window]
+            if len(members) < min_count:
+                continue
+            if current is not None and i in current:
+                current.extend(j for j in members if j not in current)
+            else:
+                if current is not None:
+                    bursts.append(tuple(current))
+                current = list(members)
+        if current is not None:
+            bursts.append(tuple(current))
+    return sorted(bursts)
+
+def legacy_critical_paths(G):
+    """Önceki uygulama: her sıralı düğüm çifti için ayrı shortest_path"""
+    paths = []
+    for u in G.nodes():
+        for v in G.nodes():
+            if u != v:
+                try:
+                    path = nx.shortest_path(G, u, v, weight="weight")
+                    path_weight = sum(G[path[i]][path[i+1]]["weight"]
+                                    for i in range(len(path)-1))
+                    paths.append({"path": path, "weight": path_weight})
+                except nx.NetworkXNoPath:
+                    continue
+    return sorted(paths, key=lambda x: x["weight"], reverse=True)[:5]
+
+def synthetic_transfer_graph(n_nodes, avg_degree=3, seed=42):
+    """Hub ağırlıklı rastgele transfer grafı (ETH cinsinden kenar ağırlıkları)"""
+    rng = np.random.default_rng(seed)
+    n_edges = n_nodes * avg_degree
+    src = np.minimum(rng.zipf(1.5, n_edges) - 1, n_nodes - 1)
+    dst = rng.integers(0, n_nodes, n_edges)
+    weights = rng.lognormal(0, 2, n_edges)
+    G = nx.DiGraph()
+    G.add_nodes_from(f"0x{i:040x}" for i in range(n_nodes))
+    G.add_weighted_edges_from(
+        (f"0x{u:040x}", f"0x{v:040x}", w) for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()) if u != v
+    )
+    return G
+
+def legacy_load_graph(transactions):
+    """Eski load_graph_from_json döngüsü (paralel kenarlarda son değer kalır)"""
+    G = nx.DiGraph()
+    for tx in transactions:
+        if tx["from"] and tx["to"]:
+            G.add_edge(tx["from"], tx["to"], weight=int(tx["value"]) / 1e18,
+                       timestamp=int(tx["timeStamp"]), hash=tx["hash"])
+    return G
+
+def legacy_network_graph(transactions, max_nodes=50):
+    """Eski create_graph_from_transactions: tüm işlemler Python anahtarıyla sıralanır"""
+    G = nx.DiGraph()
+    nodes = set()
+    for tx in sorted(transactions, key=lambda tx: int(tx.get("value", 0)), reverse=True):
+        sender, receiver = tx.get("from"), tx.get("to")
+        if not sender or not receiver:
+            continue
+        for node, node_type in ((sender, "sender"), (receiver, "receiver")):
+            if node not in nodes:
+                nodes.add(node)
+                G.add_node(node, type=node_type)
+        G.add_edge(sender, receiver, weight=int(tx.get("value", 0)) / 1e18,
+                   timestamp=int(tx.get("timeStamp", 0)), hash=tx.get("hash", ""))
+        if len(nodes) >= max_nodes:
+            break
+    return G
+
+def write_synthetic_elliptic(data_dir, n_nodes=3000, n_edges=3500, n_features=20, seed=42):
+    """
+    Elliptic dosya düzeninde (başlıksız features, classes ve edgelist CSV)
+    sentetik veri seti yaz. Sınıflar '1' (illicit), '2' (licit) ve 'unknown'.
+    """
+    rng = np.random.default_rng(seed)
+    txids = rng.choice(10 ** 9, n_nodes, replace=False)
+    features = pd.DataFrame(rng.normal(size=(n_nodes, n_features)).round(6))
+    features.insert(0, 'time_step', rng.integers(1, 50, n_nodes))
+    features.insert(0, 'txId', txids)
+    # Öznitelikler sınıfla ilişkili olsun ki model doğruluğu anlamlı olsun
+    classes = rng.choice(['unknown'] * 6 + ['2'] * 3 + ['1'], n_nodes)
+    features[0] += (classes == '1') * 1.5
+    features.to_csv(f"{data_dir}/elliptic_txs_features.csv", index=False, header=False)
+    pd.DataFrame({'txId': txids, 'class': classes}).to_csv(f"{data_dir}/elliptic_txs_classes.csv", index=False)
+    pd.DataFrame({
+        'txId1': txids[rng.integers(0, n_nodes, n_edges)],
+        'txId2': txids[rng.integers(0, n_nodes, n_edges)]
+    }).to_csv(f"{data_dir}/elliptic_txs_edgelist.csv", index=False)
+    return txids
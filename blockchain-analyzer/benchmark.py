@@ -0,0 +1,574 @@
+"""
+Performans ve bellek ölçümleri.
+
+Kullanım:
+    python benchmark.py dataset-memory --data-dir ./elliptic_bitcoin_dataset
+    python benchmark.py feature-extraction --rows 1000000
+    python benchmark.py request-latency --data-path data/raw_transactions.ndjson
+    python benchmark.py raw-store --rows 1000000
+    python benchmark.py wallet-analysis --rows 200000
+    python benchmark.py burst-detection --rows 1000000
+    python benchmark.py critical-paths --nodes 100000
+    python benchmark.py betweenness --nodes 5000
+    python benchmark.py communities --data-dir ./elliptic_bitcoin_dataset
+    python benchmark.py graph-snapshot --rows 1000000
+    python benchmark.py graph-accumulator --rows 1000000
+    python benchmark.py network-graph --rows 500000
+    python benchmark.py neighborhood --data-dir ./elliptic_bitcoin_dataset
+    python benchmark.py propagation --data-dir ./elliptic_bitcoin_dataset
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import networkx as nx
+import numpy as np
+import pandas as pd
+from app.services.analyzer import analyze_transactions
+from app.services.burst_detection import rapid_pairs, sliding_window_bursts
+from app.services.centrality import clear_cache, graph_fingerprint, top_betweenness
+from app.services.communities import community_labels
+from app.services.csr_graph import CSRGraph, build_elliptic_graph
+from app.services.dataset_loader import EllipticDatasetLoader
+from app.services.feature_store import FeatureStore
+from app.services.graph_analysis import (analyze_temporal_patterns, create_graph_from_transactions, detect_heavy_senders,
+                                         extract_neighborhood, find_critical_paths, load_graph_from_json)
+from app.services.graph_accumulator import GraphAccumulator
+from app.services.graph_store import GraphStore
+from app.services.propagation import PROPAGATION_METHODS, illicit_ranking, ranking_page
+from app.services.ml_anomaly import SOURCE_COLUMNS, build_feature_matrix, extract_address_features
+from app.services.tx_frame import TxFrame
+from app.utils.tx_io import TransactionWriter, find_raw_transactions, iter_chunks, iter_transactions, read_transactions
+from bench_reference import (legacy_analyze_transactions, legacy_critical_paths, legacy_feature_matrix,
+                             legacy_load_graph, legacy_network_graph, synthetic_transactions, synthetic_transfer_graph,
+                             synthetic_wallet)
+
+def _quiet(func, *args, **kwargs):
+    """Yükleyicilerin ayrıntılı çıktısını bastırarak çalıştır"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def _mb(n_bytes):
+    return f"{n_bytes / 2**20:8.1f} MB"
+
+def bench_dataset_memory(args):
+    """Eski (float64) ve compact yükleme modlarının bellek karşılaştırması (doğruluk: tests/test_dataset_loader.py)"""
+    loaders = {}
+    for name, compact in (('legacy', False), ('compact', True)):
+        loader = EllipticDatasetLoader(data_dir=args.data_dir, use_cache=False, compact=compact)
+        start_time = time.time()
+        _quiet(loader.load_data)
+        elapsed = time.time() - start_time
+        footprint = loader._frames_memory()
+        loaders[name] = loader
+        print(f"{name:8s} yükleme: {elapsed:6.2f} sn | features {_mb(footprint['features'])} | "
+              f"toplam {_mb(footprint['total'])}")
+
+    before = loaders['compact'].memory_footprint['before']['total']
+    after = loaders['compact'].memory_footprint['after']['total']
+    print(f"Compact mod bellek kazancı: {_mb(before)} -> {_mb(after)} ({before / max(after, 1):.1f}x)")
+
+def bench_feature_extraction(args):
+    """Adres bazlı öznitelik çıkarımı: eski (apply) ve vektörel motor karşılaştırması"""
+    print(f"{args.rows} sentetik işlem oluşturuluyor ({args.addresses} adres)...")
+    df = synthetic_transactions(args.rows, args.addresses)
+
+    start_time = time.time()
+    new = build_feature_matrix(df)
+    new_time = time.time() - start_time
+    print(f"vektörel : {new_time:7.2f} sn ({len(new)} adres)")
+
+    if args.skip_legacy:
+        return
+
+    start_time = time.time()
+    legacy_feature_matrix(df)
+    old_time = time.time() - start_time
+    print(f"eski     : {old_time:7.2f} sn")
+    print(f"Hızlanma : {old_time / new_time:.1f}x")
+
+def bench_request_latency(args):
+    """/analyze ML adımı: istek başına detektör kurulumu ve bağımsız öznitelik fonksiyonu"""
+    transactions = list(iter_transactions(args.data_path))
+    # Örnek istek: en çok işlem gönderen adresin işlemleri
+    senders = pd.Series([tx['from'] for tx in transactions])
+    address = senders.value_counts().index[0]
+    request_txs = [tx for tx in transactions if tx['from'] == address][:args.request_txs]
+    print(f"{len(transactions)} işlemlik veri seti, istek başına {len(request_txs)} işlem")
+
+    def legacy_request():
+        # Eski akış: her istekte MLAnomalyDetector() -> raw_transactions.json json.load + DataFrame
+        global_df = pd.DataFrame(list(iter_transactions(args.data_path)))
+        del global_df
+        return extract_address_features(address, pd.DataFrame(request_txs))
+
+    def new_request():
+        return extract_address_features(address, request_txs)
+
+    timings = {}
+    for name, func in (('eski', legacy_request), ('yeni', new_request)):
+        start_time = time.time()
+        for _ in range(args.repeat):
+            result = func()
+        timings[name] = (time.time() - start_time) / args.repeat
+        print(f"{name}: istek başına {timings[name] * 1000:9.2f} ms -> {result}")
+
+    print(f"İstek başına kazanç: {(timings['eski'] - timings['yeni']) * 1000:.2f} ms "
+          f"({timings['eski'] / timings['yeni']:.0f}x)")
+
+def _load_legacy_json(path):
+    """Eski yükleme: json.load ile tüm dizi + DataFrame"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return len(pd.DataFrame(json.load(f)))
+
+def _load_frame(path):
+    """MLAnomalyDetector._load_data: yalnızca gereken sütunlar"""
+    return len(read_transactions(path, columns=SOURCE_COLUMNS))
+
+def _stream_chunks(path):
+    """Parça parça okuma (bellekte en fazla bir parça)"""
+    return sum(len(chunk) for chunk in iter_chunks(path, columns=SOURCE_COLUMNS))
+
+RAW_STORE_LOADERS = {
+    'json.load': _load_legacy_json,
+    'frame': _load_frame,
+    'chunks': _stream_chunks
+}
+
+def _peak_rss(reset=False):
+    """
+    Sürecin tepe RSS değeri (byte).
+
+    ru_maxrss fork/exec sonrası ebeveynin tepe değerini taşıdığı için Linux'ta
+    /proc üzerinden VmHWM okunur ve ölçümden önce sıfırlanır.
+    """
+    try:
+        if reset:
+            with open('/proc/self/clear_refs', 'w') as f:
+                f.write('5')
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # Linux dışı sistemler: ru_maxrss (macOS'ta byte, Linux'ta KB)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _measure_load(loader_name, path, queue):
+    """Ayrı süreçte yükle; tepe RSS bu süreçte ölçülür"""
+    baseline = _peak_rss(reset=True)
+    start_time = time.time()
+    rows = RAW_STORE_LOADERS[loader_name](path)
+    elapsed = time.time() - start_time
+    peak = _peak_rss()
+    queue.put((rows, elapsed, peak - baseline, peak))
+
+def bench_raw_store(args):
+    """Ham işlem biçimleri (JSON dizisi, NDJSON, Parquet): yükleme süresi ve tepe RSS"""
+    df = synthetic_transactions(args.rows, args.addresses)
+    # Etherscan txlist'teki diğer alanlar: dosya boyutu gerçekçi olsun
+    df['blockNumber'] = (14000000 + np.arange(len(df)) // 20).astype(str)
+    df['gas'] = '21000'
+    df['gasPrice'] = '30000000000'
+    df['gasUsed'] = '21000'
+    df['input'] = '0x'
+    records = df.to_dict('records')
+    del df
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix='raw_store_')
+    os.makedirs(work_dir, exist_ok=True)
+    paths = {
+        'json': os.path.join(work_dir, 'raw_transactions.json'),
+        'ndjson': os.path.join(work_dir, 'raw_transactions.ndjson'),
+        'parquet': os.path.join(work_dir, 'raw_transactions.parquet')
+    }
+    start_time = time.time()
+    with open(paths['json'], 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2)
+    print(f"json    yazma: {time.time() - start_time:6.2f} sn | {_mb(os.path.getsize(paths['json']))}")
+    for fmt in ('ndjson', 'parquet'):
+        try:
+            start_time = time.time()
+            with TransactionWriter(paths[fmt]) as writer:
+                writer.write(records)
+        except ImportError as e:
+            print(f"{fmt:7s} atlandı: {e}")
+            paths.pop(fmt)
+            continue
+        print(f"{fmt:7s} yazma: {time.time() - start_time:6.2f} sn | {_mb(os.path.getsize(paths[fmt]))}")
+    del records
+
+    cases = [('json', 'json.load'), ('json', 'frame'), ('json', 'chunks'),
+             ('ndjson', 'frame'), ('ndjson', 'chunks'), ('parquet', 'frame'), ('parquet', 'chunks')]
+    context = multiprocessing.get_context('spawn')
+    print(f"\n{args.rows} işlem, ayrı süreçte yükleme:")
+    for fmt, loader_name in cases:
+        if fmt not in paths:
+            continue
+        queue = context.Queue()
+        process = context.Process(target=_measure_load, args=(loader_name, paths[fmt], queue))
+        process.start()
+        rows, elapsed, delta, peak = queue.get()
+        process.join()
+        print(f"{fmt:7s} {loader_name:9s}: {elapsed:6.2f} sn | satır {rows} | "
+              f"RSS artışı {_mb(delta)} | tepe RSS {_mb(peak)}")
+
+def bench_wallet_analysis(args):
+    """analyze_transactions: dict döngüleri ile TxFrame üzerinde vektörel hesap"""
+    transactions = synthetic_wallet(args.rows)
+    print(f"{len(transactions)} işlemlik cüzdan")
+
+    timings = {}
+    results = {}
+    for name, func in (('eski', legacy_analyze_transactions), ('yeni', analyze_transactions)):
+        start_time = time.time()
+        for _ in range(args.repeat):
+            results[name] = func(transactions)
+        timings[name] = (time.time() - start_time) / args.repeat
+        print(f"{name}: {timings[name] * 1000:9.1f} ms")
+
+    start_time = time.time()
+    frame = TxFrame.from_transactions(transactions)
+    convert_seconds = time.time() - start_time
+    start_time = time.time()
+    analyze_transactions(frame)
+    print(f"  dönüşüm {convert_seconds * 1000:.1f} ms + hesap {(time.time() - start_time) * 1000:.1f} ms")
+    # Sütunlu kaynak (Parquet/NDJSON -> DataFrame): dict dönüşümü hiç yapılmaz
+    df = pd.DataFrame(transactions)
+    start_time = time.time()
+    analyze_transactions(TxFrame.from_frame(df))
+    print(f"  DataFrame girdisiyle: {(time.time() - start_time) * 1000:.1f} ms")
+    print(f"Hızlanma: {timings['eski'] / timings['yeni']:.1f}x")
+
+    # Doğruluk kontrolü: tests/test_analyzer.py
+    anomalies = results['yeni']['anomalies']
+    print(f"  hızlı çiftler: eski {len(results['eski']['anomalies']['rapid_transactions'])} -> "
+          f"gönderici bazında {len(anomalies['rapid_transactions'])}")
+    print(f"  {len(anomalies['high_value_txs'])} yüksek değer, {len(anomalies['rapid_bursts'])} yoğunlaşma, "
+          f"{len(anomalies['suspicious_patterns'])} şüpheli desen")
+
+def bench_burst_detection(args):
+    """Gönderici bazında hızlı çift ve N-in-T yoğunlaşma tespiti (karışık, sırasız geçmiş)"""
+    rng = np.random.default_rng(42)
+    # Borsa cüzdanı benzeri dağılım: birkaç gönderici işlemlerin çoğunu yapar
+    sender_ids = np.minimum(rng.zipf(1.3, args.rows) - 1, args.senders - 1)
+    timestamps = 1600000000 + rng.integers(0, args.span_days * 24 * 3600, args.rows)
+
+    start_time = time.time()
+    first, _, _ = rapid_pairs(sender_ids, timestamps)
+    pairs_seconds = time.time() - start_time
+    start_time = time.time()
+    bursts = sliding_window_bursts(sender_ids, timestamps, args.window, args.min_count)
+    bursts_seconds = time.time() - start_time
+    print(f"{args.rows} işlem, {args.senders} gönderici")
+    print(f"hızlı çiftler : {len(first):8d} | {pairs_seconds * 1000:8.1f} ms")
+    print(f"yoğunlaşmalar : {len(bursts):8d} | {bursts_seconds * 1000:8.1f} ms "
+          f"({args.min_count} işlem / {args.window} sn)")
+
+def bench_critical_paths(args):
+    """find_critical_paths: tüm çiftler (O(V²) Dijkstra) ve hub örneklemeli arama (doğruluk: tests/test_critical_paths.py)"""
+    small = synthetic_transfer_graph(args.check_nodes)
+    start_time = time.time()
+    legacy_critical_paths(small)
+    legacy_seconds = time.time() - start_time
+    start_time = time.time()
+    find_critical_paths(small, max_sources=small.number_of_nodes())
+    new_seconds = time.time() - start_time
+    print(f"{args.check_nodes} düğüm (tam tarama): önceki {legacy_seconds:.2f} sn | yeni {new_seconds:.3f} sn")
+
+    G = synthetic_transfer_graph(args.nodes)
+    start_time = time.time()
+    paths, truncated = find_critical_paths(G, max_sources=args.max_sources, time_budget=args.time_budget)
+    elapsed = time.time() - start_time
+    print(f"{G.number_of_nodes()} düğüm, {G.number_of_edges()} kenar: {elapsed:.2f} sn"
+          f"{' (süre sınırında kesildi)' if truncated else ''} "
+          f"(en ağır yol {paths[0]['weight']:.2f}, {len(paths[0]['path'])} düğüm)" if paths else "yol bulunamadı")
+
+def bench_betweenness(args):
+    """nx.betweenness_centrality ile katkı veren kaynaklarla sınırlı tam/örneklemeli hesap"""
+    G = synthetic_transfer_graph(args.nodes)
+    print(f"{G.number_of_nodes()} düğüm, {G.number_of_edges()} kenar")
+    start_time = time.time()
+    version = graph_fingerprint(G)
+    print(f"parmak izi          : {(time.time() - start_time) * 1000:8.1f} ms")
+
+    if not args.skip_legacy:
+        start_time = time.time()
+        legacy = nx.betweenness_centrality(G)
+        print(f"nx tam (önceki)     : {time.time() - start_time:8.2f} sn")
+        reference = sorted(legacy, key=legacy.get, reverse=True)[:args.top]
+    else:
+        # Büyük graflarda referans en çok kaynaklı örneklemdir
+        reference = [node for node, _ in top_betweenness(G, args.top, k=max(args.pivots), version=version)[0]]
+
+    for k in ([] if args.skip_legacy else [None]) + ['auto'] + args.pivots:
+        clear_cache()
+        start_time = time.time()
+        top, pivots = top_betweenness(G, args.top, k=k, version=version, time_budget=args.time_budget)
+        elapsed = time.time() - start_time
+        overlap = len(set(reference) & {node for node, _ in top})
+        print(f"k={str(k):5s} {str(pivots or 'tam'):>6s} kaynak: {elapsed:8.2f} sn | ilk {args.top} uyumu {overlap}/{args.top}")
+
+    start_time = time.time()
+    top_betweenness(G, args.top, k=args.pivots[-1], version=version)
+    print(f"önbellekten         : {(time.time() - start_time) * 1000:8.3f} ms")
+
+def bench_communities(args):
+    """Elliptic grafının tamamında topluluk algoritmaları: süre ve modülerlik"""
+    loader = EllipticDatasetLoader(data_dir=args.data_dir, use_cache=False, compact=True)
+    _quiet(loader.load_data)
+    graph = build_elliptic_graph(loader)
+    print(f"Elliptic grafı: {graph.n_nodes} düğüm, {graph.n_edges} kenar")
+
+    runs = [('louvain', 1, 1), ('label_propagation', 1, 1)]
+    if args.runs > 1:
+        runs += [('louvain', args.runs, 1), ('louvain', args.runs, args.jobs)]
+    if not args.skip_greedy:
+        runs.append(('greedy', 1, 1))
+    for method, n_runs, n_jobs in runs:
+        start_time = time.time()
+        _, labels, modularity = community_labels(graph, method=method, runs=n_runs, n_jobs=n_jobs)
+        elapsed = time.time() - start_time
+        sizes = np.bincount(labels)
+        print(f"{method:17s} runs={n_runs} jobs={n_jobs}: {elapsed:8.2f} sn | modülerlik {modularity:.4f} | "
+              f"{len(sizes)} topluluk, en büyüğü {sizes.max()}")
+
+def bench_graph_snapshot(args):
+    """Ham işlem grafı: JSON'dan yeniden oluşturma ve saklanan anlık görüntüden yükleme"""
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix='graph_snapshot_')
+    path = os.path.join(work_dir, 'raw_transactions.ndjson')
+    with TransactionWriter(path) as writer:
+        writer.write(synthetic_transactions(args.rows, args.addresses).to_dict('records'))
+    fingerprint = FeatureStore.fingerprint(path)
+    cache_dir = os.path.join(work_dir, 'graph_cache')
+    stats = {
+        'heavy_senders_500': lambda G: detect_heavy_senders(G, threshold=500),
+        'temporal_patterns': analyze_temporal_patterns
+    }
+
+    start_time = time.time()
+    G = load_graph_from_json(path)
+    for compute in stats.values():
+        compute(G)
+    print(f"her istekte yeniden oluşturma : {time.time() - start_time:8.2f} sn "
+          f"({G.number_of_nodes()} düğüm, {G.number_of_edges()} kenar)")
+    del G
+
+    start_time = time.time()
+    store = GraphStore(cache_dir)
+    snapshot = store.get('raw_data', fingerprint, lambda: load_graph_from_json(path))
+    for name, compute in stats.items():
+        store.stat('raw_data', fingerprint, name, lambda: compute(snapshot.graph()))
+    print(f"ilk istek (oluştur ve yaz)    : {time.time() - start_time:8.2f} sn")
+
+    # Yeni süreç gibi: bellekteki kayıt yok, diskten okunur
+    start_time = time.time()
+    store = GraphStore(cache_dir)
+    snapshot = store.get('raw_data', fingerprint, lambda: load_graph_from_json(path))
+    for name in stats:
+        store.stat('raw_data', fingerprint, name, lambda: None)
+    print(f"yeniden başlatma (mmap + JSON): {(time.time() - start_time) * 1000:8.1f} ms")
+    start_time = time.time()
+    snapshot.graph()
+    print(f"  + networkx grafını kurma    : {time.time() - start_time:8.2f} sn")
+
+    start_time = time.time()
+    store.stat('raw_data', fingerprint, 'temporal_patterns', lambda: None)
+    print(f"sonraki istekler (bellekten)  : {(time.time() - start_time) * 1000:8.3f} ms")
+
+def bench_graph_accumulator(args):
+    """İşlem grafı: her senkronizasyonda yeniden oluşturma ve artımlı ekleme (doğruluk: tests/test_graph_accumulator.py)"""
+    df = synthetic_transactions(args.rows, args.addresses)
+    records = df.to_dict('records')
+    n_history = len(records) - args.delta
+
+    start_time = time.time()
+    legacy = legacy_load_graph(records)
+    print(f"eski döngü (tümü)        : {time.time() - start_time:8.2f} sn "
+          f"({legacy.number_of_edges()} kenar, paralel transferler üzerine yazılır)")
+    del legacy
+
+    accumulator = GraphAccumulator()
+    start_time = time.time()
+    for start in range(0, n_history, 100000):
+        accumulator.add(df.iloc[start:min(start + 100000, n_history)])
+    G = accumulator.graph()
+    print(f"accumulator (geçmiş)     : {time.time() - start_time:8.2f} sn "
+          f"({G.number_of_nodes()} düğüm, {G.number_of_edges()} kenar)")
+
+    # İlk ekleme, kopyalanmadan verilmiş iç grafı bir kez kopyalar
+    accumulator.add(records[n_history:n_history + 1])
+    start_time = time.time()
+    accumulator.add(records[n_history + 1:])
+    print(f"{args.delta - 1} yeni işlem ekleme: {(time.time() - start_time) * 1000:8.1f} ms "
+          f"(sayaçlar ve iç graf güncel, {accumulator.n_transactions} işlem)")
+    start_time = time.time()
+    accumulator.graph()
+    print(f"güncel graf (dondurulmuş kopya): {(time.time() - start_time) * 1000:8.1f} ms")
+
+def bench_network_graph(args):
+    """create_graph_from_transactions: tam sıralama ve gerektiği kadar top-K seçimi"""
+    transactions = synthetic_wallet(args.rows)
+    print(f"{len(transactions)} işlemlik cüzdan, {args.max_nodes} düğüm")
+    for name, build in (('eski (tam sıralama)', legacy_network_graph),
+                        ('yeni (top-K)', create_graph_from_transactions),
+                        ('yeni (karşı taraf toplamı)', lambda txs, max_nodes: create_graph_from_transactions(
+                            txs, max_nodes=max_nodes, aggregate=True))):
+        start_time = time.time()
+        for _ in range(args.repeat):
+            G = build(transactions, max_nodes=args.max_nodes)
+        elapsed = (time.time() - start_time) / args.repeat
+        print(f"{name:27s}: {elapsed * 1000:8.1f} ms | {G.number_of_nodes()} düğüm, {G.number_of_edges()} kenar")
+
+def _elliptic_or_synthetic_graph(data_dir):
+    """Elliptic CSR grafı; veri seti yoksa aynı boyutlarda, benzer sınıf oranlarında rastgele graf"""
+    if os.path.isdir(data_dir):
+        loader = EllipticDatasetLoader(data_dir=data_dir, use_cache=False, compact=True)
+        _quiet(loader.load_data)
+        return build_elliptic_graph(loader)
+    rng = np.random.default_rng(42)
+    n_nodes, n_edges = 203769, 234355
+    labels = rng.choice([-1, 0, 1], n_nodes, p=[0.77, 0.21, 0.02]).astype(np.int8)
+    return CSRGraph(np.arange(n_nodes, dtype=np.int64), rng.integers(0, n_nodes, n_edges),
+                    rng.integers(0, n_nodes, n_edges), node_labels=labels)
+
+def bench_neighborhood(args):
+    """k-adımlı çıkış komşuluğu: tüm graf üzerinde nx.ego_graph ve CSR dizileri üzerinde BFS"""
+    graph = _elliptic_or_synthetic_graph(args.data_dir)
+    print(f"{graph.n_nodes} düğüm, {graph.n_edges} kenar")
+    centers = np.random.default_rng(0).choice(graph.node_ids, args.queries).tolist()
+
+    # Önceki yol tüm graf için networkx nesnesi gerektirir; CSR graf veri setiyle birlikte hazırdır
+    start_time = time.time()
+    G = graph.to_networkx()
+    print(f"nx grafı oluşturma    : {time.time() - start_time:8.2f} sn")
+    start_time = time.time()
+    for center in centers:
+        nx.ego_graph(G, center, radius=args.hops)
+    print(f"nx.ego_graph (önceki) : {(time.time() - start_time) / args.queries * 1000:8.2f} ms/sorgu")
+
+    graph.index_of(centers[0])
+    start_time = time.time()
+    for center in centers:
+        result = extract_neighborhood(graph, center, hops=args.hops, direction='out', max_nodes=args.max_nodes)
+    print(f"CSR BFS (yeni)        : {(time.time() - start_time) / args.queries * 1000:8.2f} ms/sorgu "
+          f"(son sorgu {len(result['nodes'])} düğüm, {len(result['links'])} kenar)")
+
+def bench_propagation(args):
+    """illicit yayılım skorları: yöntem başına ön hesaplama ve sayfa okuma süresi"""
+    graph = _elliptic_or_synthetic_graph(args.data_dir)
+    print(f"{graph.n_nodes} düğüm, {graph.n_edges} kenar, {np.count_nonzero(graph.node_labels == 1)} illicit")
+    for method in PROPAGATION_METHODS:
+        start_time = time.time()
+        ranking = illicit_ranking(graph, method)
+        elapsed = time.time() - start_time
+        start_time = time.time()
+        for page in range(1, args.pages + 1):
+            ranking_page(ranking, page, args.page_size)
+        page_ms = (time.time() - start_time) / args.pages * 1000
+        print(f"{method:15s}: ön hesaplama {elapsed:6.2f} sn ({ranking['iterations']} yineleme) | "
+              f"sayfa {page_ms:.3f} ms | {len(ranking['order'])} bilinmeyen düğüm")
+
+def main():
+    parser = argparse.ArgumentParser(description="Blockchain Analyzer performans ölçümleri")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    memory_parser = subparsers.add_parser('dataset-memory', help=bench_dataset_memory.__doc__)
+    memory_parser.add_argument('--data-dir', default='./elliptic_bitcoin_dataset')
+    memory_parser.set_defaults(func=bench_dataset_memory)
+
+    features_parser = subparsers.add_parser('feature-extraction', help=bench_feature_extraction.__doc__)
+    features_parser.add_argument('--rows', type=int, default=1000000)
+    features_parser.add_argument('--addresses', type=int, default=100000)
+    features_parser.add_argument('--skip-legacy', action='store_true')
+    features_parser.set_defaults(func=bench_feature_extraction)
+
+    latency_parser = subparsers.add_parser('request-latency', help=bench_request_latency.__doc__)
+    latency_parser.add_argument('--data-path', default=find_raw_transactions('data'))
+    latency_parser.add_argument('--request-txs', type=int, default=1000)
+    latency_parser.add_argument('--repeat', type=int, default=5)
+    latency_parser.set_defaults(func=bench_request_latency)
+
+    raw_store_parser = subparsers.add_parser('raw-store', help=bench_raw_store.__doc__)
+    raw_store_parser.add_argument('--rows', type=int, default=1000000)
+    raw_store_parser.add_argument('--addresses', type=int, default=100000)
+    raw_store_parser.add_argument('--work-dir', default=None)
+    raw_store_parser.set_defaults(func=bench_raw_store)
+
+    wallet_parser = subparsers.add_parser('wallet-analysis', help=bench_wallet_analysis.__doc__)
+    wallet_parser.add_argument('--rows', type=int, default=200000)
+    wallet_parser.add_argument('--repeat', type=int, default=3)
+    wallet_parser.set_defaults(func=bench_wallet_analysis)
+
+    burst_parser = subparsers.add_parser('burst-detection', help=bench_burst_detection.__doc__)
+    burst_parser.add_argument('--rows', type=int, default=1000000)
+    burst_parser.add_argument('--senders', type=int, default=20000)
+    burst_parser.add_argument('--span-days', type=int, default=365)
+    burst_parser.add_argument('--window', type=int, default=300)
+    burst_parser.add_argument('--min-count', type=int, default=3)
+    burst_parser.set_defaults(func=bench_burst_detection)
+
+    paths_parser = subparsers.add_parser('critical-paths', help=bench_critical_paths.__doc__)
+    paths_parser.add_argument('--nodes', type=int, default=100000)
+    paths_parser.add_argument('--check-nodes', type=int, default=150)
+    paths_parser.add_argument('--max-sources', type=int, default=200)
+    paths_parser.add_argument('--time-budget', type=float, default=2.0)
+    paths_parser.set_defaults(func=bench_critical_paths)
+
+    betweenness_parser = subparsers.add_parser('betweenness', help=bench_betweenness.__doc__)
+    betweenness_parser.add_argument('--nodes', type=int, default=5000)
+    betweenness_parser.add_argument('--top', type=int, default=5)
+    betweenness_parser.add_argument('--pivots', type=int, nargs='*', default=[64, 256])
+    betweenness_parser.add_argument('--time-budget', type=float, default=2.0)
+    betweenness_parser.add_argument('--skip-legacy', action='store_true')
+    betweenness_parser.set_defaults(func=bench_betweenness)
+
+    communities_parser = subparsers.add_parser('communities', help=bench_communities.__doc__)
+    communities_parser.add_argument('--data-dir', default='./elliptic_bitcoin_dataset')
+    communities_parser.add_argument('--runs', type=int, default=4)
+    communities_parser.add_argument('--jobs', type=int, default=4)
+    communities_parser.add_argument('--skip-greedy', action='store_true')
+    communities_parser.set_defaults(func=bench_communities)
+
+    snapshot_parser = subparsers.add_parser('graph-snapshot', help=bench_graph_snapshot.__doc__)
+    snapshot_parser.add_argument('--rows', type=int, default=1000000)
+    snapshot_parser.add_argument('--addresses', type=int, default=100000)
+    snapshot_parser.add_argument('--work-dir', default=None)
+    snapshot_parser.set_defaults(func=bench_graph_snapshot)
+
+    accumulator_parser = subparsers.add_parser('graph-accumulator', help=bench_graph_accumulator.__doc__)
+    accumulator_parser.add_argument('--rows', type=int, default=1000000)
+    accumulator_parser.add_argument('--addresses', type=int, default=100000)
+    accumulator_parser.add_argument('--delta', type=int, default=1000)
+    accumulator_parser.set_defaults(func=bench_graph_accumulator)
+
+    network_parser = subparsers.add_parser('network-graph', help=bench_network_graph.__doc__)
+    network_parser.add_argument('--rows', type=int, default=500000)
+    network_parser.add_argument('--max-nodes', type=int, default=50)
+    network_parser.add_argument('--repeat', type=int, default=3)
+    network_parser.set_defaults(func=bench_network_graph)
+
+    neighborhood_parser = subparsers.add_parser('neighborhood', help=bench_neighborhood.__doc__)
+    neighborhood_parser.add_argument('--data-dir', default='./elliptic_bitcoin_dataset')
+    neighborhood_parser.add_argument('--hops', type=int, default=2)
+    neighborhood_parser.add_argument('--max-nodes', type=int, default=500)
+    neighborhood_parser.add_argument('--queries', type=int, default=200)
+    neighborhood_parser.set_defaults(func=bench_neighborhood)
+
+    propagation_parser = subparsers.add_parser('propagation', help=bench_propagation.__doc__)
+    propagation_parser.add_argument('--data-dir', default='./elliptic_bitcoin_dataset')
+    propagation_parser.add_argument('--pages', type=int, default=100)
+    propagation_parser.add_argument('--page-size', type=int, default=10)
+    propagation_parser.set_defaults(func=bench_propagation)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
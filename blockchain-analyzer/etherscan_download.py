@@ -1,19 +1,28 @@
-import requests
+import argparse
+import asyncio
+import glob
 import json
-import time
 import os
+import time
 from dotenv import load_dotenv
 
-# Ortam değişkenlerini yükle
+# Ortam değişkenlerini yükle (istemci içe aktarılmadan önce)
 load_dotenv()
-ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY")
-BASE_URL = "https://api.etherscan.io/api"
+from app.utils.etherscan_client import get_etherscan_client
+from app.utils.tx_store import MAX_RESULTS_PER_CALL
+from app.utils.tx_io import TransactionWriter, format_for_path
 
 # 🔁 Genişletilmiş blok aralığı (2021'den günümüze)
 START_BLOCK = 14000000
 END_BLOCK = 19000000
 STEP = 100000
-FILENAME = "data/raw_transactions.json"
+FILENAME = "data/raw_transactions.ndjson"
+
+# 💾 Pencere parçalarının (NDJSON) ve ilerleme bilgisinin tutulduğu klasör
+CHECKPOINT_DIR = "data/download_checkpoint"
+
+# ⚡ Aynı anda beklenen en fazla istek; asıl hız sınırı istemcinin token bucket'ıdır
+CONCURRENCY = int(os.getenv("DOWNLOAD_CONCURRENCY", "8"))
 
 # 🧠 En aktif cüzdanlar (borsa & balina)
 WALLET_ADDRESSES = [
@@ -30,48 +39,211 @@ WALLET_ADDRESSES = [
 ]
 
 def get_transactions(address, start_block, end_block):
-    params = {
-        "module": "account",
-        "action": "txlist",
-        "address": address,
-        "startblock": start_block,
-        "endblock": end_block,
-        "sort": "asc",
-        "apikey": ETHERSCAN_API_KEY
-    }
-    print(f"[{address}] 🔍 {start_block}-{end_block}")
-    response = requests.get(BASE_URL, params=params)
-    try:
-        data = response.json()
-        if data.get("status") != "1":
-            print(f"[{address}] ⚠️ Hata: {data.get('message')}")
-            return []
-        return data["result"]
-    except Exception:
-        print(f"[{address}] ❌ JSON hatası.")
-        return []
-
-def save_transactions(transactions, filename):
-    if not transactions:
-        print("⚠️ Hiç işlem alınmadı.")
+    """Tek pencere için txlist çağrısı; hatalar ValueError olarak yükselir"""
+    # Hız sınırı ve yeniden denemeler paylaşılan istemcide yönetilir
+    return get_etherscan_client().get_result(
+        "account", "txlist",
+        address=address,
+        startblock=start_block,
+        endblock=end_block,
+        sort="asc"
+    )
+
+def shard_path(checkpoint_dir, address, start_block, end_block, suffix="ndjson"):
+    """Pencere parçasının yolu; sıfır dolgulu bloklar sayesinde ad sırası blok sırasıdır"""
+    return os.path.join(checkpoint_dir, f"{address.lower()}_{start_block:09d}_{end_block:09d}.{suffix}")
+
+def write_shard(path, transactions):
+    """Pencereyi NDJSON olarak yaz; yeniden adlandırma ile yarım dosya kalmaz"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for tx in transactions:
+            f.write(json.dumps(tx))
+            f.write("\n")
+    os.replace(tmp_path, path)
+
+def check_manifest(checkpoint_dir, settings, reset=False):
+    """
+    Kontrol noktasının aynı ayarlarla başlatıldığını doğrula.
+
+    Farklı pencere sınırlarıyla yazılmış parçalar birleştirildiğinde işlemler
+    tekrarlanacağı için ayarlar değiştiyse --reset istenir.
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    manifest_path = os.path.join(checkpoint_dir, "manifest.json")
+
+    if reset:
+        for path in glob.glob(os.path.join(checkpoint_dir, "*")):
+            os.remove(path)
+    elif os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous != settings:
+            raise SystemExit(
+                f"❌ {checkpoint_dir} farklı ayarlarla oluşturulmuş: {previous}. "
+                "Devam etmek için --reset kullanın."
+            )
         return
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(transactions, f, indent=2)
-    print(f"\n✅ {len(transactions)} işlem kaydedildi → {filename}")
-
-def run():
-    all_transactions = []
-    for address in WALLET_ADDRESSES:
-        for block in range(START_BLOCK, END_BLOCK, STEP):
-            txs = get_transactions(address, block, block + STEP)
-            all_transactions.extend(txs)
-            time.sleep(1)
-            if len(all_transactions) >= 10000:
-                print("🚀 10.000 işlem limitine ulaşıldı.")
-                save_transactions(all_transactions, FILENAME)
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(settings, f)
+
+async def download_window(address, start_block, end_block, semaphore, checkpoint_dir, progress):
+    """
+    Pencereyi indir; 10.000 sonuç sınırına ulaşılırsa ikiye bölerek devam et.
+
+    Parçası diskte olan pencereler atlanır. Bölünen pencere için .split
+    işareti bırakılır, böylece yeniden başlatmada tekrar sorgulanmaz.
+    """
+    path = shard_path(checkpoint_dir, address, start_block, end_block)
+    if os.path.exists(path):
+        progress['skipped'] += 1
+        return
+
+    split_marker = shard_path(checkpoint_dir, address, start_block, end_block, "split")
+    if not os.path.exists(split_marker):
+        async with semaphore:
+            try:
+                transactions = await asyncio.to_thread(get_transactions, address, start_block, end_block)
+            except ValueError as e:
+                # Parça yazılmadığı için pencere bir sonraki çalıştırmada yeniden denenir
+                print(f"[{address}] ⚠️ {start_block}-{end_block} alınamadı: {e}")
+                progress['failed'] += 1
                 return
-    save_transactions(all_transactions, FILENAME)
+
+        if len(transactions) < MAX_RESULTS_PER_CALL or start_block == end_block:
+            if len(transactions) >= MAX_RESULTS_PER_CALL:
+                print(f"[{address}] ⚠️ {start_block} bloğunda sonuç sınırı aşıldı, işlemler eksik olabilir")
+            await asyncio.to_thread(write_shard, path, transactions)
+            progress['windows'] += 1
+            progress['transactions'] += len(transactions)
+            print(f"[{address}] 🔍 {start_block}-{end_block}: {len(transactions)} işlem "
+                  f"(toplam {progress['transactions']})")
+            return
+
+        print(f"[{address}] ✂️ {start_block}-{end_block} sonuç sınırında, pencere bölünüyor")
+        open(split_marker, "w").close()
+
+    middle = (start_block + end_block) // 2
+    await asyncio.gather(
+        download_window(address, start_block, middle, semaphore, checkpoint_dir, progress),
+        download_window(address, middle + 1, end_block, semaphore, checkpoint_dir, progress)
+    )
+
+async def download_all(addresses, start_block, end_block, step, checkpoint_dir, concurrency):
+    """Tüm adres × pencere çiftlerini sınırlı eşzamanlılıkla indir"""
+    semaphore = asyncio.Semaphore(concurrency)
+    progress = {'windows': 0, 'skipped': 0, 'failed': 0, 'transactions': 0}
+    tasks = [
+        download_window(address, block, min(block + step - 1, end_block), semaphore, checkpoint_dir, progress)
+        for address in addresses
+        for block in range(start_block, end_block + 1, step)
+    ]
+    await asyncio.gather(*tasks)
+    return progress
+
+def _iter_shard_lines(checkpoint_dir):
+    for shard in sorted(glob.glob(os.path.join(checkpoint_dir, "*.ndjson"))):
+        with open(shard, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+def assemble(checkpoint_dir, filename):
+    """
+    Parçaları tek çıktı dosyasına akış halinde yaz.
+
+    Biçim uzantıdan belirlenir: .ndjson satırları olduğu gibi kopyalar,
+    .parquet satır grupları yazar, .json ise tek bir JSON dizisi üretir.
+    İşlemler hiçbir biçimde belleğe toplanmaz.
+    """
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    fmt = format_for_path(filename)
+    count = 0
+    tmp_path = f"{filename}.tmp"
+    if fmt == "parquet":
+        with TransactionWriter(tmp_path, fmt="parquet") as writer:
+            batch = []
+            for line in _iter_shard_lines(checkpoint_dir):
+                batch.append(json.loads(line))
+                if len(batch) >= writer.row_group_size:
+                    writer.write(batch)
+                    batch = []
+            writer.write(batch)
+        count = writer.count
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            if fmt == "json":
+                out.write("[")
+            for line in _iter_shard_lines(checkpoint_dir):
+                if fmt == "json":
+                    out.write(",\n" if count else "\n")
+                    out.write(line)
+                else:
+                    out.write(line)
+                    out.write("\n")
+                count += 1
+            if fmt == "json":
+                out.write("\n]\n")
+    os.replace(tmp_path, filename)
+    return count
+
+def run(addresses=WALLET_ADDRESSES, start_block=START_BLOCK, end_block=END_BLOCK, step=STEP,
+        checkpoint_dir=CHECKPOINT_DIR, filename=FILENAME, concurrency=CONCURRENCY,
+        reset=False, assemble_output=True):
+    settings = {
+        'addresses': [address.lower() for address in addresses],
+        'start_block': start_block,
+        'end_block': end_block,
+        'step': step
+    }
+    check_manifest(checkpoint_dir, settings, reset)
+
+    start_time = time.time()
+    progress = asyncio.run(download_all(addresses, start_block, end_block, step, checkpoint_dir, concurrency))
+    elapsed = time.time() - start_time
+    print(f"\n📥 {progress['windows']} pencere indirildi, {progress['skipped']} pencere kontrol noktasından atlandı, "
+          f"{progress['failed']} pencere başarısız ({elapsed:.1f} sn)")
+    print(f"📊 Etherscan çağrı istatistikleri: {get_etherscan_client().stats()}")
+
+    if progress['failed']:
+        print("⚠️ Eksik pencereler var; tamamlamak için komutu tekrar çalıştırın.")
+    if assemble_output:
+        count = assemble(checkpoint_dir, filename)
+        if count:
+            print(f"✅ {count} işlem kaydedildi → {filename}")
+        else:
+            print("⚠️ Hiç işlem alınmadı.")
+    return progress
+
+def main():
+    parser = argparse.ArgumentParser(description="Etherscan txlist toplu indirici")
+    parser.add_argument("--start-block", type=int, default=START_BLOCK)
+    parser.add_argument("--end-block", type=int, default=END_BLOCK)
+    parser.add_argument("--step", type=int, default=STEP, help="Başlangıç pencere genişliği (blok)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--checkpoint-dir", default=CHECKPOINT_DIR)
+    parser.add_argument("--output", default=FILENAME, help="Çıktı dosyası (.ndjson, .parquet veya .json)")
+    parser.add_argument("--address", action="append", help="Varsayılan cüzdan listesi yerine (tekrarlanabilir)")
+    parser.add_argument("--reset", action="store_true", help="Kontrol noktasını silip baştan başla")
+    parser.add_argument("--no-assemble", action="store_true", help="Yalnızca parçaları indir")
+    args = parser.parse_args()
+
+    run(
+        addresses=args.address or WALLET_ADDRESSES,
+        start_block=args.start_block,
+        end_block=args.end_block,
+        step=args.step,
+        checkpoint_dir=args.checkpoint_dir,
+        filename=args.output,
+        concurrency=args.concurrency,
+        reset=args.reset,
+        assemble_output=not args.no_assemble
+    )
 
 if __name__ == "__main__":
-    run()
+    main()
@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from app.services.analyzer import analyze_transactions
+from app.services.burst_detection import BURST_MIN_COUNT, BURST_WINDOW_SECONDS, RAPID_WINDOW_SECONDS
+from app.services.tx_frame import TxFrame
+from bench_reference import (assert_equivalent, legacy_analyze_transactions, reference_bursts, reference_rapid_pairs,
+                             synthetic_wallet)
+
+@pytest.fixture(scope='module')
+def wallet():
+    return synthetic_wallet(20000)
+
+def test_matches_legacy_analysis(wallet):
+    expected = legacy_analyze_transactions(wallet)
+    actual = analyze_transactions(wallet)
+
+    # Hızlı işlemler artık gönderici bazında bulunur; eski (komşu liste elemanı) çiftler
+    # zaman sıralı girdide yeni çiftlerin alt kümesidir
+    legacy_rapid = expected['anomalies'].pop('rapid_transactions')
+    new_pairs = {(pair['tx1'], pair['tx2']) for pair in actual['anomalies']['rapid_transactions']}
+    assert legacy_rapid
+    assert all((pair['tx1'], pair['tx2']) in new_pairs for pair in legacy_rapid)
+
+    # Değerler artık tam wei üzerinden hesaplanır; float'lar son basamakta farklı olabilir
+    comparable = {**actual, 'anomalies': {
+        key: value for key, value in actual['anomalies'].items()
+        if key not in ('rapid_transactions', 'rapid_bursts')
+    }}
+    assert_equivalent(expected, comparable)
+
+def test_frame_input_matches_dict_input(wallet):
+    expected = analyze_transactions(wallet)
+    assert_equivalent(expected, analyze_transactions(TxFrame.from_frame(pd.DataFrame(wallet))))
+    assert_equivalent(expected, analyze_transactions(TxFrame.from_transactions(wallet)))
+
+def test_rapid_anomalies_match_brute_force(wallet):
+    # Gönderici sırası karışık olsun diye işlemler ters çevrilir
+    transactions = wallet[:3000][::-1]
+    anomalies = analyze_transactions(transactions)['anomalies']
+    senders = [tx['from'] for tx in transactions]
+    times = [int(tx['timeStamp']) for tx in transactions]
+    hashes = [tx['hash'] for tx in transactions]
+
+    expected_pairs = {(hashes[a], hashes[b], diff)
+                      for a, b, diff in reference_rapid_pairs(senders, times, RAPID_WINDOW_SECONDS)}
+    assert expected_pairs
+    assert {(p['tx1'], p['tx2'], p['time_diff']) for p in anomalies['rapid_transactions']} == expected_pairs
+
+    expected_bursts = sorted(
+        (senders[b[0]], len(b), hashes[b[0]], hashes[b[-1]], times[b[-1]] - times[b[0]])
+        for b in reference_bursts(senders, times, BURST_WINDOW_SECONDS, BURST_MIN_COUNT))
+    assert expected_bursts
+    assert sorted((b['from'], b['tx_count'], b['first_tx'], b['last_tx'], b['duration'])
+                  for b in anomalies['rapid_bursts']) == expected_bursts
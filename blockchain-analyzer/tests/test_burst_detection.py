@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.services.burst_detection import rapid_pairs, sliding_window_bursts
+from bench_reference import reference_bursts, reference_rapid_pairs
+
+def as_pairs(result):
+    return set(zip(*(part.tolist() for part in result)))
+
+def as_bursts(result):
+    return sorted(tuple(burst.tolist()) for burst in result)
+
+def random_activity(n, n_senders, span, seed):
+    """Karışık sırada, iç içe geçmiş göndericiler ve tekrarlanan zaman damgaları"""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, n_senders, n), rng.integers(0, span, n)
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('window, min_count', [(60, 2), (300, 5), (30, 3)])
+def test_random_input_matches_brute_force(seed, window, min_count):
+    senders, times = random_activity(400, 7, 6000, seed)
+    assert as_pairs(rapid_pairs(senders, times, window)) == reference_rapid_pairs(senders, times, window)
+    assert as_bursts(sliding_window_bursts(senders, times, window, min_count)) == \
+        reference_bursts(senders, times, window, min_count)
+
+def test_interleaved_senders_in_unsorted_input():
+    # İki gönderici sırayla işlem yapıyor; liste zaman sırasında değil
+    senders = np.array([0, 1, 0, 1, 0, 1, 0, 1])
+    times = np.array([40, 45, 10, 15, 30, 35, 20, 25])
+    first, second, diff = rapid_pairs(senders, times, window=15)
+    assert list(zip(first, second)) == [(2, 6), (6, 4), (4, 0), (3, 7), (7, 5), (5, 1)]
+    assert diff.tolist() == [10] * 6
+    assert as_bursts(sliding_window_bursts(senders, times, window=31, min_count=4)) == [(2, 6, 4, 0), (3, 7, 5, 1)]
+
+def test_overlapping_windows_merge():
+    # 0-40 aralığındaki pencereler birbirine değiyor; 500'deki grup ayrı yoğunlaşma
+    times = np.array([0, 10, 20, 30, 40, 500, 501, 502])
+    senders = np.zeros(len(times), dtype=np.int64)
+    assert as_bursts(sliding_window_bursts(senders, times, window=25, min_count=3)) == \
+        [(0, 1, 2, 3, 4), (5, 6, 7)]
+
+def test_window_end_is_excluded():
+    senders = np.zeros(3, dtype=np.int64)
+    times = np.array([0, 30, 60])
+    # t + window sınırındaki işlem pencereye girmez
+    assert as_bursts(sliding_window_bursts(senders, times, window=60, min_count=3)) == []
+    assert as_bursts(sliding_window_bursts(senders, times, window=61, min_count=3)) == [(0, 1, 2)]
+    assert as_pairs(rapid_pairs(senders, times, window=30)) == set()
+    assert as_pairs(rapid_pairs(senders, times, window=31)) == {(0, 1, 30), (1, 2, 30)}
+
+def test_min_count_edge_cases():
+    senders = np.array([0, 0, 1])
+    times = np.array([5, 5, 5])
+    # Her işlem tek başına yoğunlaşma; aynı gönderici eşit zamanlı işlemleri birleşir
+    assert as_bursts(sliding_window_bursts(senders, times, window=1, min_count=1)) == [(0, 1), (2,)]
+    assert as_bursts(sliding_window_bursts(senders, times, window=1, min_count=2)) == [(0, 1)]
+    # Girdi min_count'tan kısaysa ya da boşsa sonuç boş
+    assert sliding_window_bursts(senders, times, window=1, min_count=4) == []
+    assert sliding_window_bursts([], [], window=1, min_count=1) == []
+    assert as_pairs(rapid_pairs([], [])) == set()
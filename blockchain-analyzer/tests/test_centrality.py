@@ -0,0 +1,50 @@
+import networkx as nx
+import numpy as np
+
+from app.services import centrality
+from app.services.centrality import (AUTO_MIN_PIVOTS, approximate_betweenness, auto_pivots, clear_cache,
+                                     top_betweenness)
+from bench_reference import synthetic_transfer_graph
+
+def test_exact_matches_networkx():
+    G = synthetic_transfer_graph(400)
+    result, pivots = approximate_betweenness(G, k=None)
+    assert pivots is None
+    expected = nx.betweenness_centrality(G)
+    nodes = list(G)
+    assert np.allclose([result[n] for n in nodes], [expected[n] for n in nodes])
+
+def test_fixed_k_is_deterministic():
+    G = synthetic_transfer_graph(1000)
+    first, pivots = approximate_betweenness(G, k=32)
+    second, _ = approximate_betweenness(G, k=32)
+    assert pivots == 32
+    assert first == second
+
+def test_auto_pivots_depend_on_graph_size_only():
+    assert auto_pivots(100, 300, 50) == 50
+    assert auto_pivots(10**7, 3 * 10**7, 10**6) == AUTO_MIN_PIVOTS
+    medium = auto_pivots(20000, 60000, 10**6)
+    assert medium % centrality.PIVOT_BATCH == 0
+    assert AUTO_MIN_PIVOTS < medium < auto_pivots(2000, 6000, 10**6)
+
+    # Süre bütçesi yetiyorsa sonuç saatten bağımsızdır
+    G = synthetic_transfer_graph(1000)
+    assert approximate_betweenness(G, k='auto', time_budget=float('inf')) == \
+        approximate_betweenness(G, k='auto', time_budget=None)
+
+def test_repeat_call_with_same_version_hits_cache(monkeypatch):
+    G = synthetic_transfer_graph(500)
+    clear_cache()
+    calls = []
+    compute = centrality.approximate_betweenness
+    monkeypatch.setattr(centrality, 'approximate_betweenness',
+                        lambda *args: calls.append(args) or compute(*args))
+
+    first = top_betweenness(G, 5, k=16, version='v1')
+    assert top_betweenness(G, 5, k=16, version='v1') == first
+    assert len(calls) == 1
+    # Yeni sürüm ya da farklı k yeniden hesaplatır
+    top_betweenness(G, 5, k=16, version='v2')
+    top_betweenness(G, 5, k=None, version='v1')
+    assert len(calls) == 3
@@ -0,0 +1,65 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from app.services.communities import (COMMUNITY_METHODS, community_labels, graph_adjacency, labels_to_communities,
+                                      modularity)
+from app.services.csr_graph import CSRGraph
+from bench_reference import synthetic_transfer_graph
+
+@pytest.fixture(scope='module')
+def planted():
+    """Yoğun beş grup ve aralarında seyrek kenarlar (yönlü, işlem grafı gibi)"""
+    G = nx.planted_partition_graph(5, 40, 0.25, 0.01, seed=7, directed=True)
+    return nx.DiGraph(G)
+
+def as_partition(node_ids, labels):
+    return [set(c) for c in labels_to_communities(node_ids, labels)]
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_modularity_matches_networkx(planted, seed):
+    node_ids, adjacency = graph_adjacency(planted)
+    labels = np.random.default_rng(seed).integers(0, 6, len(node_ids))
+    expected = nx.community.modularity(planted.to_undirected(), as_partition(node_ids, labels))
+    assert modularity(adjacency, labels) == pytest.approx(expected)
+
+def test_louvain_at_least_greedy(planted):
+    _, _, greedy = community_labels(planted, method='greedy')
+    _, _, louvain = community_labels(planted, method='louvain')
+    assert louvain >= greedy - 1e-9
+
+@pytest.mark.parametrize('method', ['louvain', 'label_propagation'])
+def test_same_seed_gives_same_labels(method):
+    G = synthetic_transfer_graph(1500)
+    _, first, first_modularity = community_labels(G, method=method, seed=5)
+    _, second, second_modularity = community_labels(G, method=method, seed=5)
+    assert np.array_equal(first, second)
+    assert first_modularity == second_modularity
+
+def test_parallel_runs_match_serial():
+    G = synthetic_transfer_graph(1500)
+    _, serial, serial_modularity = community_labels(G, runs=3, n_jobs=1)
+    _, parallel, parallel_modularity = community_labels(G, runs=3, n_jobs=2)
+    assert np.array_equal(serial, parallel)
+    assert serial_modularity == parallel_modularity
+    # En iyi çalıştırma ilk seed'in sonucundan kötü olamaz
+    assert serial_modularity >= community_labels(G, runs=1)[2]
+
+@pytest.mark.parametrize('method', sorted(COMMUNITY_METHODS))
+def test_methods_return_valid_partitions(planted, method):
+    node_ids, labels, score = community_labels(planted, method=method)
+    assert len(labels) == planted.number_of_nodes()
+    # Etiketler 0..c-1 aralığında ve her topluluk boş değil
+    assert set(np.unique(labels)) == set(range(labels.max() + 1))
+    partition = as_partition(node_ids, labels)
+    assert nx.community.is_partition(planted.to_undirected(), partition)
+    assert score == pytest.approx(nx.community.modularity(planted.to_undirected(), partition))
+
+def test_csr_graph_matches_networkx(planted):
+    src, dst = map(np.array, zip(*planted.edges()))
+    csr = CSRGraph.from_id_edges(np.array(list(planted)), src, dst)
+    node_ids, labels, score = community_labels(csr)
+    expected_ids, expected, expected_score = community_labels(planted)
+    assert list(node_ids) == list(expected_ids)
+    assert np.array_equal(labels, expected)
+    assert score == pytest.approx(expected_score)
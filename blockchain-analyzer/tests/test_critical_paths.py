@@ -0,0 +1,24 @@
+import networkx as nx
+import numpy as np
+
+from app.services.graph_analysis import find_critical_paths
+from bench_reference import legacy_critical_paths, synthetic_transfer_graph
+
+def test_full_search_matches_all_pairs_dijkstra():
+    G = synthetic_transfer_graph(300)
+    expected = legacy_critical_paths(G)
+    paths, truncated = find_critical_paths(G, max_sources=G.number_of_nodes(), time_budget=float('inf'))
+    assert not truncated
+    # Eşit ağırlıklı alternatif yollar olabileceğinden ağırlıklar karşılaştırılır
+    assert np.allclose([p["weight"] for p in expected], [p["weight"] for p in paths])
+    for p in paths:
+        assert nx.is_path(G, p["path"])
+
+def test_time_budget_marks_result_truncated():
+    G = synthetic_transfer_graph(2000)
+    paths, truncated = find_critical_paths(G, max_sources=200, time_budget=0.0, batch_size=4)
+    assert truncated
+    assert paths
+
+def test_empty_graph():
+    assert find_critical_paths(nx.DiGraph()) == ([], False)
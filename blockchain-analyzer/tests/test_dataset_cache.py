@@ -0,0 +1,93 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.dataset_cache import (ARRAY_FILES, META_FILE, get_cache_dir, is_cache_valid, load_cache,
+                                        write_cache)
+from app.services.dataset_loader import EllipticDatasetLoader
+from bench_reference import write_synthetic_elliptic
+
+def _load(data_dir, use_cache):
+    loader = EllipticDatasetLoader(data_dir=str(data_dir), use_cache=use_cache, compact=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader.load_data()
+    return loader
+
+def _write_cache(loader):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return write_cache(loader)
+
+def _is_memmap(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+@pytest.fixture
+def data_dir(tmp_path):
+    write_synthetic_elliptic(tmp_path, n_nodes=800, n_edges=900, n_features=8)
+    return str(tmp_path)
+
+def test_cached_frames_match_loader(data_dir):
+    loader = _load(data_dir, use_cache=False)
+    assert not is_cache_valid(data_dir)
+    _write_cache(loader)
+    assert is_cache_valid(data_dir)
+
+    cached = load_cache(data_dir)
+    pd.testing.assert_frame_equal(cached['features'], loader.features, check_dtype=False)
+    pd.testing.assert_frame_equal(cached['edges'], loader.edges, check_dtype=False)
+    pd.testing.assert_frame_equal(cached['classes'], loader.classes, check_dtype=False)
+    np.testing.assert_array_equal(cached['edge_src'], loader.edge_src)
+    np.testing.assert_array_equal(cached['edge_dst'], loader.edge_dst)
+    np.testing.assert_allclose(cached['scaler'].mean_, loader.scaler.mean_)
+    np.testing.assert_allclose(cached['scaler'].scale_, loader.scaler.scale_)
+
+    # Öznitelik sütunları kopyalanmadan doğrudan mmap üzerinde durur
+    assert all(_is_memmap(cached['features'][col].to_numpy()) for col in loader.feature_columns)
+
+    # Önbellekten yükleyen loader da aynı çerçeveyi verir
+    pd.testing.assert_frame_equal(_load(data_dir, use_cache=True).features, loader.features, check_dtype=False)
+
+def test_changed_source_invalidates_cache(data_dir):
+    _load(data_dir, use_cache=True)
+    assert is_cache_valid(data_dir)
+
+    path = os.path.join(data_dir, 'elliptic_txs_edgelist.csv')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert not is_cache_valid(data_dir)
+    assert load_cache(data_dir) is None
+
+    # Yeniden yükleme önbelleği yeni parmak iziyle yeniden yazar
+    _load(data_dir, use_cache=True)
+    assert is_cache_valid(data_dir)
+
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("\n")
+    os.utime(path, ns=(stat.st_atime_ns, os.stat(path).st_mtime_ns))
+    assert not is_cache_valid(data_dir)
+
+@pytest.mark.parametrize('damage', ['missing_meta', 'partial_meta', 'missing_array'])
+def test_incomplete_cache_forces_rebuild(data_dir, damage):
+    _load(data_dir, use_cache=True)
+    cache_dir = get_cache_dir(data_dir)
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if damage == 'missing_meta':
+        os.remove(meta_path)
+    elif damage == 'partial_meta':
+        with open(meta_path, 'r+', encoding='utf-8') as f:
+            f.truncate(len(f.read()) // 2)
+    else:
+        os.remove(os.path.join(cache_dir, ARRAY_FILES['edges']))
+
+    assert not is_cache_valid(data_dir)
+    assert load_cache(data_dir) is None
+    rebuilt = _load(data_dir, use_cache=True)
+    assert is_cache_valid(data_dir)
+    pd.testing.assert_frame_equal(load_cache(data_dir)['features'], rebuilt.features, check_dtype=False)
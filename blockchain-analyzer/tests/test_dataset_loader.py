@@ -0,0 +1,48 @@
+import contextlib
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from app.services.dataset_loader import EllipticDatasetLoader
+from bench_reference import write_synthetic_elliptic
+
+def _load(data_dir, compact):
+    loader = EllipticDatasetLoader(data_dir=str(data_dir), use_cache=False, compact=compact)
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader.load_data()
+    return loader
+
+@pytest.fixture(scope='module')
+def loaders(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp('elliptic')
+    write_synthetic_elliptic(data_dir)
+    return _load(data_dir, compact=False), _load(data_dir, compact=True)
+
+def test_compact_layout_keeps_labels(loaders):
+    legacy, compact = loaders
+    np.testing.assert_array_equal(legacy.features['txId'].to_numpy(dtype=np.int64), compact.features['txId'].to_numpy())
+    np.testing.assert_array_equal(legacy.features['class'].to_numpy(dtype=np.int8), compact.features['class'].to_numpy())
+    assert compact.features['class'].dtype == np.int8
+    assert legacy.get_statistics() == compact.get_statistics()
+
+def test_compact_layout_keeps_train_test_split(loaders):
+    legacy, compact = loaders
+    for old, new in zip(legacy.get_train_test_split(), compact.get_train_test_split()):
+        np.testing.assert_array_equal(old.index, new.index)
+        if isinstance(old, pd.DataFrame):
+            assert list(old.columns) == list(new.columns)
+            np.testing.assert_allclose(old.to_numpy(), new.to_numpy(), rtol=1e-6, atol=1e-6)
+        else:
+            np.testing.assert_array_equal(old.to_numpy(dtype=np.int8), new.to_numpy())
+
+def test_compact_layout_keeps_model_accuracy(loaders):
+    accuracies = []
+    for loader in loaders:
+        X_train, X_test, y_train, y_test = loader.get_train_test_split()
+        model = RandomForestClassifier(n_estimators=20, random_state=42, n_jobs=1)
+        model.fit(X_train, y_train.astype(int))
+        accuracies.append(accuracy_score(y_test.astype(int), model.predict(X_test)))
+    assert accuracies[0] == accuracies[1]
+    assert accuracies[0] > 0.5
@@ -0,0 +1,79 @@
+import contextlib
+import io
+import os
+import threading
+
+import pytest
+
+from app.services.dataset_service import EllipticDatasetService, get_elliptic_service
+from bench_reference import write_synthetic_elliptic
+
+@pytest.fixture
+def service(tmp_path):
+    write_synthetic_elliptic(tmp_path, n_nodes=600, n_edges=700, n_features=6)
+    return EllipticDatasetService(str(tmp_path))
+
+def _get(service):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return service.get()
+
+def test_second_get_reuses_dataset(service):
+    first = _get(service)
+    assert _get(service) is first
+    assert service.is_loaded()
+    assert get_elliptic_service(service.data_dir) is get_elliptic_service(service.data_dir + os.sep)
+
+def test_concurrent_gets_load_once(service):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(_get(service))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(dataset) for dataset in results}) == 1
+
+@pytest.mark.parametrize('change', ['mtime', 'size'])
+def test_file_change_reloads(service, change):
+    first = _get(service)
+    path = os.path.join(service.data_dir, 'elliptic_txs_classes.csv')
+    stat = os.stat(path)
+    if change == 'mtime':
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    else:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("\n")
+        # Yalnızca boyut değişsin
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = _get(service)
+    assert second is not first
+    assert second.version != first.version
+    assert _get(service) is second
+
+def test_derived_runs_once_per_version(service):
+    calls = []
+
+    def factory(dataset):
+        calls.append(dataset.version)
+        return len(dataset.features)
+
+    first = _get(service)
+    threads = [threading.Thread(target=first.derived, args=('rows', factory)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert first.derived('rows', factory) == len(first.features)
+    assert calls == [first.version]
+
+    # Veri seti yeniden yüklenince türetilenler de yeniden hesaplanır
+    path = os.path.join(service.data_dir, 'elliptic_txs_edgelist.csv')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    second = _get(service)
+    second.derived('rows', factory)
+    second.derived('rows', factory)
+    assert calls == [first.version, second.version]
+
+    service.invalidate()
+    assert not service.is_loaded()
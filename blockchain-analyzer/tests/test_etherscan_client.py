@@ -0,0 +1,124 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.utils.etherscan_client import EtherscanClient, TokenBucket
+
+RATE_LIMITED = {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}
+SUCCESS = {"status": "1", "message": "OK", "result": [{"hash": "0x1"}]}
+
+class ScriptedServer:
+    """Sırayla verilen yanıtları döndüren yerel HTTP sunucusu; son yanıt tekrarlanır"""
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.hits = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = server.responses[min(server.hits, len(server.responses) - 1)]
+                server.hits += 1
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def scripted():
+    servers = []
+
+    def start(*responses):
+        servers.append(ScriptedServer(responses))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.close()
+
+def make_client(url, max_retries, monkeypatch):
+    client = EtherscanClient(api_key="test", base_url=url, calls_per_second=1000, max_retries=max_retries)
+    backoffs = []
+    # Geri çekilme beklemesi yerine deneme numarası kaydedilir
+    monkeypatch.setattr(client, '_backoff', backoffs.append)
+    return client, backoffs
+
+def test_rate_limit_is_retried_then_succeeds(scripted, monkeypatch):
+    server = scripted(RATE_LIMITED, RATE_LIMITED, SUCCESS)
+    client, backoffs = make_client(server.url, 3, monkeypatch)
+
+    assert client.get_result("account", "txlist", address="0xabc") == SUCCESS["result"]
+    assert server.hits == 3
+    assert backoffs == [0, 1]
+
+    stats = client.stats()['actions']['txlist']
+    assert stats['calls'] == 3
+    assert stats['retries'] == 2
+    assert stats['rate_limited'] == 2
+    assert stats['errors'] == 0
+    # Hız iki kez yarıya iner (1000 -> 250), başarılı çağrı üst sınırın %5'i kadar geri kazandırır
+    assert client.limiter.rate == pytest.approx(300)
+
+def test_exhausted_retries_raise(scripted, monkeypatch):
+    server = scripted(RATE_LIMITED)
+    client, backoffs = make_client(server.url, 2, monkeypatch)
+
+    with pytest.raises(ValueError, match="rate limit"):
+        client.call("account", "txlist")
+    assert server.hits == 3
+    assert backoffs == [0, 1]
+    stats = client.stats()['actions']['txlist']
+    assert stats['rate_limited'] == 3 and stats['retries'] == 2
+
+def test_network_errors_are_retried(scripted, monkeypatch):
+    server = scripted(SUCCESS)
+    url = server.url
+    # Kapalı bir porta giden istek bağlantı hatası verir
+    client, backoffs = make_client("http://127.0.0.1:9/api", 1, monkeypatch)
+    with pytest.raises(ValueError, match="Etherscan API error"):
+        client.call("account", "balance")
+    assert backoffs == [0]
+    assert client.stats()['actions']['balance']['errors'] == 2
+
+    client.base_url = url
+    assert client.call("account", "balance") == SUCCESS
+
+def test_token_bucket_adapts_rate():
+    limiter = TokenBucket(8, min_rate=1)
+    limiter.on_throttled()
+    assert limiter.rate == 4
+    limiter.on_throttled()
+    limiter.on_throttled()
+    limiter.on_throttled()
+    assert limiter.rate == 1
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == limiter.max_rate == 8
+
+def test_token_bucket_waits_when_empty(monkeypatch):
+    clock = {'now': 0.0, 'sleeps': []}
+
+    def sleep(seconds):
+        clock['sleeps'].append(seconds)
+        clock['now'] += seconds
+
+    monkeypatch.setattr('app.utils.etherscan_client.time.monotonic', lambda: clock['now'])
+    monkeypatch.setattr('app.utils.etherscan_client.time.sleep', sleep)
+    limiter = TokenBucket(2, capacity=1)
+    limiter.acquire()
+    limiter.acquire()
+    assert clock['sleeps'] == [pytest.approx(0.5)]
@@ -0,0 +1,102 @@
+import json
+import os
+import threading
+
+import pytest
+
+import etherscan_download
+from app.utils import etherscan_client
+from app.utils.etherscan_client import EtherscanClient
+from app.utils.tx_io import iter_transactions
+
+ADDRESS = "0x" + "ab" * 20
+LIMIT = 15
+
+class FakeTxlist:
+    """Blok başına sabit sayıda işlem döndüren get_transactions yerine geçen sahte"""
+
+    def __init__(self, per_block=1, failing=()):
+        self.per_block = per_block
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, address, start_block, end_block):
+        with self._lock:
+            self.calls.append((start_block, end_block))
+        if (start_block, end_block) in self.failing:
+            raise ValueError("Etherscan API error: geçici hata")
+        transactions = [
+            {'hash': f"0x{block:08x}{i:02x}", 'blockNumber': str(block), 'from': address}
+            for block in range(start_block, end_block + 1) for i in range(self.per_block)
+        ]
+        # Etherscan gibi sonuç sınırında keser
+        return transactions[:LIMIT]
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(etherscan_download, 'MAX_RESULTS_PER_CALL', LIMIT)
+    monkeypatch.setattr(etherscan_client, '_client', EtherscanClient(api_key="test"))
+    fake = FakeTxlist()
+    monkeypatch.setattr(etherscan_download, 'get_transactions', fake)
+    return fake
+
+def download(tmp_path, **kwargs):
+    options = dict(addresses=[ADDRESS], start_block=0, end_block=39, step=20, concurrency=4,
+                   checkpoint_dir=str(tmp_path / "checkpoint"), filename=str(tmp_path / "out.ndjson"))
+    options.update(kwargs)
+    return etherscan_download.run(**options)
+
+def test_full_window_is_split(tmp_path, fake):
+    progress = download(tmp_path, end_block=19)
+    checkpoint = tmp_path / "checkpoint"
+
+    # 20 blokluk pencere sınırda: ikiye bölünür, .split işareti kalır ve iki yarı da indirilir
+    assert fake.calls[0] == (0, 19)
+    assert sorted(fake.calls[1:]) == [(0, 9), (10, 19)]
+    assert os.path.exists(etherscan_download.shard_path(str(checkpoint), ADDRESS, 0, 19, "split"))
+    assert not os.path.exists(etherscan_download.shard_path(str(checkpoint), ADDRESS, 0, 19))
+    assert progress['windows'] == 2 and progress['transactions'] == 20
+
+    # Yeniden başlatmada bölünmüş pencere tekrar sorgulanmaz
+    fake.calls.clear()
+    progress = download(tmp_path, end_block=19)
+    assert fake.calls == []
+    assert progress['skipped'] == 2
+
+def test_rerun_skips_shards_and_retries_failed_windows(tmp_path, fake):
+    fake.per_block = 0
+    fake.failing = {(20, 39)}
+    progress = download(tmp_path)
+    assert progress['failed'] == 1 and progress['windows'] == 1
+    assert sorted(fake.calls) == [(0, 19), (20, 39)]
+
+    fake.failing.clear()
+    fake.calls.clear()
+    progress = download(tmp_path)
+    assert fake.calls == [(20, 39)]
+    assert progress == {'windows': 1, 'skipped': 1, 'failed': 0, 'transactions': 0}
+
+def test_manifest_mismatch_requires_reset(tmp_path, fake):
+    download(tmp_path, assemble_output=False)
+    with pytest.raises(SystemExit):
+        download(tmp_path, step=10, assemble_output=False)
+
+    fake.calls.clear()
+    progress = download(tmp_path, step=10, reset=True, assemble_output=False)
+    # Eski parçalar silindiği için yeni pencerelerin hepsi indirilir
+    assert progress['skipped'] == 0
+    assert sorted(fake.calls) == [(0, 9), (10, 19), (20, 29), (30, 39)]
+
+def test_assemble_writes_same_records_to_json_and_ndjson(tmp_path, fake):
+    download(tmp_path, assemble_output=False)
+    checkpoint = str(tmp_path / "checkpoint")
+    ndjson, as_json = str(tmp_path / "out.ndjson"), str(tmp_path / "out.json")
+
+    assert etherscan_download.assemble(checkpoint, ndjson) == 40
+    assert etherscan_download.assemble(checkpoint, as_json) == 40
+    with open(as_json, encoding="utf-8") as f:
+        records = json.load(f)
+    assert records == list(iter_transactions(ndjson))
+    # Parçalar blok sırasında birleştirilir
+    assert [int(tx['blockNumber']) for tx in records] == list(range(40))
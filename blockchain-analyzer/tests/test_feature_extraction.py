@@ -0,0 +1,13 @@
+import pandas as pd
+from app.services.ml_anomaly import build_feature_matrix
+from bench_reference import legacy_feature_matrix, synthetic_transactions
+
+def test_feature_matrix_matches_legacy_implementation():
+    df = synthetic_transactions(20000, 2000)
+    old = legacy_feature_matrix(df)
+    new = build_feature_matrix(df)
+    columns = [col for col in old.columns if col not in ('first_tx', 'last_tx')]
+    pd.testing.assert_frame_equal(
+        old[columns].reset_index(drop=True), new[columns].reset_index(drop=True),
+        check_dtype=False, rtol=1e-9
+    )
@@ -0,0 +1,65 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app.services.feature_store import FeatureStore
+from app.services.ml_anomaly import build_feature_matrix
+from app.utils.tx_io import TransactionWriter, read_transactions
+from bench_reference import synthetic_transactions
+
+@pytest.fixture
+def data_path(tmp_path):
+    path = str(tmp_path / "raw_transactions.ndjson")
+    with TransactionWriter(path) as writer:
+        writer.write(synthetic_transactions(3000, 300).to_dict('records'))
+    return path
+
+class CountingCompute:
+    """Öznitelik matrisini dosyadan hesaplayan ve çağrıları sayan fonksiyon"""
+    def __init__(self, data_path):
+        self.data_path = data_path
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return build_feature_matrix(read_transactions(self.data_path))
+
+def test_memory_hit_returns_shared_frame(data_path):
+    store = FeatureStore()
+    compute = CountingCompute(data_path)
+    first = store.get(data_path, compute)
+    assert store.get(data_path, compute) is first
+    assert compute.calls == 1
+
+def test_disk_round_trip(tmp_path, data_path):
+    cache_dir = str(tmp_path / "features")
+    compute = CountingCompute(data_path)
+    expected = FeatureStore(cache_dir=cache_dir).get(data_path, compute)
+    assert os.listdir(cache_dir) == [f"features_{FeatureStore.fingerprint(data_path)}.pkl"]
+
+    # Yeni süreç gibi: bellek boş, matris diskten okunur ve hesaplama yapılmaz
+    restored = FeatureStore(cache_dir=cache_dir).get(data_path, compute)
+    assert compute.calls == 1
+    assert restored is not expected
+    pd.testing.assert_frame_equal(restored, expected)
+
+def test_changed_file_is_recomputed(tmp_path, data_path):
+    store = FeatureStore(cache_dir=str(tmp_path / "features"))
+    compute = CountingCompute(data_path)
+    first = store.get(data_path, compute)
+    old_fingerprint = FeatureStore.fingerprint(data_path)
+
+    with TransactionWriter(data_path, append=True) as writer:
+        writer.write(synthetic_transactions(500, 300, seed=7).to_dict('records'))
+    assert FeatureStore.fingerprint(data_path) != old_fingerprint
+
+    second = store.get(data_path, compute)
+    assert compute.calls == 2
+    assert second['tx_count'].sum() > first['tx_count'].sum()
+    # Eski sürümün diskteki kopyası yeni sürüm yerine kullanılmaz
+    assert len(os.listdir(tmp_path / "features")) == 2
+
+    store.invalidate(data_path)
+    assert store.get(data_path, compute) is not second
+    assert compute.calls == 2
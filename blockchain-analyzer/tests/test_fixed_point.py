@@ -0,0 +1,59 @@
+from decimal import Decimal
+from itertools import islice
+
+import numpy as np
+import pytest
+
+from app.services.fixed_point import LIMB_BASE, MAX_VALUE, FixedPointArray
+
+@pytest.fixture(scope='module')
+def wei_values():
+    """Eşitlikler, 2^63 üzerindeki wei değerleri ve limb sınırındaki değerler"""
+    rng = np.random.default_rng(7)
+    values = [int(v) for v in rng.integers(0, 10 ** 6, 300)]
+    values += [int(v) * LIMB_BASE + int(w) for v, w in zip(rng.integers(0, 50, 300), rng.integers(0, 5, 300))]
+    values += [2 ** 63, 2 ** 63 + 1, 2 ** 64 * 7, LIMB_BASE - 1, LIMB_BASE, 10 ** 30 + 1, MAX_VALUE - 1] * 3
+    values = [values[i] for i in rng.permutation(len(values))]
+    return values, FixedPointArray.from_strings([str(v) for v in values])
+
+def reference_order(values):
+    """Decimal üzerinden azalan, eşitlikte orijinal sıra"""
+    return sorted(range(len(values)), key=lambda i: (-Decimal(values[i]), i))
+
+def test_parsing_is_exact(wei_values):
+    values, array = wei_values
+    assert [array.to_int(i) for i in range(len(values))] == values
+    assert array.sum() == sum(values)
+
+@pytest.mark.parametrize('k', [0, 1, 5, 21, 64, 300, 1000, 5000])
+def test_top_k_matches_sorted(wei_values, k):
+    values, array = wei_values
+    assert array.top_k(k).tolist() == reference_order(values)[:k]
+
+def test_top_k_with_float_ties():
+    # Float yaklaşığı aynı, tam değeri farklı değerler sınırda doğru ayrılmalı
+    values = [2 ** 70 + i for i in (3, 0, 2, 1, 3)] + [5, 5]
+    array = FixedPointArray.from_strings([str(v) for v in values])
+    assert np.unique(array.to_float()).size < len(set(values))
+    for k in range(len(values) + 1):
+        assert array.top_k(k).tolist() == reference_order(values)[:k]
+
+@pytest.mark.parametrize('initial', [1, 3, 64])
+def test_iter_descending_matches_sorted(wei_values, initial):
+    values, array = wei_values
+    expected = reference_order(values)
+    assert list(array.iter_descending(initial=initial)) == expected
+    # Erken bırakılan tüketim de aynı öneki verir
+    assert list(islice(array.iter_descending(initial=initial), 10)) == expected[:10]
+    assert array.argsort(descending=True).tolist() == expected
+
+def test_greater_than_and_add_at(wei_values):
+    values, array = wei_values
+    threshold = 2 ** 63
+    assert array.greater_than(threshold).tolist() == [v > threshold for v in values]
+
+    # Toplamlar da temsil aralığında kalsın diye MAX_VALUE yakınındaki değerler dışarıda bırakılır
+    rows = np.flatnonzero([v < 2 ** 100 for v in values])
+    totals = FixedPointArray(np.zeros(4, dtype=np.int64), np.zeros(4, dtype=np.int64))
+    totals.add_at(rows % 4, array[rows])
+    assert [totals.to_int(i) for i in range(4)] == [sum(values[r] for r in rows if r % 4 == i) for i in range(4)]
@@ -0,0 +1,93 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.graph_accumulator import GraphAccumulator
+from app.services.graph_analysis import create_graph_from_transactions
+from bench_reference import synthetic_transactions
+
+@pytest.fixture(scope='module')
+def transactions():
+    df = synthetic_transactions(20000, 500)
+    df.loc[df.index[::97], 'to'] = ''  # kontrat oluşturma
+    return df
+
+def _edge_data(G):
+    return {(u, v): d for u, v, d in G.edges(data=True)}
+
+def test_totals_are_exact(transactions):
+    accumulator = GraphAccumulator()
+    accumulator.add(transactions)
+    G = accumulator.graph()
+
+    valid = transactions[(transactions['from'] != '') & (transactions['to'] != '')]
+    assert accumulator.n_transactions == len(valid)
+    assert accumulator.total_volume() == sum(int(v) for v in valid['value']) / 10 ** 18
+    assert sum(d["count"] for _, _, d in G.edges(data=True)) == accumulator.n_transactions
+
+def test_incremental_batches_match_single_batch(transactions):
+    whole = GraphAccumulator()
+    whole.add(transactions)
+
+    incremental = GraphAccumulator()
+    for start in range(0, len(transactions), 3000):
+        incremental.add(transactions.iloc[start:start + 3000].to_dict('records'))
+        incremental.graph()
+
+    expected, actual = whole.graph(), incremental.graph()
+    assert list(actual.nodes()) == list(expected.nodes())
+    assert _edge_data(actual) == _edge_data(expected)
+    np.testing.assert_array_equal(incremental.out_degree, whole.out_degree)
+    np.testing.assert_array_equal(incremental.received_count, whole.received_count)
+
+def test_returned_graph_is_a_frozen_snapshot(transactions):
+    accumulator = GraphAccumulator()
+    accumulator.add(transactions.iloc[:1000])
+    G = accumulator.graph()
+    edges = _edge_data(G)
+    assert nx.is_frozen(G)
+    with pytest.raises(nx.NetworkXError):
+        G.add_edge('a', 'b')
+
+    accumulator.add(transactions.iloc[1000:2000])
+    assert _edge_data(G) == edges
+    assert accumulator.graph().number_of_edges() > G.number_of_edges()
+
+def test_missing_addresses_are_skipped():
+    rows = pd.DataFrame({
+        'from': ['0xa', None, np.nan, '', '0xb'],
+        'to': ['0xb', '0xb', '0xb', '0xb', np.nan],
+        'value': ['1', '2', '3', '4', '5'],
+        'timeStamp': ['10', '11', '12', '13', '14'],
+        'hash': ['h1', 'h2', 'h3', 'h4', 'h5']
+    })
+    accumulator = GraphAccumulator()
+    assert accumulator.add(rows) == 1
+    assert accumulator.node_ids == ['0xa', '0xb']
+    assert accumulator.add([{'from': None, 'to': '0xa', 'value': '1', 'timeStamp': '1', 'hash': 'h'}]) == 0
+
+@pytest.mark.parametrize('max_nodes', [10, 60, 10 ** 6])
+def test_counterparty_graph_matches_summed_multigraph(transactions, max_nodes):
+    records = transactions.iloc[:5000].to_dict('records')
+    # Referans: her işlem ayrı kenar, paralel kenarlar networkx ile toplanır
+    multi = nx.MultiDiGraph()
+    multi.add_edges_from((tx['from'], tx['to'], {'wei': int(tx['value'])})
+                         for tx in records if tx['from'] and tx['to'])
+    totals = {}
+    for u, v, wei in multi.edges(data='wei'):
+        totals[(u, v)] = totals.get((u, v), 0) + wei
+    counts = {pair: multi.number_of_edges(*pair) for pair in totals}
+
+    G = create_graph_from_transactions(records, max_nodes=max_nodes, aggregate=True)
+    # Seçim: toplam değeri en yüksek çiftler (eşitlikte ilk görülen), max_nodes adrese ulaşınca durur
+    expected, nodes = [], set()
+    for pair in sorted(totals, key=lambda pair: -totals[pair]):
+        expected.append(pair)
+        nodes.update(pair)
+        if len(nodes) >= max_nodes:
+            break
+    assert set(G.edges()) == set(expected)
+    for u, v, data in G.edges(data=True):
+        assert data['weight'] == pytest.approx(totals[(u, v)] / 10 ** 18, rel=1e-15)
+        assert data['count'] == counts[(u, v)]
@@ -0,0 +1,38 @@
+import json
+import os
+
+import numpy as np
+
+from app.services.graph_store import STATS_FILE, GraphStore
+
+def _saved_stats(cache_dir):
+    [directory] = [path for path in os.listdir(cache_dir) if path.startswith("raw_data_")]
+    with open(os.path.join(cache_dir, directory, STATS_FILE), encoding="utf-8") as f:
+        return json.load(f)
+
+def test_stat_is_computed_once_and_reloaded(tmp_path):
+    calls = []
+    compute = lambda: calls.append(1) or {"top": (("a", np.float64(0.5)),), "count": np.int64(3)}
+
+    store = GraphStore(cache_dir=str(tmp_path))
+    value = store.stat("raw_data", "v1", "stats", compute)
+    assert value == {"top": [["a", 0.5]], "count": 3}
+    assert store.stat("raw_data", "v1", "stats", compute) == value
+
+    reloaded = GraphStore(cache_dir=str(tmp_path)).stat("raw_data", "v1", "stats", compute)
+    assert reloaded == value
+    assert len(calls) == 1
+
+def test_unpersisted_stat_stays_in_memory_only(tmp_path):
+    store = GraphStore(cache_dir=str(tmp_path))
+    truncated = store.stat("raw_data", "v1", "paths", lambda: [["a", "b"], True], persist=lambda value: not value[1])
+    # Aynı süreçte bellekten döner, sonraki kalıcı yazımlara da karışmaz
+    assert store.stat("raw_data", "v1", "paths", lambda: [[], False]) == truncated
+    store.stat("raw_data", "v1", "isolated", lambda: ["c"])
+    assert _saved_stats(tmp_path) == {"isolated": ["c"]}
+
+    # Yeni süreç kesik sonucu diskte bulmaz ve yeniden hesaplar
+    restarted = GraphStore(cache_dir=str(tmp_path))
+    assert restarted.stat("raw_data", "v1", "paths", lambda: [["a", "b", "c"], False],
+                          persist=lambda value: not value[1]) == [["a", "b", "c"], False]
+    assert _saved_stats(tmp_path) == {"isolated": ["c"], "paths": [["a", "b", "c"], False]}
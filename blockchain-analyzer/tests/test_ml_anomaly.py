@@ -0,0 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.feature_store import FeatureStore
+from app.services.ml_anomaly import MLAnomalyDetector
+from bench_reference import synthetic_transactions
+
+ALGORITHMS = ['isoforest', 'lof', 'ocsvm', 'dbscan']
+
+def _detector(path):
+    return MLAnomalyDetector(data_path=str(path), feature_store=FeatureStore())
+
+def test_concurrent_requests_do_not_share_results(tmp_path):
+    path = tmp_path / 'raw_transactions.json'
+    synthetic_transactions(3000, 300).to_json(path, orient='records')
+
+    serial = {algo: _detector(path).get_anomalies_by_method(algo, n=20) for algo in ALGORITHMS}
+
+    # Paylaşılan tek örnek üzerinde farklı algoritmalar aynı anda çalıştırılır
+    shared = _detector(path)
+    requests = ALGORITHMS * 3
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        results = list(pool.map(lambda algo: shared.get_anomalies_by_method(algo, n=20), requests))
+
+    for algo, records in zip(requests, results):
+        assert records == serial[algo]
+    assert not hasattr(shared, 'model') and not hasattr(shared, 'scores')
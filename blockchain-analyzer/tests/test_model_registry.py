@@ -0,0 +1,39 @@
+import os
+
+import joblib
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+from app.services import model_registry
+from app.services.model_registry import ModelRegistry
+
+def _write_model(path, seed):
+    X = np.random.default_rng(seed).random((50, 3))
+    joblib.dump(IsolationForest(n_estimators=10, random_state=seed).fit(X), path)
+
+def test_model_size_is_computed_only_on_request(tmp_path, monkeypatch):
+    _write_model(tmp_path / 'isoforest.joblib', seed=0)
+    calls = []
+    estimate = model_registry.estimate_model_size
+    monkeypatch.setattr(model_registry, 'estimate_model_size', lambda model: calls.append(model) or estimate(model))
+
+    registry = ModelRegistry(str(tmp_path), {'isoforest': 'isoforest.joblib'})
+    model = registry.get('isoforest')
+    assert registry.get('isoforest') is model
+    assert calls == []
+
+    info = registry.info('isoforest')
+    assert info['memory_size_bytes'] > 0
+    assert info['file_size_bytes'] == os.path.getsize(tmp_path / 'isoforest.joblib')
+    registry.info('isoforest')
+    assert len(calls) == 1
+
+def test_changed_model_file_is_reloaded(tmp_path):
+    path = tmp_path / 'isoforest.joblib'
+    _write_model(path, seed=0)
+    registry = ModelRegistry(str(tmp_path), {'isoforest': 'isoforest.joblib'})
+    first = registry.get('isoforest')
+
+    _write_model(path, seed=1)
+    os.utime(path, ns=(0, 1))
+    assert registry.get('isoforest') is not first
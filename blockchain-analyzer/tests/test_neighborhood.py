@@ -0,0 +1,49 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from app.services.csr_graph import CSRGraph
+from app.services.graph_analysis import extract_neighborhood
+
+@pytest.fixture(scope='module')
+def graph():
+    rng = np.random.default_rng(3)
+    n_nodes, n_edges = 2000, 5000
+    return CSRGraph(np.arange(n_nodes) * 7 + 1, rng.integers(0, n_nodes, n_edges), rng.integers(0, n_nodes, n_edges),
+                    node_labels=rng.choice([-1, 0, 1], n_nodes).astype(np.int8))
+
+@pytest.fixture(scope='module')
+def digraph(graph):
+    G = nx.DiGraph()
+    G.add_nodes_from(range(graph.n_nodes))
+    G.add_edges_from(zip(graph.src.tolist(), graph.dst.tolist()))
+    return G
+
+@pytest.mark.parametrize('direction', ['out', 'in'])
+def test_matches_networkx_bfs(graph, digraph, direction):
+    G = digraph if direction == 'out' else digraph.reverse()
+    for center in range(0, graph.n_nodes, 97):
+        nodes, hops, _, truncated = graph.neighborhood(center, hops=3, direction=direction)
+        assert not truncated
+        assert dict(zip(nodes.tolist(), hops.tolist())) == nx.single_source_shortest_path_length(G, center, cutoff=3)
+
+def test_both_directions_and_induced_edges(graph, digraph):
+    center = int(np.argmax(graph.degree))
+    nodes, hops, sides, _ = graph.neighborhood(center, hops=2, direction='both')
+    out_nodes = nx.single_source_shortest_path_length(digraph, center, cutoff=2)
+    in_nodes = nx.single_source_shortest_path_length(digraph.reverse(), center, cutoff=2)
+    assert set(nodes.tolist()) <= set(out_nodes) | set(in_nodes)
+    assert {n for n, d in out_nodes.items() if d == 1} | {n for n, d in in_nodes.items() if d == 1} \
+        <= set(nodes[hops == 1].tolist()) | {center}
+
+    edges = graph.induced_edges(nodes)
+    induced = set(zip(graph.src[edges].tolist(), graph.dst[edges].tolist()))
+    assert induced == set(digraph.subgraph(nodes.tolist()).edges())
+
+def test_max_nodes_truncates(graph):
+    center = int(np.argmax(graph.degree))
+    result = extract_neighborhood(graph, str(graph.node_ids[center]), hops=5, max_nodes=10)
+    assert len(result["nodes"]) == 10
+    assert result["truncated"]
+    with pytest.raises(KeyError):
+        extract_neighborhood(graph, "2")
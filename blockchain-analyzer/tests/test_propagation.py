@@ -0,0 +1,70 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from app.services.csr_graph import CSRGraph
+from app.services.propagation import ANOMALY_FRACTION, ILLICIT, LICIT, PROPAGATION_METHODS, UNKNOWN, illicit_ranking
+from bench_reference import write_synthetic_elliptic
+
+@pytest.fixture(scope='module')
+def graph():
+    rng = np.random.default_rng(7)
+    n_nodes, n_edges = 400, 600
+    labels = rng.choice([UNKNOWN] * 6 + [LICIT] * 3 + [ILLICIT], n_nodes).astype(np.int8)
+    return CSRGraph(np.arange(n_nodes), rng.integers(0, n_nodes, n_edges), rng.integers(0, n_nodes, n_edges),
+                    node_labels=labels)
+
+def test_pagerank_matches_networkx(graph):
+    ranking = illicit_ranking(graph, 'pagerank')
+
+    G = nx.Graph()
+    G.add_nodes_from(range(graph.n_nodes))
+    G.add_edges_from(zip(graph.src.tolist(), graph.dst.tolist()))
+    illicit = np.flatnonzero(graph.node_labels == ILLICIT)
+    expected = nx.pagerank(G, alpha=0.85, personalization={int(i): 1 for i in illicit}, tol=1e-12, max_iter=500)
+    np.testing.assert_allclose(ranking["scores"], [expected[i] for i in range(graph.n_nodes)], atol=1e-9)
+
+@pytest.mark.parametrize('method', ['pagerank', 'label_spreading'])
+def test_order_and_anomaly_cutoff(graph, method):
+    ranking = illicit_ranking(graph, method)
+    order, scores = ranking["order"], ranking["scores"]
+    unknown = np.flatnonzero(graph.node_labels == UNKNOWN)
+
+    assert sorted(order.tolist()) == unknown.tolist()
+    assert np.all(np.diff(scores[order]) <= 0)
+    assert 0 < ranking["anomaly_count"] <= math.ceil(ANOMALY_FRACTION * len(unknown))
+    assert np.all(scores[order[:ranking["anomaly_count"]]] > 0)
+
+def test_elliptic_ml_anomalies_route(tmp_path, monkeypatch):
+    from app import create_app, routes
+
+    write_synthetic_elliptic(tmp_path)
+    monkeypatch.setattr(routes, 'ELLIPTIC_DATA_DIR', str(tmp_path))
+    client = create_app().test_client()
+    url = "/api/ml-anomalies?dataset_type=elliptic&load_data=true&page_size=100"
+
+    # Elliptic sıralaması eğitilmiş modele ihtiyaç duymaz
+    body = client.get(url).get_json()
+    assert body["status"] == "success", body
+    assert body["algorithm"] == 'pagerank'
+    propagation = body["propagation"]
+    flags = [entry["is_anomaly"] for entry in body["anomalies"]]
+    assert flags == [rank <= propagation["anomaly_count"] for rank in range(1, len(flags) + 1)]
+    assert 0 < propagation["anomaly_count"] < body["pagination"]["total"]
+
+    body = client.get(url + "&all=true").get_json()
+    assert set(body["all_anomalies"]) == {'pagerank', 'label_spreading'}
+    assert body["propagation"]['label_spreading']["method"] == 'label_spreading'
+
+    assert client.get(url + "&method=bogus").status_code == 400
+
+    # ML algoritmaları Elliptic'e uygulanmaz; yayılım yöntemi adı ise algo ile de seçilebilir
+    assert client.get(url + "&algo=ocsvm").status_code == 400
+    assert client.get(url + "&algo=label_spreading").get_json()["algorithm"] == 'label_spreading'
+
+    discovery = client.get("/api/ml-anomalies").get_json()["data"]
+    assert [m["id"] for m in discovery["propagation_methods"]] == list(PROPAGATION_METHODS)
+    elliptic = next(d for d in discovery["available_datasets"] if d["id"] == "elliptic")
+    assert elliptic["parameter"] == "method" and elliptic["algorithms"] == list(PROPAGATION_METHODS)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.temporal import MAX_BINS, TemporalIndex, temporal_summary
+
+def test_bins_match_pandas_groupby():
+    rng = np.random.default_rng(42)
+    timestamps = 1600000000 + rng.integers(0, 30 * 24 * 3600, 5000)
+    values = rng.random(5000)
+    bins = TemporalIndex(timestamps, values).bins('day')
+
+    days = pd.Series(values).groupby(timestamps // 86400 * 86400)
+    counts = dict(zip(bins["start"], bins["count"]))
+    volumes = dict(zip(bins["start"], bins["volume"]))
+    assert sum(bins["count"]) == len(timestamps)
+    for start, group in days:
+        assert counts[start] == len(group)
+        assert volumes[start] == pytest.approx(group.sum())
+
+def test_single_timestamp_does_not_divide_by_zero():
+    summary = temporal_summary(TemporalIndex([1600000000] * 3, [1.0, 2.0, 3.0]))
+    assert summary["time_span_days"] == 0
+    assert summary["transaction_count_by_time"] == {0: 3}
+
+def test_too_many_bins_is_a_value_error():
+    index = TemporalIndex([0, MAX_BINS * 10], [1.0, 1.0])
+    with pytest.raises(ValueError, match="Çok fazla dilim"):
+        index.bins(1)
+
+def test_graph_analysis_rejects_too_fine_resolution(tmp_path, monkeypatch):
+    from app import create_app
+    from bench_reference import synthetic_transactions
+
+    df = synthetic_transactions(500, 50)
+    df['blockNumber'] = (pd.to_numeric(df['timeStamp']) // 12).astype(str)
+    (tmp_path / 'data').mkdir()
+    df.to_json(tmp_path / 'data' / 'raw_transactions.json', orient='records')
+    monkeypatch.chdir(tmp_path)
+
+    client = create_app().test_client()
+    url = "/api/graph-analysis?dataset_type=raw_data&load_data=true&betweenness_k=10&temporal_resolution="
+    response = client.get(url + "1")
+    assert response.status_code == 400
+    assert "Çok fazla dilim" in response.get_json()["message"]
+    assert client.get(url + "week").status_code == 200
@@ -0,0 +1,41 @@
+import numpy as np
+
+from app.services.token_analyzer import TokenAnalyzer, _token_amounts
+
+WALLET = "0x" + "ab" * 20
+
+def _transfer(value, decimals, to=WALLET):
+    return {
+        'contractAddress': "0x" + "cd" * 20, 'tokenName': 'Token', 'tokenSymbol': 'TKN',
+        'tokenDecimal': str(decimals), 'value': str(value), 'timeStamp': '1600000000',
+        'to': to, 'from': "0x" + "ef" * 20
+    }
+
+def test_token_amounts_match_exact_division():
+    rng = np.random.default_rng(42)
+    raw = [str(int(v)) for v in rng.integers(0, 2 ** 62, 500)]
+    raw += ['0', '1', str(10 ** 36 - 1), str(123456789 * 10 ** 27 + 987654321), str(2 ** 256 - 1)]
+    decimals = [int(d) for d in rng.choice([0, 6, 8, 18, 24], len(raw))]
+
+    values = _token_amounts(raw, decimals)
+    expected = [int(v) / 10 ** d for v, d in zip(raw, decimals)]
+    np.testing.assert_allclose(values, expected, rtol=1e-15, atol=0)
+
+def test_analyze_erc20_output():
+    transfers = [_transfer(1500000, 6), _transfer(2 * 10 ** 18, 18, to="0x" + "01" * 20)]
+    tokens = TokenAnalyzer()._analyze_erc20(WALLET, transfers)
+    assert [token['value'] for token in tokens] == [1.5, 2.0]
+    assert [token['type'] for token in tokens] == ['in', 'out']
+    assert isinstance(tokens[0]['value'], float)
+
+def test_risk_score_counts_rapid_transactions_and_bursts():
+    sender = "0x" + "ef" * 20
+    # Aynı göndericiden 20 saniye arayla 6 işlem (tek yoğunlaşma), 1 saat sonra bir tane daha
+    times = [1600000000 + 20 * i for i in range(6)] + [1600003600]
+    transactions = [{'hash': f"0x{i:064x}", 'from': sender, 'to': WALLET, 'value': '0',
+                     'timeStamp': str(t), 'isError': '0'} for i, t in enumerate(times)]
+    risk = TokenAnalyzer()._calculate_risk_score(WALLET, transactions[::-1])
+    assert risk['rapid_transactions'] == 5
+    assert risk['rapid_bursts'] == 1
+    assert risk['high_value_transactions'] == 0
+    assert risk['total_score'] == 25
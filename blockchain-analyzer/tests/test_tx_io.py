@@ -0,0 +1,80 @@
+import json
+
+import pandas as pd
+import pytest
+
+from app.utils.tx_io import (TransactionWriter, _iter_json_array, convert, detect_format, iter_chunks,
+                             iter_transactions, read_transactions)
+from bench_reference import synthetic_transactions
+
+@pytest.fixture(scope='module')
+def records():
+    records = synthetic_transactions(250, 40).to_dict('records')
+    # Ayırıcı karakterler ve kaçışlar içeren alanlar da doğru ayrıştırılmalı
+    records[3]['input'] = 'a], {"b": "c\\"d"}, ['
+    records[7]['input'] = 'ç, ğ, ü ]'
+    for tx in records:
+        tx.setdefault('input', '0x')
+    return records
+
+def write_json_array(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2)
+
+def write_ndjson(path, records):
+    with TransactionWriter(str(path), fmt='ndjson') as writer:
+        writer.write(records)
+
+@pytest.mark.parametrize('buffer_size', [1, 7, 64, 1 << 20])
+def test_indented_json_array_with_small_buffer(tmp_path, records, buffer_size):
+    path = tmp_path / "raw_transactions.json"
+    write_json_array(path, records)
+    with open(path, 'r', encoding='utf-8') as f:
+        assert list(_iter_json_array(f, buffer_size=buffer_size)) == records
+    assert detect_format(str(path)) == 'json'
+    assert list(iter_transactions(str(path))) == records
+
+def test_empty_and_invalid_json_array(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text("  [\n]\n", encoding='utf-8')
+    assert list(iter_transactions(str(path))) == []
+    path.write_text('{"hash": "0x1"}', encoding='utf-8')
+    with open(path, 'r', encoding='utf-8') as f:
+        with pytest.raises(ValueError):
+            list(_iter_json_array(f))
+
+@pytest.mark.parametrize('name', ["raw_transactions.ndjson", "raw_transactions.json"])
+def test_ndjson_round_trip(tmp_path, records, name):
+    # .json adlı NDJSON dosyası da ilk karakterinden tanınır
+    path = str(tmp_path / name)
+    write_ndjson(path, records)
+    assert detect_format(path) == 'ndjson'
+    assert list(iter_transactions(path)) == records
+
+    chunks = list(iter_chunks(path, chunksize=100, columns=['hash', 'value']))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    expected = pd.DataFrame(records)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected[['hash', 'value']])
+    pd.testing.assert_frame_equal(read_transactions(path, chunksize=64), expected)
+
+def test_parquet_round_trip(tmp_path, records):
+    pytest.importorskip('pyarrow')
+    source = str(tmp_path / "raw_transactions.ndjson")
+    path = str(tmp_path / "raw_transactions.parquet")
+    write_ndjson(source, records)
+    convert(source, path, chunksize=64)
+
+    assert detect_format(path) == 'parquet'
+    assert list(iter_transactions(path)) == records
+
+    chunks = list(iter_chunks(path, chunksize=100, columns=['from', 'timeStamp']))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    assert all(list(chunk.columns) == ['from', 'timeStamp'] for chunk in chunks)
+    expected = pd.DataFrame(records)
+    columns = pd.concat(chunks, ignore_index=True)
+    assert columns['from'].tolist() == expected['from'].tolist()
+    assert columns['timeStamp'].tolist() == expected['timeStamp'].tolist()
+
+    frame = read_transactions(path)
+    assert frame.to_dict('records') == records
+    assert read_transactions(path, columns=['hash'])['hash'].tolist() == expected['hash'].tolist()
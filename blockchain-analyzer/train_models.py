@@ -319,7 +319,7 @@ def main():
         unknown_data = features[features['class'] == -1]
         if not unknown_data.empty:
             print(f"\nBilinmeyen {len(unknown_data)} işlem için tahmin yapılıyor...")
-            X_unknown = unknown_data.drop(['txId', 'class'], axis=1)
+            X_unknown = unknown_data[loader.feature_columns]
             predictions = best_model.predict(X_unknown)
             
             # Sonuçları analiz et
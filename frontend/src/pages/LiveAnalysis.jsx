@@ -50,6 +50,20 @@ const mlAlgoInfo = {
   }
 };
 
+// Elliptic veri setinde ML modelleri yerine etiket yayılımı sıralaması kullanılır (method parametresi)
+const propagationMethodInfo = {
+  pagerank: {
+    name: "Kişiselleştirilmiş PageRank",
+    desc: "Bilinen illicit işlemlerden başlayan rastgele yürüyüşle şüphe skorunu işlem ağında yayar.",
+    ref: "https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.link_analysis.pagerank_alg.pagerank.html"
+  },
+  label_spreading: {
+    name: "Etiket Yayılımı",
+    desc: "Bilinen licit/illicit etiketlerini komşuluk ilişkileri üzerinden etiketsiz işlemlere yayar.",
+    ref: "https://scikit-learn.org/stable/modules/generated/sklearn.semi_supervised.LabelSpreading.html"
+  }
+};
+
 const featureDescriptions = {
   burstiness: "Burstiness: İşlemlerin zamansal yoğunluğunu gösterir. Yüksekse, adres kısa sürede çok sayıda işlem yapmış demektir.",
   tx_per_day: "Günlük Ortalama İşlem: Adresin günde ortalama kaç işlem yaptığı.",
@@ -74,6 +88,11 @@ const LiveAnalysis = () => {
   const [datasetInfo, setDatasetInfo] = useState(null);
   const [availableDatasets, setAvailableDatasets] = useState([]);
 
+  // Seçici veri setine göre ML algoritmalarını ya da yayılım yöntemlerini listeler
+  const algoInfo = datasetType === 'elliptic' ? propagationMethodInfo : mlAlgoInfo;
+  const algoParam = datasetType === 'elliptic' ? 'method' : 'algo';
+  const selectedAlgo = algoInfo[mlAlgo] ? mlAlgo : Object.keys(algoInfo)[0];
+
   // Function to load available datasets
   useEffect(() => {
     // Get available datasets
@@ -134,7 +153,7 @@ const LiveAnalysis = () => {
       });
       
     // ML anomalies for specific algorithm
-    axios.get(`http://localhost:5000/api/ml-anomalies?algo=${mlAlgo}&dataset_type=${datasetType}&load_data=true`)
+    axios.get(`http://localhost:5000/api/ml-anomalies?${algoParam}=${selectedAlgo}&dataset_type=${datasetType}&load_data=true`)
       .then((res) => {
         setMlAnomalies(res.data.anomalies);
       })
@@ -145,7 +164,7 @@ const LiveAnalysis = () => {
       });
       
     // Feature distributions
-    axios.get(`http://localhost:5000/api/ml-feature-distribution?algo=${mlAlgo}&dataset_type=${datasetType}&load_data=true`)
+    axios.get(`http://localhost:5000/api/ml-feature-distribution?algo=${selectedAlgo}&dataset_type=${datasetType}&load_data=true`)
       .then((res) => {
         setFeatureDist(res.data.features);
       })
@@ -162,7 +181,7 @@ const LiveAnalysis = () => {
   useEffect(() => {
     // Only handle ML algorithm changes if a dataset is already loaded
     if (data && datasetType) {
-      axios.get(`http://localhost:5000/api/ml-anomalies?algo=${mlAlgo}&dataset_type=${datasetType}&load_data=true`)
+      axios.get(`http://localhost:5000/api/ml-anomalies?${algoParam}=${selectedAlgo}&dataset_type=${datasetType}&load_data=true`)
         .then((res) => {
           setMlAnomalies(res.data.anomalies);
         })
@@ -172,7 +191,7 @@ const LiveAnalysis = () => {
           console.error("ML anomali verisi yüklenirken hata:", err);
         });
         
-      axios.get(`http://localhost:5000/api/ml-feature-distribution?algo=${mlAlgo}&dataset_type=${datasetType}&load_data=true`)
+      axios.get(`http://localhost:5000/api/ml-feature-distribution?algo=${selectedAlgo}&dataset_type=${datasetType}&load_data=true`)
         .then((res) => {
           setFeatureDist(res.data.features);
         })
@@ -182,7 +201,7 @@ const LiveAnalysis = () => {
           console.error("Öznitelik dağılımı yüklenirken hata:", err);
         });
     }
-  }, [mlAlgo, data, datasetType]);
+  }, [selectedAlgo, algoParam, data, datasetType]);
 
   if (loading) return <CircularProgress sx={{ display: 'block', mx: 'auto', mt: 4 }} />;
 
@@ -374,20 +393,26 @@ const LiveAnalysis = () => {
           <InputLabel id="ml-algo-label">Algoritma</InputLabel>
           <Select
             labelId="ml-algo-label"
-            value={mlAlgo}
+            value={selectedAlgo}
             label="Algoritma"
             onChange={e => setMlAlgo(e.target.value)}
           >
-            <MenuItem value="isoforest">Isolation Forest</MenuItem>
-            <MenuItem value="dbscan">DBSCAN</MenuItem>
-            <MenuItem value="lof">Local Outlier Factor</MenuItem>
-            <MenuItem value="ocsvm">One-Class SVM</MenuItem>
+            {datasetType === 'elliptic' ? (
+              Object.entries(propagationMethodInfo).map(([id, info]) => (
+                <MenuItem key={id} value={id}>{info.name}</MenuItem>
+              ))
+            ) : [
+              <MenuItem key="isoforest" value="isoforest">Isolation Forest</MenuItem>,
+              <MenuItem key="dbscan" value="dbscan">DBSCAN</MenuItem>,
+              <MenuItem key="lof" value="lof">Local Outlier Factor</MenuItem>,
+              <MenuItem key="ocsvm" value="ocsvm">One-Class SVM</MenuItem>
+            ]}
           </Select>
         </FormControl>
         <Box mb={2}>
-          <Typography variant="subtitle1" color="primary"><b>{mlAlgoInfo[mlAlgo].name}</b></Typography>
-          <Typography variant="body2" color="textSecondary">{mlAlgoInfo[mlAlgo].desc}</Typography>
-          <Typography variant="caption">Kaynak: <a href={mlAlgoInfo[mlAlgo].ref} target="_blank" rel="noopener noreferrer">{mlAlgoInfo[mlAlgo].ref}</a></Typography>
+          <Typography variant="subtitle1" color="primary"><b>{algoInfo[selectedAlgo].name}</b></Typography>
+          <Typography variant="body2" color="textSecondary">{algoInfo[selectedAlgo].desc}</Typography>
+          <Typography variant="caption">Kaynak: <a href={algoInfo[selectedAlgo].ref} target="_blank" rel="noopener noreferrer">{algoInfo[selectedAlgo].ref}</a></Typography>
         </Box>
         {mlAnomalyError && <Alert severity="error">{mlAnomalyError}</Alert>}
         {mlAnomalies && mlAnomalies.length > 0 ? (
@@ -522,7 +547,7 @@ const LiveAnalysis = () => {
                       <TableRow key={i}>
                         <TableCell>{addr}</TableCell>
                         <TableCell align="right">{algos.length}</TableCell>
-                        <TableCell>{algos.map(a => mlAlgoInfo[a]?.name || a).join(', ')}</TableCell>
+                        <TableCell>{algos.map(a => algoInfo[a]?.name || a).join(', ')}</TableCell>
                       </TableRow>
                     )) : (
                       <TableRow><TableCell colSpan={3}>Ortak anomali bulunamadı.</TableCell></TableRow>